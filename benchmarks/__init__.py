@@ -0,0 +1,3 @@
+#!/usr/bin/env python3
+# benchmarks/__init__.py
+"""Throughput and latency benchmarks; run with ``python -m benchmarks.run``."""
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# benchmarks/corpora.py
+"""Fixed benchmark corpora.
+
+Each corpus is a list of records; a record is the list of lines one
+contact was pasted as. The corpora are built from literals (no randomness),
+so every run and every machine measures the same input.
+"""
+
+from typing import Dict, List
+
+Record = List[str]
+
+SHORT: List[Record] = [
+    ["jane@acme.com"],
+    ["Jane Smith"],
+    ["415-555-1234"],
+    ["https://acme.com"],
+    ["CEO"],
+    ["Jane Smith <jane@acme.com>"],
+    ["John Doe", "john@startup.io"],
+    ["+44 20 7946 0958"],
+]
+
+TYPICAL: List[Record] = [
+    ["Jane Smith", "CEO, Acme Corp", "jane@acme.com", "415-555-1234", "https://acme.com"],
+    ["John Doe | VP of Sales | Startup Inc | john@startup.io | (212) 555-0142"],
+    ["Mary-Kate O'Neil", "Senior Software Engineer", "Globex Corporation",
+     "M: +1 516 776 3192", "mk@globex.com", "https://linkedin.com/in/mkoneil"],
+    ["Dr. Alan Turing <alan@example.ai>", "Head of Research", "Example AI"],
+    ["Li Wei", "Product Manager • Initech", "li.wei@initech.co.uk", "Tel: +44 20 7946 0958"],
+    ["Ana María López (she/her)", "Co-founder & CEO — R&J Rivers Services, LLC",
+     "ana@rjrivers.com", "Office: 212.555.0142", "Mobile: 415.555.0199", "www.rjrivers.com"],
+    ["Jamie Rivers", "jamie.rivers@gmail.com", "4155555555"],
+    ["Best regards,", "", "Sam Lee", "Director of Engineering", "Acme Widgets International Inc",
+     "sam.lee@acme-widgets.com", "https://acme-widgets.com"],
+]
+
+# Long, noisy or adversarial inputs: the records where a regex or a
+# quadratic loop would show up first.
+PATHOLOGICAL: List[Record] = [
+    [" ".join(["word"] * 2000)],
+    [" | ".join(f"Item {number}" for number in range(400))],
+    ["1 2 3 4 5 6 7 8 9 0 " * 100],
+    ["a" * 5000 + "@" + "b" * 5000],
+    ["x." * 2000 + "@example.com"],
+    ["https://" + "a/" * 2000],
+    ["'\"'\"'\"Jane Smith\"'\"'\"'"],
+    [f"Line {number}: Jane Smith, CEO, Acme Corp, 415-555-{number:04d}" for number in range(200)],
+    ["> " * 50 + "On Mon, Jane Smith <jane@acme.com> wrote:"] * 50
+    + ["--", "Jane Smith", "CEO", "jane@acme.com"],
+    ["Confidentiality notice: this message may contain privileged information intended only for "
+     "the recipient. " * 40, "Jane Smith", "jane@acme.com"],
+]
+
+CORPORA: Dict[str, List[Record]] = {
+    "short": SHORT,
+    "typical": TYPICAL,
+    "pathological": PATHOLOGICAL,
+}
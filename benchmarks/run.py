@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# benchmarks/run.py
+"""Benchmark jodie's parsers and signature preprocessing.
+
+Measures records/sec and p50/p99 latency per record for each benchmark
+over the fixed corpora in benchmarks/corpora.py. The parse cache is
+turned off so every call does the full parse.
+
+Usage:
+    benchmarks.run [options]
+
+Options:
+    --only=NAMES                Comma-separated benchmark names or prefixes to run.
+    --min-time=SECONDS          Minimum time spent measuring each benchmark [default: 0.5].
+    --output=FILE               Write results as JSON to FILE (- for stdout).
+    --compare=FILE              Compare against results saved earlier with --output.
+    --max-regression=PERCENT    Fail when records/sec drops more than this [default: 10].
+    -h --help                   Show this screen.
+
+Examples:
+    python -m benchmarks.run --output benchmarks/baseline.json
+    python -m benchmarks.run --compare benchmarks/baseline.json
+"""
+
+import json
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from docopt import docopt
+
+from benchmarks.corpora import CORPORA, Record
+
+SCHEMA_VERSION = 1
+
+Benchmark = Tuple[Callable[[Any], Any], List[Any]]
+
+
+def benchmarks() -> Dict[str, Benchmark]:
+    """Every benchmark, as name -> (function, inputs).
+
+    Record-level benchmarks take one record per call; parser classes take
+    one line per call, so their records/sec counts lines.
+    """
+    from jodie.input.signature import SignaturePreprocessor
+    from jodie.parsers import (EmailParser, NameParser, ParserPipeline, PhoneParser, TitleParser,
+                               WebsiteParser, parse_contact_fields)
+
+    targets: List[Tuple[str, Callable[[Any], Any], Callable[[Record], List[Any]]]] = [
+        ("parse_contact_fields", parse_contact_fields, lambda record: [record]),
+        ("ParserPipeline.parse", ParserPipeline.parse, lambda record: [record]),
+        ("SignaturePreprocessor.preprocess", SignaturePreprocessor.preprocess,
+         lambda record: ["\n".join(record)]),
+    ]
+    for parser in (EmailParser, PhoneParser, WebsiteParser, NameParser, TitleParser):
+        targets.append((f"{parser.__name__}.parse", parser.parse, lambda record: [line for line in record if line]))
+
+    return {
+        f"{target}/{corpus}": (func, [item for record in records for item in inputs(record)])
+        for target, func, inputs in targets
+        for corpus, records in CORPORA.items()
+    }
+
+
+def measure(func: Callable[[Any], Any], inputs: Sequence[Any], min_time: float) -> Dict[str, float]:
+    """Time ``func`` over ``inputs`` in full passes until ``min_time`` has elapsed.
+
+    Args:
+        func: Function under test, called with one input at a time
+        inputs: Inputs for one pass
+        min_time: Seconds of measured calls to collect, at least one pass
+
+    Returns:
+        Number of calls, records/sec and p50/p99 latency in microseconds
+    """
+    for item in inputs:  # warm-up: lexicons, regex and name caches
+        func(item)
+
+    clock = time.perf_counter_ns
+    timings: List[int] = []
+    total = 0
+    while not timings or total < min_time * 1e9:
+        for item in inputs:
+            start = clock()
+            func(item)
+            elapsed = clock() - start
+            timings.append(elapsed)
+            total += elapsed
+
+    timings.sort()
+    return {
+        "records": len(timings),
+        "records_per_sec": len(timings) / (total / 1e9),
+        "p50_us": _percentile(timings, 0.50) / 1e3,
+        "p99_us": _percentile(timings, 0.99) / 1e3,
+    }
+
+
+def run(only: Optional[Sequence[str]] = None, min_time: float = 0.5) -> Dict[str, Any]:
+    """Run the selected benchmarks.
+
+    Args:
+        only: Benchmark names or name prefixes; None runs everything
+        min_time: Seconds spent measuring each benchmark
+
+    Returns:
+        JSON-serializable results with the environment they were measured in
+    """
+    from jodie.cli.__doc__ import __version__
+    from jodie.parsers.cache import configure_cache
+
+    configure_cache({"cache": {"enabled": False}})
+    try:
+        results = {
+            name: measure(func, inputs, min_time)
+            for name, (func, inputs) in benchmarks().items()
+            if not only or any(name.startswith(prefix) for prefix in only)
+        }
+    finally:
+        configure_cache()
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "jodie": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "min_time": min_time,
+        "results": results,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[str]:
+    """Benchmarks whose throughput dropped more than ``max_regression``.
+
+    Args:
+        results: Output of ``run``
+        baseline: Earlier output of ``run``
+        max_regression: Allowed fractional drop in records/sec, e.g. 0.1
+
+    Returns:
+        One message per regressed benchmark; empty when none regressed
+    """
+    regressions = []
+    for name, result in results["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if not before:
+            continue
+        change = result["records_per_sec"] / before["records_per_sec"] - 1
+        if change < -max_regression:
+            regressions.append(f"{name}: {before['records_per_sec']:,.0f} -> "
+                               f"{result['records_per_sec']:,.0f} records/sec ({change:+.1%})")
+    return regressions
+
+
+def format_table(results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> str:
+    """Human-readable table of results, with the change against a baseline."""
+    rows = [f"{'benchmark':<48} {'records/s':>12} {'p50 us':>10} {'p99 us':>10}"
+            + (f" {'change':>8}" if baseline else "")]
+    for name, result in results["results"].items():
+        row = (f"{name:<48} {result['records_per_sec']:>12,.0f} "
+               f"{result['p50_us']:>10.1f} {result['p99_us']:>10.1f}")
+        before = (baseline or {}).get("results", {}).get(name)
+        if before:
+            row += f" {result['records_per_sec'] / before['records_per_sec'] - 1:>+8.1%}"
+        rows.append(row)
+    return "\n".join(rows)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = docopt(__doc__, argv=argv)
+    only = [name.strip() for name in args['--only'].split(',')] if args['--only'] else None
+    results = run(only, float(args['--min-time']))
+
+    baseline = None
+    if args['--compare']:
+        with open(args['--compare'], encoding='utf-8') as handle:
+            baseline = json.load(handle)
+
+    report = sys.stderr if args['--output'] == '-' else sys.stdout
+    report.write(format_table(results, baseline) + "\n")
+
+    if args['--output'] == '-':
+        sys.stdout.write(json.dumps(results, indent=2) + "\n")
+    elif args['--output']:
+        with open(args['--output'], 'w', encoding='utf-8') as handle:
+            json.dump(results, handle, indent=2)
+            handle.write("\n")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, float(args['--max-regression']) / 100)
+        if regressions:
+            report.write("\nThroughput regressed:\n" + "\n".join(f"  {line}" for line in regressions) + "\n")
+            return 1
+    return 0
+
+
+def _percentile(sorted_values: Sequence[int], fraction: float) -> float:
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return float(sorted_values[index])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
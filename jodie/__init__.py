@@ -1,5 +1,22 @@
 #!/usr/bin/env python3
 # jodie/__init__.py
+#
+# ``jodie.contact`` (PyObjC) and ``jodie.parsers`` load on first attribute
+# access (PEP 562), so importing the package, --help, --version and
+# parsing-only use never pay for the Contacts framework bridge.
+
+from importlib import import_module
 
-from jodie import contact, parsers
 from jodie.cli.__doc__ import __version__, __description__, __url__, __doc__
+
+_LAZY_SUBMODULES = ("contact", "parsers")
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return import_module(f"jodie.{name}")
+    raise AttributeError(f"module 'jodie' has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES))
@@ -0,0 +1,3 @@
+#!/usr/bin/env python3
+# jodie/bench/__init__.py
+"""Tools for measuring jodie: synthetic corpora with ground truth."""
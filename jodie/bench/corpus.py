@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# jodie/bench/corpus.py
+"""Synthetic email signature corpus with ground truth.
+
+Generates realistic signature blocks (varied layouts, separators, pronouns,
+compound titles, phone formats, webmail and corporate addresses, quoted
+reply noise) together with the field values a correct parse should find.
+Output is deterministic for a given seed, and a longer run with the same
+seed starts with the records of a shorter one.
+
+Usage:
+    jodie.bench.corpus [COUNT] [--seed=N] [--output=FILE]
+
+Arguments:
+    COUNT                   Number of records to generate [default: 1000].
+
+Options:
+    --seed=N                Random seed [default: 0].
+    --output=FILE           Write JSONL to FILE instead of stdout.
+    -h --help               Show this screen.
+
+Each line is a JSON object: {"id", "layout", "text", "expected"}, where
+expected holds first_name, last_name, email, phone, job_title, company and
+websites (None or [] when the field isn't in the text).
+"""
+
+import json
+import random
+import sys
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from jodie.constants import WEBMAIL_DOMAINS
+from jodie.parsers.parsers import TitleParser
+
+FIRST_NAMES = (
+    "Jane", "John", "Maria", "Wei", "Priya", "Ahmed", "Olivia", "Liam", "Sofia", "Noah",
+    "Aisha", "Lucas", "Chen", "Fatima", "Mateo", "Emma", "Kenji", "Zara", "Diego", "Hannah",
+    "José", "Zoë", "Björn", "Anne-Marie", "Jean-Luc", "Siobhan", "Oluwaseun", "Mei", "Ravi", "Ingrid",
+)
+LAST_NAMES = (
+    "Smith", "Johnson", "Garcia", "Chen", "Patel", "Khan", "Williams", "Brown", "Rossi", "Müller",
+    "Nguyen", "Kim", "Silva", "Cohen", "Novak", "Okafor", "Larsen", "Tanaka", "Martínez", "Dubois",
+    "O'Brien", "McDonald", "Smith-Jones", "García-López", "Fitzgerald", "Ivanova", "Haddad", "Singh",
+)
+COMPANY_WORDS = (
+    "Acme", "Globex", "Initech", "Umbrella", "Stark", "Wayne", "Hooli", "Vandelay", "Cyberdyne", "Soylent",
+    "Northwind", "Contoso", "Tyrell", "Aperture", "Blue Harbor", "Red Rock", "Silver Lake", "Bright Path",
+)
+COMPANY_KINDS = ("", "Labs", "Systems", "Technologies", "Ventures", "Partners", "Studio", "Group", "Capital")
+COMPANY_SUFFIXES = ("", "Inc", "Inc.", "LLC", "Ltd", "Corp", "Co.")
+CORPORATE_TLDS = ("com", "io", "co", "ai", "dev", "co.uk", "de")
+DEPARTMENTS = ("Engineering", "Sales", "Marketing", "Product", "Operations", "Growth", "Partnerships", "Design")
+PRONOUNS = ("she/her", "he/him", "they/them", "she/they", "he/they")
+SIGN_OFFS = ("Best,", "Thanks,", "Best regards,", "Cheers,", "Regards,", "Kind regards,", "--")
+
+# Separators placed between fields on one line
+INLINE_SEPARATORS = (" • ", " | ", " — ", " · ", ", ")
+
+# Single-word titles for compounds like "Senior Engineer"; multi-word
+# titles and phrases like "business development" are used as is.
+_TITLES = sorted(TitleParser.COMMON_TITLES)
+_BASE_TITLES = [title for title in _TITLES
+                if title not in {"head", "lead", "principal", "associate", "sales", "marketing"}]
+_PREFIXES = sorted(prefix for prefix in TitleParser.PREFIXES if "-" not in prefix)
+_WEBMAIL = sorted(domain for domain in WEBMAIL_DOMAINS if domain.count(".") == 1)
+
+# (format, expected value) builders for phone numbers; NANP numbers are
+# expected as 10 national digits, others in E.164, as jodie returns them.
+_NANP_FORMATS = (
+    "{a}-{b}-{c}", "({a}) {b}-{c}", "{a}.{b}.{c}", "+1 {a} {b} {c}", "+1-{a}-{b}-{c}",
+    "1-{a}-{b}-{c}", "+1 ({a}) {b}-{c}", "{a} {b} {c}",
+)
+_INTERNATIONAL = (
+    ("+44 20 {b4} {c}", "+4420{b4}{c}"),
+    ("+44 (0)20 {b4} {c}", "+4420{b4}{c}"),
+    ("+49 30 {b}{c}", "+4930{b}{c}"),
+    ("+33 1 {p1} {p2} {p3} {p4}", "+331{p1}{p2}{p3}{p4}"),
+    ("+61 2 {b4} {c}", "+612{b4}{c}"),
+)
+_PHONE_LABELS = ("", "", "M: ", "Mobile: ", "Tel: ", "Office: ", "Cell: ", "T: ", "Phone: ")
+
+LAYOUTS = ("stacked", "mailbox", "inline", "title_company", "compact")
+
+
+def generate(count: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """Yield ``count`` signature records.
+
+    Args:
+        count: Number of records
+        seed: Random seed; the same seed always yields the same records
+
+    Yields:
+        {"id", "layout", "text", "expected"} dicts
+    """
+    rng = random.Random(seed)
+    for index in range(count):
+        yield _record(rng, index)
+
+
+def write_jsonl(records: Iterator[Dict[str, Any]], output: TextIO) -> int:
+    """Write records as JSON lines; returns how many were written."""
+    written = 0
+    for record in records:
+        output.write(json.dumps(record, ensure_ascii=False))
+        output.write("\n")
+        written += 1
+    return written
+
+
+def _record(rng: random.Random, index: int) -> Dict[str, Any]:
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    company, domain = _company(rng)
+    title = _title(rng)
+    webmail = rng.random() < 0.25
+    email = f"{_local_part(rng, first, last)}@{rng.choice(_WEBMAIL) if webmail else domain}"
+    phone_text, phone = _phone(rng) if rng.random() < 0.8 else ("", None)
+    websites = []
+    if not webmail and rng.random() < 0.5:
+        websites.append(rng.choice((f"https://{domain}", f"https://www.{domain}", f"www.{domain}")))
+    if rng.random() < 0.2:
+        websites.append(f"https://linkedin.com/in/{_ascii(first + last).lower()}")
+    show_company = rng.random() < 0.85
+    show_title = rng.random() < 0.9
+
+    name = f"{first} {last}"
+    if rng.random() < 0.15:
+        name += f" ({rng.choice(PRONOUNS)})"
+
+    layout = rng.choice(LAYOUTS)
+    lines = _layout(rng, layout, name, email, phone_text, title if show_title else None,
+                    company if show_company else None, websites)
+    if rng.random() < 0.3:
+        lines.insert(0, rng.choice(SIGN_OFFS))
+    if rng.random() < 0.15:
+        lines += _quoted_reply(rng)
+
+    return {
+        "id": index,
+        "layout": layout,
+        "text": "\n".join(lines),
+        "expected": {
+            "first_name": first,
+            "last_name": last,
+            "email": email,
+            "phone": phone,
+            "job_title": title if show_title else None,
+            "company": company if show_company else None,
+            "websites": websites,
+        },
+    }
+
+
+def _layout(rng: random.Random, layout: str, name: str, email: str, phone: str,
+            title: Optional[str], company: Optional[str], websites: List[str]) -> List[str]:
+    sep = rng.choice(INLINE_SEPARATORS)
+    contact = [part for part in (email, phone) if part]
+    if layout == "mailbox":
+        lines = [f"{name} <{email}>"] + [part for part in (title, company, phone) if part]
+    elif layout == "inline":
+        lines = [sep.join(part for part in (name, title, company) if part), sep.join(contact)]
+    elif layout == "title_company":
+        role = f"{title}, {company}" if title and company else (title or company)
+        lines = [name] + ([role] if role else []) + contact
+    elif layout == "compact":
+        lines = [sep.join(part for part in (name, title, company, *contact) if part)]
+    else:
+        lines = [part for part in (name, title, company, email, phone) if part]
+    return lines + websites
+
+
+def _company(rng: random.Random) -> Tuple[str, str]:
+    base = rng.choice(COMPANY_WORDS)
+    words = [base, rng.choice(COMPANY_KINDS), rng.choice(COMPANY_SUFFIXES)]
+    company = " ".join(word for word in words if word)
+    domain = f"{_ascii(base).lower().replace(' ', '')}.{rng.choice(CORPORATE_TLDS)}"
+    return company, domain
+
+
+def _title(rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.15:
+        return f"{rng.choice(('VP', 'Head', 'Director'))} of {rng.choice(DEPARTMENTS)}"
+    if roll < 0.25:
+        return f"Co-founder & {rng.choice(('CEO', 'CTO', 'COO'))}"
+    title = rng.choice(_BASE_TITLES)
+    if roll < 0.55 and " " not in title and title.upper() not in TitleParser.ACRONYMS:
+        title = f"{rng.choice(_PREFIXES)} {title}"
+    return " ".join(word.upper() if word.upper() in TitleParser.ACRONYMS else word.capitalize()
+                    for word in title.split())
+
+
+def _phone(rng: random.Random) -> Tuple[str, str]:
+    label = rng.choice(_PHONE_LABELS)
+    if rng.random() < 0.8:
+        a = f"{rng.randint(2, 9)}{rng.randint(0, 9)}{rng.randint(0, 9)}"
+        b = f"{rng.randint(2, 9)}{rng.randint(0, 9)}{rng.randint(0, 9)}"
+        c = f"{rng.randint(0, 9999):04d}"
+        return label + rng.choice(_NANP_FORMATS).format(a=a, b=b, c=c), a + b + c
+    text, value = rng.choice(_INTERNATIONAL)
+    digits = {"b": f"{rng.randint(200, 999)}", "b4": f"{rng.randint(2000, 9999)}",
+              "c": f"{rng.randint(0, 9999):04d}",
+              **{f"p{n}": f"{rng.randint(10, 99)}" for n in range(1, 5)}}
+    return label + text.format(**digits), value.format(**digits)
+
+
+def _local_part(rng: random.Random, first: str, last: str) -> str:
+    first, last = _ascii(first).lower(), _ascii(last).lower()
+    return rng.choice((f"{first}.{last}", f"{first[0]}{last}", first, f"{first}_{last}", f"{first}{last[0]}"))
+
+
+def _quoted_reply(rng: random.Random) -> List[str]:
+    sender = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    # Top-posted reply: the quoted message follows the signature
+    return [
+        "",
+        f"On Mon, Mar {rng.randint(1, 28)}, 2025 at 9:{rng.randint(10, 59)} AM {sender} <someone@example.com> wrote:",
+        "> Can you send over the latest numbers?",
+        f"> {sender}",
+    ]
+
+
+def _ascii(text: str) -> str:
+    replacements = {"é": "e", "ë": "e", "ö": "o", "ü": "u", "á": "a", "í": "i", "ó": "o", "ñ": "n"}
+    cleaned = "".join(replacements.get(char, char) for char in text.lower())
+    return "".join(char for char in cleaned if char.isascii() and (char.isalnum() or char == " "))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from docopt import docopt
+
+    args = docopt(__doc__, argv=argv)
+    count = int(args['COUNT'] or 1000)
+    records = generate(count, int(args['--seed']))
+    if args['--output']:
+        with open(args['--output'], 'w', encoding='utf-8') as output:
+            write_jsonl(records, output)
+    else:
+        write_jsonl(records, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
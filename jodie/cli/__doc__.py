@@ -8,6 +8,9 @@ Usage:
     jodie new --paste [options]
     jodie new --stdin [options]
     jodie new --explicit EMAIL NAME [COMPANY] [TITLE] [options]
+    jodie import FILE [options]
+    jodie harvest PATH [options]
+    jodie serve [options]
 
 Arguments:
     TEXT                                Contact text to parse automatically.
@@ -15,11 +18,14 @@ Arguments:
     NAME                                Full name for explicit positional mode.
     COMPANY                             Company name for explicit positional mode.
     TITLE                               Job title for explicit positional mode.
+    FILE                                CSV, TSV or JSONL file to import (- for stdin).
+    PATH                                mbox file or Maildir directory to harvest.
 
 Input Modes:
     --paste                             Read contact text from clipboard.
     --stdin                             Read contact text from stdin.
     --explicit                          Use positional fields: EMAIL NAME [COMPANY] [TITLE].
+    --many                              Add every person found in the text (with TEXT, --paste or --stdin).
     -A --auto                           Force automatic parsing. Default for TEXT input.
 
 Contact Fields:
@@ -39,8 +45,23 @@ Contact Fields:
     --website=WEBSITES                  Website URLs (alias for --websites).
     --linkedin=URL                      LinkedIn profile URL (auto-labeled as LinkedIn).
 
+Import:
+    --format=FORMAT                     File format: csv, tsv or jsonl (default: from extension).
+    --columns=MAP                       Map columns to fields, e.g. "Mail=email,Who=full_name".
+    --batch-size=N                      Contacts saved per batch [default: 100].
+    --workers=N                         Parser processes for free-text rows or --many blocks [default: 1].
+    --duplicates=POLICY                 Contacts already saved: keep, skip or merge (default: keep).
+
+Harvest:
+    --seen=FILE                         File recording harvested Message-IDs (default: user cache dir).
+
+Daemon:
+    --socket=PATH                       Unix socket for jodie serve (default: user cache dir).
+
 Output:
     -D --dry-run                        Preview parsed fields without saving.
+    --profile                           Print time spent per parse stage to stderr.
+    --metrics=FILE                      Write OpenMetrics counters and latencies to FILE.
 
 General:
     -H --help                           Show this screen.
@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 # jodie/cli/__main__.py
 import sys
-from docopt import docopt
-from nameparser import HumanName
 import jodie
 from jodie.cli.__doc__ import __version__, __description__, __url__, __doc__
+from jodie.cli.client import forward, should_forward
 
-COMMANDS = ('new',)
-UTILITY_FLAGS = ('--auto', '--explicit', '--help', '--version', '--dry-run', '--paste', '--stdin')
+COMMANDS = ('new', 'import', 'harvest', 'serve')
+UTILITY_FLAGS = ('--auto', '--explicit', '--help', '--version', '--dry-run', '--paste', '--stdin',
+                 '--format', '--columns', '--batch-size', '--workers', '--seen', '--many', '--profile',
+                 '--metrics', '--socket', '--duplicates')
 
 def detect_argument_mode(args):
     """
@@ -37,10 +38,72 @@ def parse_auto(arguments):
     return jodie.parsers.parse_contact_fields(arguments)
 
 
-def main():
-    first, last, email, phone, title, company, websites, note = (None,) * 8
+def _start_profiling():
+    import atexit
+    from jodie import profiling
 
-    args = docopt(__doc__, version=__version__)
+    profiling.enable()
+    atexit.register(lambda: sys.stderr.write("\n" + profiling.format_stats() + "\n"))
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if should_forward(argv):
+        # A running `jodie serve` answers without paying for startup here.
+        status = forward(argv)
+        if status is not None:
+            sys.exit(status)
+
+    from docopt import docopt
+    args = docopt(__doc__, argv=argv, version=__version__)
+    if args.get('--profile'):
+        _start_profiling()
+    configure(args)
+
+    if args.get('serve'):
+        from jodie.cli.serve import run_serve
+        sys.exit(run_serve(args))
+    run(args)
+
+
+def configure(args):
+    """Load .jodierc and install its settings for this process."""
+    from jodie.config import load_config
+    from jodie.contact.backend import configure_storage
+    from jodie.metrics import configure_metrics
+    from jodie.parsers.cache import configure_cache
+    from jodie.parsers.inference import configure_inference
+    from jodie.parsers.registry import configure_stages
+    config = load_config()
+    configure_metrics(config, args.get('--metrics'))
+    configure_cache(config)
+    configure_inference(config)
+    configure_stages(config)
+    configure_storage(config)
+
+
+def run(args, backend=None):
+    """Run a parsed command line; exits with the command's status.
+
+    Args:
+        args: docopt arguments
+        backend: Storage backend to save into (the daemon's long-lived
+                 one); the configured backend is opened when omitted
+    """
+    first, last, email, phone, phones, title, company, websites, note = (None,) * 9
+    parsed_input = None
+
+    if args.get('import'):
+        from jodie.cli.importer import run_import
+        sys.exit(run_import(args))
+
+    if args.get('harvest'):
+        from jodie.cli.harvest import run_harvest
+        sys.exit(run_harvest(args))
+
+    if args.get('--many'):
+        from jodie.cli.many import run_many
+        sys.exit(run_many(args, backend=backend))
 
     # Handle --paste: read from clipboard and parse
     if args.get('--paste'):
@@ -48,13 +111,14 @@ def main():
         text = read_clipboard()
         preprocessed = SignaturePreprocessor.preprocess(text)
         fields = parse_auto(preprocessed)
+        parsed_input = preprocessed
         if fields:
             if fields.get('first_name'):
-                human_name = HumanName(f"{fields['first_name']} {fields['last_name']}".strip())
-                if human_name:
-                    first, last = human_name.first, human_name.last
+                first, last = jodie.parsers.NameParser.first_last(
+                    f"{fields['first_name']} {fields['last_name'] or ''}")
             email = fields.get('email')
             phone = fields.get('phone')
+            phones = fields.get('phones')
             title = fields.get('job_title')
             company = fields.get('company')
             websites = fields.get('websites')
@@ -67,13 +131,14 @@ def main():
         text = read_stdin()
         preprocessed = SignaturePreprocessor.preprocess(text)
         fields = parse_auto(preprocessed)
+        parsed_input = preprocessed
         if fields:
             if fields.get('first_name'):
-                human_name = HumanName(f"{fields['first_name']} {fields['last_name']}".strip())
-                if human_name:
-                    first, last = human_name.first, human_name.last
+                first, last = jodie.parsers.NameParser.first_last(
+                    f"{fields['first_name']} {fields['last_name'] or ''}")
             email = fields.get('email')
             phone = fields.get('phone')
+            phones = fields.get('phones')
             title = fields.get('job_title')
             company = fields.get('company')
             websites = fields.get('websites')
@@ -86,14 +151,15 @@ def main():
 
         if mode == "auto":
             fields = parse_auto(args['TEXT'])
+            parsed_input = args['TEXT']
             if fields:
                 if fields.get('first_name'):
-                    human_name = HumanName(f"{fields['first_name']} {fields['last_name']}".strip())
-                    if human_name:
-                        first, last = human_name.first, human_name.last
+                    first, last = jodie.parsers.NameParser.first_last(
+                        f"{fields['first_name']} {fields['last_name'] or ''}")
 
                 email = fields.get('email')
                 phone = fields.get('phone')
+                phones = fields.get('phones')
                 title = fields.get('job_title')
                 company = fields.get('company')
                 websites = fields.get('websites')
@@ -148,7 +214,7 @@ def main():
 
     # Handle dry-run preview
     if args.get('--dry-run'):
-        from jodie.cli.preview import format_preview
+        from jodie.cli.preview import format_preview, with_sources
         fields = {
             'first_name': first,
             'last_name': last,
@@ -159,25 +225,43 @@ def main():
             'websites': websites,
             'note': note
         }
+        if parsed_input is not None:
+            fields = with_sources(fields, jodie.parsers.ParserPipeline.parse(parsed_input))
         preview = format_preview(fields)
         sys.stdout.write(preview + "\n")
         sys.exit(0)
 
-    c = jodie.contact.Contact(
-        first_name=first,
-        last_name=last,
-        email=email,
-        phone=phone,
-        job_title=title,
-        company=company,
-        websites=websites,
-        note=note
-    )
-
-    sys.stdout.write(f'Saving...\n{c}\n')
-    status = 0 if c.save() else 1
-    sys.exit(status)
+    from jodie.contact.backend import MERGE, duplicate_policy, open_backend
+    from jodie.contact.record import format_record, normalize_record
+    fields = {
+        'first_name': first,
+        'last_name': last,
+        'email': email,
+        'phone': phone,
+        'job_title': title,
+        'company': company,
+        'websites': websites,
+        'note': note,
+        'phones': phones
+    }
 
+    sys.stdout.write(f'Saving...\n{format_record(normalize_record(fields))}\n')
+    try:
+        policy = duplicate_policy(args.get('--duplicates'))
+        if backend is None:
+            backend = open_backend()
+        report = backend.save_many([fields], duplicates=policy)
+    except Exception as e:
+        sys.stderr.write(f"Error: {e}\n")
+        sys.exit(1)
+    errors = list(report.invalid.values()) + [failure.error for failure in report.failed]
+    if errors:
+        sys.stderr.write(f"Error: {errors[0]}\n")
+        sys.exit(1)
+    if report.duplicates:
+        action = "merged into" if policy == MERGE else "skipped, already saved as"
+        sys.stdout.write(f"Duplicate: {action} {report.duplicates[0]}\n")
+    sys.exit(0)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# jodie/cli/client.py
+"""Forward ``jodie new`` to a running ``jodie serve`` daemon.
+
+Only the standard library is imported here, so a forwarded command never
+pays for docopt, the parsers or PyObjC. Requests and responses are single
+lines of JSON over the daemon's Unix socket:
+
+    {"argv": [...], "stdin": "..." or null}
+    {"status": 0, "stdout": "...", "stderr": "..."}
+"""
+
+import json
+import os
+import socket
+import sys
+from typing import Any, Dict, List, Optional
+
+SOCKET_ENV = "JODIE_SOCKET"
+SOCKET_FILE = "serve.sock"
+
+# Seconds to wait for the daemon's answer; a save may wait on the
+# Contacts permission prompt.
+RESPONSE_TIMEOUT = 120
+
+# Options that only make sense in the process they're given to
+LOCAL_FLAGS = ('--profile', '--metrics', '--socket')
+
+
+def socket_path() -> str:
+    """Where ``jodie serve`` listens: $JODIE_SOCKET, else the user cache dir."""
+    if os.environ.get(SOCKET_ENV):
+        return os.environ[SOCKET_ENV]
+    from jodie.config import cache_dir
+    return str(cache_dir() / SOCKET_FILE)
+
+
+def should_forward(argv: List[str]) -> bool:
+    """True for ``jodie new`` command lines the daemon can run."""
+    if not argv or argv[0] != 'new':
+        return False
+    if any(arg.split('=', 1)[0] in LOCAL_FLAGS for arg in argv):
+        return False
+    # Leave "no input on stdin" errors to the local command.
+    return '--stdin' not in argv or not sys.stdin.isatty()
+
+
+def forward(argv: List[str], path: Optional[str] = None) -> Optional[int]:
+    """Run a command line in the daemon and relay its output.
+
+    Args:
+        argv: Command line arguments, without the program name
+        path: Daemon socket; defaults to ``socket_path()``
+
+    Returns:
+        The command's exit status, or None if no daemon is listening (the
+        caller then runs the command itself)
+    """
+    path = path or socket_path()
+    if not os.path.exists(path):
+        return None
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(path)
+    except OSError:
+        # Stale socket left by a daemon that didn't shut down cleanly
+        connection.close()
+        return None
+
+    request: Dict[str, Any] = {"argv": argv, "stdin": sys.stdin.read() if '--stdin' in argv else None}
+    try:
+        with connection:
+            connection.settimeout(RESPONSE_TIMEOUT)
+            connection.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with connection.makefile("rb") as replies:
+                response = json.loads(replies.readline() or b"null")
+    except (OSError, ValueError) as e:
+        # The request may already have been acted on; don't run it twice.
+        sys.stderr.write(f"Error: jodie serve at {path} did not answer: {e}\n")
+        return 1
+    if not isinstance(response, dict):
+        sys.stderr.write(f"Error: jodie serve at {path} closed the connection\n")
+        return 1
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return int(response.get("status", 1))
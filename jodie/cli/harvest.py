@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# jodie/cli/harvest.py
+"""Harvest contacts from email signatures in an mbox file or Maildir."""
+
+import sys
+from email.utils import parseaddr
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from jodie import metrics
+from jodie.config import cache_dir
+from jodie.input.mailbox import HarvestedMessage, SeenMessages, iter_mailbox
+from jodie.input.signature import SignaturePreprocessor
+from jodie.parsers import EmailParser, NameParser, parse_contact_fields
+from jodie.cli.importer import (CONTACT_FIELDS, contact_fields_from_parsed, format_duplicates,
+                                format_row, missing_required, write_batch)
+from jodie.contact.backend import duplicate_policy
+
+SEEN_FILE = "harvested-message-ids"
+
+
+def default_seen_path() -> Path:
+    """Where processed Message-IDs are recorded unless --seen is given."""
+    return cache_dir() / SEEN_FILE
+
+
+def contact_from_message(message: HarvestedMessage) -> Dict[str, Any]:
+    """Parse a message's signature, falling back to its From header.
+
+    Returns:
+        Contact keyword arguments
+    """
+    display_name, address = parseaddr(message.sender or '')
+    lines = SignaturePreprocessor.preprocess(message.signature)
+    if lines:
+        fields = contact_fields_from_parsed(parse_contact_fields(lines))
+    else:
+        fields = {name: None for name in CONTACT_FIELDS}
+
+    if not fields['email'] and address:
+        fields['email'] = EmailParser.parse(address)
+    if not fields['first_name'] and display_name and '@' not in display_name:
+        first, last = NameParser.parse(display_name)
+        fields['first_name'], fields['last_name'] = first or None, last or None
+    return fields
+
+
+def harvest_contacts(messages: Iterable[HarvestedMessage],
+                     seen: Optional[SeenMessages] = None,
+                     batch_size: int = 100
+                     ) -> Iterator[List[Tuple[str, Optional[Dict[str, Any]], List[str]]]]:
+    """Yield batches of (message key, contact fields, replaced keys) for
+    messages not yet harvested.
+
+    Messages are read ``batch_size`` at a time and each batch is yielded as
+    soon as it is parsed, so a huge mailbox is saved as it's scanned. Only
+    the latest message from each address in a batch is kept; the keys of
+    the earlier ones it replaced ride along with it, so they are recorded
+    only once its contact is. An address harvested in an earlier batch of
+    the run isn't harvested again: its messages come with None fields, just
+    to be recorded.
+    """
+    harvested: Set[str] = set()
+    latest: Dict[str, Tuple[str, Dict[str, Any], List[str]]] = {}
+    others: List[Tuple[str, Optional[Dict[str, Any]], List[str]]] = []
+    count = 0
+    for message in messages:
+        if seen is not None and message.key in seen:
+            continue
+        count += 1
+        fields = contact_from_message(message)
+        email = (fields.get('email') or '').lower()
+        if email in harvested:
+            others.append((message.key, None, []))
+        elif email:
+            replaced: List[str] = []
+            if email in latest:
+                earlier_key, _, replaced = latest.pop(email)
+                replaced.append(earlier_key)
+            latest[email] = (message.key, fields, replaced)
+        else:
+            others.append((message.key, fields, []))
+        if count >= batch_size:
+            harvested.update(latest)
+            yield list(latest.values()) + others
+            latest, others, count = {}, [], 0
+    if count:
+        yield list(latest.values()) + others
+
+
+def run_harvest(args: Dict[str, Any]) -> int:
+    """Run ``jodie harvest``; returns the process exit status."""
+    path = Path(args['PATH'])
+    if not path.exists():
+        sys.stderr.write(f"Error: {path} does not exist\n")
+        return 1
+    try:
+        batch_size = int(args.get('--batch-size') or 100)
+        if batch_size < 1:
+            raise ValueError("--batch-size must be positive")
+        policy = duplicate_policy(args.get('--duplicates'))
+    except ValueError as e:
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+
+    dry_run = args.get('--dry-run')
+    seen = SeenMessages(args.get('--seen') or default_seen_path())
+    backend = None
+    if not dry_run:
+        from jodie.contact.backend import StorageError, open_backend
+        try:
+            backend = open_backend()
+        except StorageError as e:
+            sys.stderr.write(f"Error: {e}\n")
+            return 1
+
+    messages = contacts = skipped = saved = duplicates = failed = 0
+    try:
+        for batch in harvest_contacts(iter_mailbox(path), seen, batch_size):
+            messages += sum(1 + len(replaced) for _, _, replaced in batch)
+            ready, ready_keys = [], []
+            for key, fields, _ in batch:
+                if fields is None:
+                    continue  # sender already harvested earlier in the run
+                contacts += 1
+                if dry_run:
+                    sys.stdout.write(format_row(contacts, fields) + "\n")
+                if missing_required(fields):
+                    skipped += 1
+                else:
+                    ready.append((contacts, fields))
+                    ready_keys.append(key)
+            if dry_run:
+                continue
+            report = write_batch(ready, backend, label="Contact", duplicates=policy)
+            saved += len(report.saved)
+            duplicates += len(report.duplicates)
+            failed += len(report.invalid) + sum(len(failure.indices) for failure in report.failed)
+            # Record messages once their contacts are saved (or skipped), so
+            # an interrupted run picks up where it left off. A contact in a
+            # chunk the store rejected stays unrecorded, along with the
+            # earlier messages it replaced, and is retried.
+            retry = {ready_keys[index] for failure in report.failed for index in failure.indices}
+            seen.add(recorded for key, _, replaced in batch if key not in retry
+                     for recorded in [key, *replaced])
+            metrics.flush()
+    except OSError as e:
+        sys.stderr.write(f"Error reading {path}: {e}\n")
+        return 1
+
+    if dry_run:
+        sys.stdout.write(f"\n{messages} new messages, {contacts} senders, "
+                         f"{contacts - skipped} ready to save, {skipped} skipped.\n")
+        sys.stdout.write("Run without --dry-run to save these contacts.\n")
+        return 0
+
+    sys.stdout.write(f"Harvested {saved} contacts from {messages} new messages"
+                     f"{format_duplicates(duplicates, policy)}, {skipped} skipped, {failed} failed.\n")
+    return 1 if failed else 0
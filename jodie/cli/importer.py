@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# jodie/cli/importer.py
+"""Bulk import of contacts from CSV, TSV or JSONL files."""
+
+import sys
+from collections import deque
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from jodie import metrics
+from jodie.contact.backend import SaveReport, duplicate_policy
+from jodie.contact.record import missing_required
+from jodie.input.records import Record, detect_format, iter_records, open_records
+from jodie.parsers import NameParser, parse_contact_fields_many
+from jodie.parsers.columns import (COLUMN_ALIASES, INFERRED, ColumnMapping, apply_column_mapping,
+                                   infer_column_mapping, normalize_column, split_full_name)
+
+CONTACT_FIELDS = ('first_name', 'last_name', 'email', 'phone', 'phones', 'job_title', 'company', 'websites',
+                  'note')
+
+# Rows parsed in full to infer the column mapping.
+SAMPLE_SIZE = 25
+
+
+def parse_column_map(spec: Optional[str]) -> Dict[str, str]:
+    """Parse ``--columns`` ("Header=field,Other=field") into header -> field.
+
+    Raises:
+        ValueError: If an entry is malformed or names an unknown field
+    """
+    mapping: Dict[str, str] = {}
+    if not spec:
+        return mapping
+    for entry in spec.split(','):
+        column, sep, field_name = entry.partition('=')
+        if not sep or not column.strip() or not field_name.strip():
+            raise ValueError(f"Invalid column mapping {entry!r}; expected COLUMN=FIELD")
+        field_name = COLUMN_ALIASES.get(normalize_column(field_name))
+        if not field_name:
+            raise ValueError(f"Unknown field in column mapping {entry!r}")
+        mapping[column.strip()] = field_name
+    return mapping
+
+
+def row_text(row: Record) -> List[str]:
+    """All cell values of a row, as segments for free-text parsing."""
+    segments: List[str] = []
+    for value in row.values():
+        if isinstance(value, list):
+            segments.extend(value)
+        else:
+            segments.append(value)
+    return segments
+
+
+def contact_fields_from_mapped(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn directly-mapped column values into Contact keyword arguments."""
+    fields = split_full_name(dict(fields))
+    first, last = fields.get('first_name'), fields.get('last_name')
+
+    websites = [{'url': url.strip()} for url in (fields.get('websites') or '').split(',') if url.strip()]
+    if fields.get('linkedin'):
+        websites.append({'url': fields['linkedin'], 'label': 'LinkedIn'})
+
+    return {
+        'first_name': first or None,
+        'last_name': last or None,
+        'email': fields.get('email') or None,
+        'phone': fields.get('phone') or None,
+        'job_title': fields.get('job_title') or None,
+        'company': fields.get('company') or None,
+        'websites': websites or None,
+        'note': fields.get('note') or None,
+    }
+
+
+def contact_fields_from_parsed(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn parse_contact_fields output into Contact keyword arguments."""
+    first, last = fields.get('first_name'), fields.get('last_name')
+    if first:
+        first, last = NameParser.first_last(f"{first} {last or ''}")
+    result = {name: fields.get(name) or None for name in CONTACT_FIELDS}
+    result['first_name'] = first or None
+    result['last_name'] = last or None
+    return result
+
+
+def plan_import(rows: Iterable[Record], column_map: Dict[str, str],
+                sample_size: int = SAMPLE_SIZE) -> Tuple[ColumnMapping, Iterator[Record]]:
+    """Infer the column mapping from the first rows of a stream.
+
+    Returns:
+        (mapping, rows) where rows still yields every row, sample included
+    """
+    rows = iter(rows)
+    sample = list(islice(rows, sample_size))
+    return infer_column_mapping(sample, explicit=column_map), chain(sample, rows)
+
+
+def iter_contacts(rows: Iterable[Record], mapping: ColumnMapping,
+                  workers: int = 1, chunksize: int = 64) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Convert rows to Contact keyword arguments, streaming and in order.
+
+    Rows are read through the column mapping with only per-cell checks.
+    Rows with no usable mapped cells (e.g. JSONL lines that are plain
+    strings) fall back to full free-text parsing through
+    ``parse_contact_fields_many``; mapped rows go in as None, so they keep
+    their place in the order without a trip to a pool worker. Only rows in
+    flight in the parser pool are held in memory.
+
+    Yields:
+        (row_number, contact_fields) starting at row 1
+    """
+    pending: deque = deque()
+
+    def texts() -> Iterator[Optional[List[str]]]:
+        for row in rows:
+            mapped = apply_column_mapping(row, mapping) if mapping else {}
+            if mapped:
+                pending.append(contact_fields_from_mapped(mapped))
+                yield None
+            else:
+                pending.append(None)
+                yield row_text(row)
+
+    results = parse_contact_fields_many(texts(), workers=workers, chunksize=chunksize)
+    for result in results:
+        fields = pending.popleft()
+        number = result.index + 1
+        if fields:
+            yield number, fields
+        elif result.ok:
+            yield number, contact_fields_from_parsed(result.fields)
+        else:
+            sys.stderr.write(f"Row {number}: could not parse ({result.error})\n")
+
+
+def format_mapping(mapping: ColumnMapping) -> str:
+    """Describe the column mapping for the dry-run preview.
+
+    Overrides that disagree with what the sampled values suggested are
+    shown next to the inferred field.
+    """
+    if not mapping.columns and not mapping.fields:
+        return "No columns detected; rows are parsed as free text."
+
+    lines = [f"Column mapping (from {mapping.sampled} sampled rows):"]
+    width = max(len(column) for column in list(mapping.columns) + list(mapping.fields))
+    for column in mapping.columns + [c for c in mapping.fields if c not in mapping.columns]:
+        field_name = mapping.fields.get(column)
+        inferred = mapping.inferred.get(column)
+        if not field_name:
+            note = f"(ignored; looks like {inferred})" if inferred else "(ignored)"
+            lines.append(f"  {column:<{width}}  ->  {note}")
+            continue
+        source = mapping.sources[column]
+        if source != INFERRED and inferred and inferred != field_name:
+            source += f", inferred {inferred}"
+        lines.append(f"  {column:<{width}}  ->  {field_name:<10}  {source}")
+    return "\n".join(lines)
+
+
+def format_row(number: int, fields: Dict[str, Any]) -> str:
+    """One-line summary of a row's contact fields for dry-run output."""
+    name = ' '.join(part for part in (fields.get('first_name'), fields.get('last_name')) if part)
+    parts = [name or '(no name)']
+    for key in ('email', 'phone', 'job_title', 'company'):
+        if fields.get(key):
+            parts.append(str(fields[key]))
+    status = 'skip' if missing_required(fields) else 'ok'
+    return f"{number:>6}  {status:<4}  " + ' | '.join(parts)
+
+
+def batched(items: Iterator[Any], size: int) -> Iterator[List[Any]]:
+    """Group an iterator into lists of at most ``size`` items."""
+    batch: List[Any] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def save_batch(batch: List[Tuple[int, Dict[str, Any]]], backend: Any, label: str = "Row",
+               duplicates: str = "keep") -> Tuple[int, int, int]:
+    """Save numbered Contact keyword arguments; returns (saved, duplicates, failed).
+
+    The batch goes to the backend as one chunk (one Contacts save request),
+    after one batched duplicate lookup unless ``duplicates`` is "keep".
+    Contacts that fail validation or match a stored contact are reported
+    one by one; a chunk the backend rejects is reported once, with the
+    numbers it covered.
+    """
+    report = write_batch(batch, backend, label, duplicates)
+    failed = len(report.invalid) + sum(len(failure.indices) for failure in report.failed)
+    return len(report.saved), len(report.duplicates), failed
+
+
+def write_batch(batch: List[Tuple[int, Dict[str, Any]]], backend: Any, label: str = "Row",
+                duplicates: str = "keep") -> SaveReport:
+    """``save_batch``, returning the backend's SaveReport (indices into ``batch``)."""
+    if not batch:
+        return SaveReport()
+    numbers = [number for number, _ in batch]
+    report = backend.save_many([fields for _, fields in batch], chunk_size=len(batch),
+                               duplicates=duplicates)
+    for index, reason in sorted(report.invalid.items()):
+        sys.stderr.write(f"{label} {numbers[index]}: {reason}\n")
+    action = "merged into" if duplicates == "merge" else "skipped, already saved as"
+    for index, identifier in sorted(report.duplicates.items()):
+        sys.stderr.write(f"{label} {numbers[index]}: duplicate, {action} {identifier}\n")
+    for failure in report.failed:
+        first, last = numbers[failure.indices[0]], numbers[failure.indices[-1]]
+        span = f"{label} {first}" if first == last else f"{label}s {first}-{last}"
+        sys.stderr.write(f"{span}: not saved, {failure.error}\n")
+    return report
+
+
+def format_duplicates(count: int, policy: str) -> str:
+    """Summary fragment for duplicates, empty unless they were looked for."""
+    if policy == "keep":
+        return ""
+    return f", {count} duplicates {'merged' if policy == 'merge' else 'skipped'}"
+
+
+def run_import(args: Dict[str, Any]) -> int:
+    """Run ``jodie import``; returns the process exit status."""
+    try:
+        path = args['FILE']
+        fmt = detect_format(path, args.get('--format'))
+        column_map = parse_column_map(args.get('--columns'))
+        batch_size = int(args.get('--batch-size') or 100)
+        workers = int(args.get('--workers') or 1)
+        if batch_size < 1 or workers < 1:
+            raise ValueError("--batch-size and --workers must be positive")
+        policy = duplicate_policy(args.get('--duplicates'))
+    except ValueError as e:
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+
+    dry_run = args.get('--dry-run')
+    backend = None
+    if not dry_run:
+        from jodie.contact.backend import StorageError, open_backend
+        try:
+            backend = open_backend()
+        except StorageError as e:
+            sys.stderr.write(f"Error: {e}\n")
+            return 1
+
+    total = skipped = saved = duplicates = failed = 0
+    try:
+        with open_records(path) as handle:
+            mapping, rows = plan_import(iter_records(handle, fmt), column_map)
+            if dry_run:
+                sys.stdout.write(format_mapping(mapping) + "\n\n")
+            contacts = iter_contacts(rows, mapping, workers=workers, chunksize=batch_size)
+            for batch in batched(contacts, batch_size):
+                total += len(batch)
+                if dry_run:
+                    for number, fields in batch:
+                        sys.stdout.write(format_row(number, fields) + "\n")
+                        skipped += missing_required(fields)
+                    continue
+
+                ready = []
+                for number, fields in batch:
+                    if missing_required(fields):
+                        skipped += 1
+                        sys.stderr.write(f"Row {number}: skipped, missing name or email/phone\n")
+                    else:
+                        ready.append((number, fields))
+                batch_saved, batch_duplicates, batch_failed = save_batch(ready, backend, duplicates=policy)
+                saved += batch_saved
+                duplicates += batch_duplicates
+                failed += batch_failed
+                sys.stdout.write(f"Saved {saved} of {total} rows...\n")
+                metrics.flush()
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"Error reading {path}: {e}\n")
+        return 1
+
+    if dry_run:
+        sys.stdout.write(f"\n{total} rows, {total - skipped} ready to save, {skipped} skipped.\n")
+        sys.stdout.write("Run without --dry-run to save these contacts.\n")
+        return 0
+
+    sys.stdout.write(f"Imported {saved} contacts{format_duplicates(duplicates, policy)}, "
+                     f"{skipped} skipped, {failed} failed.\n")
+    return 1 if failed else 0
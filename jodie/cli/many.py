@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# jodie/cli/many.py
+"""``jodie new --many``: add every contact found in one blob of text."""
+
+import sys
+from typing import Any, Dict
+
+from jodie.input.signature import SignaturePreprocessor
+from jodie.parsers.segmenter import parse_contacts
+from jodie.cli.importer import (batched, contact_fields_from_parsed, format_duplicates, format_row,
+                                missing_required, save_batch)
+from jodie.contact.backend import duplicate_policy
+
+
+def read_text(args: Dict[str, Any]) -> str:
+    """Input for --many: clipboard, stdin, or the TEXT arguments."""
+    if args.get('--paste'):
+        from jodie.input import read_clipboard
+        return read_clipboard()
+    if args.get('--stdin') or not args.get('TEXT'):
+        from jodie.input import read_stdin
+        return read_stdin()
+    return '\n'.join(args['TEXT'])
+
+
+def _clean_block(block: str) -> list:
+    # Drop quoted-reply and header noise, but keep every line: the block is
+    # already one person's details, not a message to locate a signature in.
+    return SignaturePreprocessor.preprocess(block, locate=False)
+
+
+def run_many(args: Dict[str, Any], backend: Any = None) -> int:
+    """Run ``jodie new --many``; returns the process exit status.
+
+    Args:
+        args: Parsed command line
+        backend: Storage backend to save into (the daemon's long-lived
+                 one); the configured backend is opened when omitted
+    """
+    try:
+        batch_size = int(args.get('--batch-size') or 100)
+        workers = int(args.get('--workers') or 1)
+        if batch_size < 1 or workers < 1:
+            raise ValueError("--batch-size and --workers must be positive")
+        policy = duplicate_policy(args.get('--duplicates'))
+        text = read_text(args)
+    except (ValueError, RuntimeError) as e:
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+
+    contacts = [contact_fields_from_parsed(fields)
+                for fields in parse_contacts(text, workers=workers, preprocess=_clean_block)]
+    if args.get('--company'):
+        for fields in contacts:
+            fields['company'] = args['--company']
+    skipped = sum(1 for fields in contacts if missing_required(fields))
+
+    if args.get('--dry-run'):
+        for number, fields in enumerate(contacts, 1):
+            sys.stdout.write(format_row(number, fields) + "\n")
+        sys.stdout.write(f"\n{len(contacts)} contacts found, {len(contacts) - skipped} ready to save, "
+                         f"{skipped} skipped.\n")
+        sys.stdout.write("Run without --dry-run to save these contacts.\n")
+        return 0
+
+    if backend is None:
+        from jodie.contact.backend import StorageError, open_backend
+        try:
+            backend = open_backend()
+        except StorageError as e:
+            sys.stderr.write(f"Error: {e}\n")
+            return 1
+    saved = duplicates = failed = 0
+    ready = ((number, fields) for number, fields in enumerate(contacts, 1) if not missing_required(fields))
+    for batch in batched(ready, batch_size):
+        batch_saved, batch_duplicates, batch_failed = save_batch(batch, backend, label="Contact",
+                                                                 duplicates=policy)
+        saved += batch_saved
+        duplicates += batch_duplicates
+        failed += batch_failed
+
+    sys.stdout.write(f"Saved {saved} of {len(contacts)} contacts{format_duplicates(duplicates, policy)}, "
+                     f"{skipped} skipped, {failed} failed.\n")
+    return 1 if failed else 0
@@ -2,6 +2,26 @@
 # jodie/cli/preview.py
 """Dry-run preview formatting for contact fields."""
 
+def with_sources(fields: dict, results: dict) -> dict:
+    """Attach source and confidence from parser results to the fields they produced.
+
+    Args:
+        fields: Final field values (after any CLI overrides)
+        results: ParserPipeline.parse output for the same input
+
+    Returns:
+        Copy of fields; values matching a result become preview dicts
+    """
+    annotated = dict(fields)
+    for key, value in fields.items():
+        result = results.get(key)
+        if value is None or result is None or result.value != value:
+            continue
+        shown = ', '.join(str(v) for v in value) if isinstance(value, list) else str(value)
+        annotated[key] = {'value': shown, 'source': result.source, 'confidence': result.confidence}
+    return annotated
+
+
 def format_preview(fields: dict) -> str:
     """Format parsed fields as a preview table.
 
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# jodie/cli/serve.py
+"""Warm daemon answering forwarded ``jodie new`` commands.
+
+``jodie serve`` loads config, parser lexicons and nameparser once, opens
+the configured storage backend, and then runs the command lines that
+``jodie.cli.client`` forwards over a Unix socket. The event loop only
+handles socket I/O; commands run on a small thread pool, so one slow
+``--many`` doesn't hold up other clients. Each command gets its own
+stdin, stdout and stderr and runs the same code as the local CLI, so
+output and exit status match a local run. Settings come from the ``.jodierc`` found
+when the daemon started; restart it after changing them.
+"""
+
+import asyncio
+import io
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from jodie.cli.client import socket_path
+
+# Largest request line accepted (a pasted thread sent with --stdin)
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+# Parsed once at startup so the first real request finds everything loaded
+WARM_UP_TEXT = ["Jane Smith", "VP of Sales, Acme Inc", "jane@acme.io", "415-555-1234"]
+
+# Commands run at once; more clients wait for a free thread
+COMMAND_THREADS = 4
+
+STREAMS = ("stdin", "stdout", "stderr")
+
+
+class Daemon:
+    """Runs forwarded command lines against warm parsers and one backend."""
+
+    def __init__(self, backend: Any = None) -> None:
+        self.backend = backend
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopped: Optional[asyncio.Event] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def execute(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one forwarded command line, capturing its output.
+
+        Safe to call from several threads at once: output is captured per
+        thread.
+
+        Args:
+            request: {"argv": [...], "stdin": text or None}
+
+        Returns:
+            {"status", "stdout", "stderr"}
+        """
+        from jodie.cli.__main__ import run
+
+        argv = request.get("argv")
+        if not (isinstance(argv, list) and argv and argv[0] == 'new'
+                and all(isinstance(arg, str) for arg in argv)):
+            return {"status": 2, "stdout": "", "stderr": "Error: jodie serve only runs `jodie new`\n"}
+
+        status = 0
+        with _captured(request.get("stdin") or "") as (stdout, stderr):
+            try:
+                run(parse_args(argv), backend=self.backend)
+            except SystemExit as e:
+                status = _exit_status(e.code)
+            except Exception as e:
+                sys.stderr.write(f"Error: {e}\n")
+                status = 1
+        return {"status": status, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+    async def serve(self, path: str) -> None:
+        """Listen on ``path`` until ``stop()`` or SIGINT/SIGTERM."""
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        # Only this user may connect: the socket can save contacts.
+        umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(self._handle, path=path, limit=MAX_REQUEST_BYTES)
+        finally:
+            os.umask(umask)
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                self._loop.add_signal_handler(signum, self._stopped.set)
+            except (NotImplementedError, RuntimeError, ValueError):
+                pass  # not the main thread
+        self._executor = ThreadPoolExecutor(max_workers=COMMAND_THREADS, thread_name_prefix="jodie-serve")
+        try:
+            async with server:
+                await self._stopped.wait()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def stop(self) -> None:
+        """Ask ``serve`` to return; safe to call from any thread."""
+        if self._loop is not None and self._stopped is not None:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            try:
+                request = json.loads(await reader.readline())
+                if not isinstance(request, dict):
+                    raise ValueError("expected a JSON object")
+            except (ValueError, asyncio.LimitOverrunError) as e:
+                response = {"status": 2, "stdout": "", "stderr": f"Error: bad request: {e}\n"}
+            else:
+                # Off the loop's thread, so other clients are served meanwhile
+                response = await self._loop.run_in_executor(self._executor, self.execute, request)
+            writer.write(json.dumps(response).encode("utf-8") + b"\n")
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+class _Routed:
+    """Stands in for sys.stdin, stdout or stderr while commands run: each
+    thread reads and writes its own capture, other threads the real stream."""
+    __slots__ = ("_name",)
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __getattr__(self, attribute: str) -> Any:
+        target = getattr(_local, self._name, None)
+        return getattr(target if target is not None else _real[self._name], attribute)
+
+
+_local = threading.local()
+_real: Dict[str, Any] = {}
+_routing_lock = threading.Lock()
+_routing_users = 0
+
+
+@contextmanager
+def _captured(stdin: str) -> Iterator[Tuple[io.StringIO, io.StringIO]]:
+    # Give this thread its own stdin, stdout and stderr; the _Routed
+    # stand-ins are installed while any thread is capturing.
+    global _routing_users
+    with _routing_lock:
+        if not _routing_users:
+            for name in STREAMS:
+                _real[name] = getattr(sys, name)
+                setattr(sys, name, _Routed(name))
+        _routing_users += 1
+    _local.stdin, _local.stdout, _local.stderr = io.StringIO(stdin), io.StringIO(), io.StringIO()
+    try:
+        yield _local.stdout, _local.stderr
+    finally:
+        _local.stdin = _local.stdout = _local.stderr = None
+        with _routing_lock:
+            _routing_users -= 1
+            if not _routing_users:
+                for name in STREAMS:
+                    setattr(sys, name, _real.pop(name))
+
+
+def parse_args(argv: List[str]) -> Dict[str, Any]:
+    """``docopt(__doc__, argv, version=__version__)`` for the CLI usage.
+
+    docopt rebuilds and normalizes the usage pattern on every call, which
+    costs more than parsing and previewing a contact. The daemon builds it
+    once (see ``_usage_pattern``) and only matches argv against it here.
+    """
+    import docopt
+    from jodie.cli.__doc__ import __doc__ as usage, __version__
+
+    printable, options, pattern = _usage_pattern()
+    docopt.DocoptExit.usage = printable
+    parsed = docopt.parse_argv(docopt.TokenStream(argv, docopt.DocoptExit), list(options), False)
+    docopt.extras(True, __version__, parsed, usage)
+    matched, left, collected = pattern.match(parsed)
+    if matched and left == []:
+        return docopt.Dict((a.name, a.value) for a in pattern.flat() + collected)
+    raise docopt.DocoptExit()
+
+
+@lru_cache(maxsize=None)
+def _usage_pattern() -> Tuple[str, List[Any], Any]:
+    # The setup half of docopt.docopt(), as of docopt 0.6.2
+    import docopt
+    from jodie.cli.__doc__ import __doc__ as usage
+
+    printable = docopt.printable_usage(usage)
+    options = docopt.parse_defaults(usage)
+    pattern = docopt.parse_pattern(docopt.formal_usage(printable), options)
+    pattern_options = set(pattern.flat(docopt.Option))
+    for any_options in pattern.flat(docopt.AnyOptions):
+        any_options.children = list(set(docopt.parse_defaults(usage)) - pattern_options)
+    return printable, options, pattern.fix()
+
+
+def warm_up() -> Any:
+    """Load everything a command needs; returns the shared storage backend.
+
+    The backend is None if it can't be opened (the Contacts backend
+    without PyObjC); saves then fail the same way they would in a local run.
+    """
+    from jodie.cli import preview  # noqa: F401  (used by --dry-run)
+    from jodie.parsers import ParserPipeline
+    from jodie.parsers.batch import warm_up as warm_up_parsers
+
+    _usage_pattern()
+    warm_up_parsers()
+    ParserPipeline.parse(WARM_UP_TEXT)
+    from jodie.contact.backend import StorageError, open_backend
+    try:
+        return open_backend()
+    except StorageError:
+        return None
+
+
+def run_serve(args: Dict[str, Any]) -> int:
+    """Run ``jodie serve``; returns the process exit status."""
+    path = args.get('--socket') or socket_path()
+    if os.path.exists(path):
+        # A live daemon accepts; a stale socket file refuses the connection.
+        if _listening(path):
+            sys.stderr.write(f"Error: jodie serve is already running at {path}\n")
+            return 1
+        os.unlink(path)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    daemon = Daemon(backend=warm_up())
+    sys.stderr.write(f"jodie serve listening on {path}\n")
+    try:
+        asyncio.run(daemon.serve(path))
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+    return 0
+
+
+def _listening(path: str) -> bool:
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        return False
+    finally:
+        probe.close()
+    return True
+
+
+def _exit_status(code: Any) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    # sys.exit("message") and docopt usage errors print and exit with 1
+    sys.stderr.write(f"{code}\n")
+    return 1
@@ -14,15 +14,7 @@ import sys
 from pathlib import Path
 from typing import Optional, Dict, Any
 
-# Try Python 3.11+ tomllib, fall back to tomli
-try:
-    import tomllib
-except ImportError:
-    try:
-        import tomli as tomllib
-    except ImportError:
-        tomllib = None
-
+from jodie import profiling
 
 DEFAULT_CONFIG: Dict[str, Any] = {
     "defaults": {
@@ -41,8 +33,32 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     },
     "behavior": {
         "auto_infer_company": True,
+        "auto_infer_name": True,
         "strip_pronouns": True,
-    }
+        # Parse stages stop refining a field at this confidence
+        "confidence_threshold": 0.85,
+    },
+    # Extra signature preprocessing rules, name -> regex
+    "preprocess": {
+        "noise": {},
+        "separators": {},
+    },
+    # Parse result cache; see jodie.parsers.cache
+    "cache": {
+        "enabled": True,
+        "memory_entries": 1024,
+        "persistent": False,
+        "max_mb": 32,
+    },
+    # OpenMetrics output for unattended runs; see jodie.metrics
+    "metrics": {
+        "path": None,
+    },
+    # Where contacts are saved; see jodie.contact.backend
+    "storage": {
+        "backend": "contacts",
+        "path": None,
+    },
 }
 
 
@@ -87,9 +103,25 @@ def load_config() -> Dict[str, Any]:
     Returns:
         Configuration dictionary with defaults and any user overrides
     """
+    with profiling.timer("config.load"):
+        return _load_config()
+
+
+def _load_config() -> Dict[str, Any]:
     config = DEFAULT_CONFIG.copy()
     config = {k: v.copy() if isinstance(v, dict) else v for k, v in config.items()}
 
+    # Imported here so commands that never read config (a forwarded
+    # `jodie new`, --help) don't load a TOML parser.
+    # Try Python 3.11+ tomllib, fall back to tomli
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            tomllib = None
+
     if tomllib is None:
         # No TOML parser available, return defaults
         return config
@@ -120,3 +152,27 @@ def get_default(config: Dict[str, Any], key: str, cli_value: Optional[str] = Non
     if cli_value is not None:
         return cli_value
     return config.get("defaults", {}).get(key)
+
+
+def cache_dir() -> Path:
+    """Per-user directory for jodie's caches and harvest state.
+
+    Honors $XDG_CACHE_HOME; on macOS defaults to ~/Library/Caches/jodie.
+    """
+    if os.environ.get("XDG_CACHE_HOME"):
+        return Path(os.environ["XDG_CACHE_HOME"]) / "jodie"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "jodie"
+    return Path.home() / ".cache" / "jodie"
+
+
+def data_dir() -> Path:
+    """Per-user directory for data jodie keeps, such as the SQLite contact store.
+
+    Honors $XDG_DATA_HOME; on macOS defaults to ~/Library/Application Support/jodie.
+    """
+    if os.environ.get("XDG_DATA_HOME"):
+        return Path(os.environ["XDG_DATA_HOME"]) / "jodie"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Application Support" / "jodie"
+    return Path.home() / ".local" / "share" / "jodie"
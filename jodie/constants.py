@@ -42,3 +42,27 @@ WEBMAIL_DOMAINS: FrozenSet[str] = frozenset({
     "zoho.com",
     "fastmail.com",
 })
+
+# Sites that host a person's profile rather than their company's site;
+# their domain says nothing about where someone works
+PROFILE_DOMAINS: FrozenSet[str] = frozenset({
+    "linkedin.com",
+    "github.com",
+    "gitlab.com",
+    "twitter.com",
+    "x.com",
+    "instagram.com",
+    "facebook.com",
+    "medium.com",
+    "substack.com",
+    "calendly.com",
+    "about.me",
+    "linktr.ee",
+})
+
+# Shared mailbox names that aren't a person's name
+ROLE_ADDRESSES: FrozenSet[str] = frozenset({
+    "admin", "billing", "contact", "enquiries", "hello", "help", "hi", "info",
+    "jobs", "marketing", "noreply", "no-reply", "office", "press", "sales",
+    "support", "team",
+})
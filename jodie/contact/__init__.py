@@ -1,5 +1,16 @@
 #!/usr/bin/env python3
 # jodie/contact/__init__.py
-from jodie.contact.contact import Contact
+#
+# Contact and ContactStoreSession import PyObjC, so they load on first use (PEP 562).
 
-__all__ = ("Contact", )
+__all__ = ("Contact", "ContactStoreSession")
+
+
+def __getattr__(name):
+    if name == "Contact":
+        from jodie.contact.contact import Contact
+        return Contact
+    if name == "ContactStoreSession":
+        from jodie.contact.session import ContactStoreSession
+        return ContactStoreSession
+    raise AttributeError(f"module 'jodie.contact' has no attribute {name!r}")
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+# jodie/contact/backend.py
+"""Pluggable contact storage.
+
+A backend saves, fetches, enumerates and deletes contact records (see
+``jodie.contact.record``). Three ship with jodie and are picked by name in
+the ``[storage]`` section of .jodierc:
+
+- ``contacts``: the macOS Contacts framework, through PyObjC (default)
+- ``sqlite``: a SQLite file, ``[storage] path`` or under the user data dir
+- ``memory``: a dict that lives as long as the process, for tests and dry
+  experiments
+
+Backends are imported only when opened, so choosing ``sqlite`` or
+``memory`` never loads PyObjC.
+
+``[storage] duplicates`` (or ``--duplicates``) decides what happens to a
+contact that matches one already stored (see ``jodie.contact.duplicates``):
+``keep`` saves it anyway, ``skip`` leaves it out, and ``merge`` adds its
+new details to the stored contact.
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from importlib import import_module
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from jodie import metrics, profiling
+from jodie.contact.duplicates import DuplicateIndex, apply_additions, merge_additions
+from jodie.contact.record import MISSING_REQUIRED, missing_required, normalize_record
+
+DEFAULT_BACKEND = "contacts"
+
+# Contacts written per backend call (one CNSaveRequest, one transaction)
+DEFAULT_CHUNK_SIZE = 100
+
+# What save_many does with a contact that is already stored
+KEEP, SKIP, MERGE = "keep", "skip", "merge"
+DUPLICATE_POLICIES = (KEEP, SKIP, MERGE)
+
+BACKENDS = {
+    "contacts": "jodie.contact.macos:ContactsBackend",
+    "sqlite": "jodie.contact.sqlite:SQLiteBackend",
+    "memory": "jodie.contact.memory:MemoryBackend",
+}
+
+
+class StorageError(Exception):
+    """A backend could not be opened or could not complete a write."""
+
+
+@dataclass
+class ChunkFailure:
+    """A chunk the backend failed to write; none of its contacts were saved."""
+    indices: List[int]
+    error: str
+
+
+@dataclass
+class SaveReport:
+    """Outcome of ``save_many``; indices refer to the input order.
+
+    A contact is in exactly one of ``saved`` (index -> identifier),
+    ``invalid`` (index -> reason, never sent to the backend),
+    ``duplicates`` (index -> identifier of the stored contact it was
+    skipped for or merged into) and one of the ``failed`` chunks.
+    """
+    saved: Dict[int, str] = field(default_factory=dict)
+    invalid: Dict[int, str] = field(default_factory=dict)
+    duplicates: Dict[int, str] = field(default_factory=dict)
+    failed: List[ChunkFailure] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """True if every contact was saved."""
+        return not self.invalid and not self.failed
+
+
+class ContactBackend(ABC):
+    """Abstract base class for contact stores.
+
+    Subclasses implement ``_write``, ``_update``, ``_delete``, ``fetch``
+    and ``contacts``.
+    ``save`` and ``save_many`` normalize and validate records first, so
+    every backend stores the same values and rejects the same input, then
+    hand ``_write`` a chunk at a time so it can save each chunk in one
+    round trip. Returned records carry the backend's identifier under
+    ``'id'``.
+    """
+    name: str = ""
+    _index: Optional[DuplicateIndex] = None
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "ContactBackend":
+        backend = super().__new__(cls)
+        # Serializes duplicate lookups with the writes they decide, so
+        # concurrent saves (``jodie serve`` threads) can't both miss a match.
+        backend._save_lock = threading.RLock()
+        return backend
+
+    def save(self, fields: Dict[str, Any], duplicates: str = KEEP) -> str:
+        """Save one contact from Contact keyword arguments.
+
+        Returns:
+            Identifier of the new record, or of the stored duplicate
+
+        Raises:
+            ValueError: If the name or both email and phone are missing
+            StorageError: If the backend fails to write
+        """
+        report = self.save_many([fields], duplicates=duplicates)
+        if 0 in report.duplicates:
+            return report.duplicates[0]
+        if report.invalid:
+            raise ValueError(report.invalid[0])
+        if report.failed:
+            raise StorageError(report.failed[0].error)
+        return report.saved[0]
+
+    def save_many(self, contacts: Iterable[Dict[str, Any]], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  duplicates: str = KEEP) -> SaveReport:
+        """Save several contacts, ``chunk_size`` per backend write.
+
+        Every contact is validated before any is written. Invalid contacts
+        are reported and skipped; a chunk the backend fails to write is
+        reported and the remaining chunks are still attempted. Unless
+        ``duplicates`` is ``KEEP``, each chunk is looked up in the
+        duplicate index first, and contacts matching a stored one (or an
+        earlier one in the same call) are skipped or merged.
+
+        Args:
+            contacts: Contact keyword arguments
+            chunk_size: Contacts per write (per CNSaveRequest for Contacts)
+            duplicates: KEEP, SKIP or MERGE
+
+        Returns:
+            SaveReport covering every contact
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        if duplicates not in DUPLICATE_POLICIES:
+            raise ValueError(f"Unknown duplicate policy {duplicates!r}")
+        report = SaveReport()
+        ready = []
+        for index, fields in enumerate(contacts):
+            record = normalize_record(fields)
+            if missing_required(record):
+                report.invalid[index] = MISSING_REQUIRED
+            else:
+                ready.append((index, record))
+        if report.invalid:
+            metrics.SAVES.inc("invalid", amount=len(report.invalid))
+
+        for start in range(0, len(ready), chunk_size):
+            with self._save_lock:
+                self._save_chunk(ready[start:start + chunk_size], duplicates, report)
+        if report.duplicates:
+            metrics.SAVES.inc("duplicate", amount=len(report.duplicates))
+        return report
+
+    def _save_chunk(self, chunk: List[Tuple[int, Dict[str, Any]]], duplicates: str,
+                    report: SaveReport) -> None:
+        folded: Dict[int, int] = {}
+        if duplicates != KEEP:
+            chunk, folded = self._resolve_duplicates(chunk, duplicates, report)
+        if not chunk:
+            return
+        indices = [index for index, _ in chunk]
+        with profiling.timer("contact.save"), metrics.STORE_SECONDS.time("save"):
+            try:
+                identifiers = self._write([record for _, record in chunk])
+            except Exception as e:
+                report.failed.append(ChunkFailure(sorted(indices + list(folded)), str(e)))
+                metrics.SAVES.inc("failed", amount=len(chunk) + len(folded))
+                return
+        report.saved.update(zip(indices, identifiers))
+        metrics.SAVES.inc("saved", amount=len(chunk))
+        if self._index is not None:
+            for identifier, (_, record) in zip(identifiers, chunk):
+                self._index.add(identifier, record)
+        for index, earlier in folded.items():
+            report.duplicates[index] = report.saved[earlier]
+
+    def merge(self, identifier: str, fields: Dict[str, Any]) -> bool:
+        """Add what ``fields`` knows and the stored contact doesn't.
+
+        Empty fields are filled and new phone numbers and websites are
+        appended; nothing stored is replaced.
+
+        Returns:
+            True if the stored contact changed
+
+        Raises:
+            StorageError: If the contact is gone or the update fails
+        """
+        with self._save_lock:
+            existing = self.fetch(identifier)
+            if existing is None:
+                raise StorageError(f"Contact {identifier} no longer exists")
+            additions = merge_additions(existing, normalize_record(fields))
+            if not additions:
+                return False
+            with profiling.timer("contact.save"), metrics.STORE_SECONDS.time("update"):
+                self._update(identifier, additions)
+            if self._index is not None:
+                self._index.add(identifier, apply_additions(existing, additions))
+            return True
+
+    def duplicate_index(self) -> DuplicateIndex:
+        """Index of the stored contacts, built on first use and kept current
+        by this backend's saves, merges and deletes."""
+        with self._save_lock:
+            if self._index is None:
+                with profiling.timer("contact.index"), metrics.STORE_SECONDS.time("index"):
+                    self._index = DuplicateIndex.build(self.key_records())
+            return self._index
+
+    def key_records(self) -> Iterator[Dict[str, Any]]:
+        """Stored records with at least the fields duplicate keys read
+        (id, email, phone, phones, websites); backends can fetch less."""
+        return self.contacts()
+
+    def _resolve_duplicates(self, chunk: List[Tuple[int, Dict[str, Any]]], policy: str,
+                            report: SaveReport) -> Tuple[List[Tuple[int, Dict[str, Any]]], Dict[int, int]]:
+        # Returns the records still to write, and input index -> index of
+        # the earlier record in this chunk that each dropped one matched.
+        stored = self.duplicate_index().find_many(record for _, record in chunk)
+        pending = DuplicateIndex()
+        records: Dict[int, Dict[str, Any]] = {}
+        to_write, folded = [], {}
+        for (index, record), existing in zip(chunk, stored):
+            if existing is not None:
+                try:
+                    if policy == MERGE:
+                        self.merge(existing, record)
+                    report.duplicates[index] = existing
+                except Exception as e:
+                    report.failed.append(ChunkFailure([index], str(e)))
+                    metrics.SAVES.inc("failed")
+                continue
+            earlier = pending.find(record)
+            if earlier is not None:
+                if policy == MERGE:
+                    apply_additions(records[int(earlier)], merge_additions(records[int(earlier)], record))
+                    pending.add(earlier, records[int(earlier)])
+                folded[index] = int(earlier)
+                continue
+            pending.add(str(index), record)
+            records[index] = record
+            to_write.append((index, record))
+        return to_write, folded
+
+    @abstractmethod
+    def _write(self, records: List[Dict[str, Any]]) -> List[str]:
+        """Store one chunk of normalized, validated records, all or none.
+
+        Returns:
+            Identifiers of the new records, in order
+
+        Raises:
+            StorageError: If the chunk could not be written
+        """
+
+    @abstractmethod
+    def _update(self, identifier: str, additions: Dict[str, Any]) -> None:
+        """Add ``merge_additions`` output to a stored record.
+
+        Raises:
+            StorageError: If the record could not be updated
+        """
+
+    @abstractmethod
+    def fetch(self, identifier: str) -> Optional[Dict[str, Any]]:
+        """The record saved under ``identifier``, or None."""
+
+    @abstractmethod
+    def contacts(self) -> Iterator[Dict[str, Any]]:
+        """Every stored record."""
+
+    def delete(self, identifier: str) -> bool:
+        """Remove a record; returns False if there was none."""
+        with self._save_lock:
+            removed = self._delete(identifier)
+            if removed and self._index is not None:
+                self._index.discard(identifier)
+            return removed
+
+    @abstractmethod
+    def _delete(self, identifier: str) -> bool:
+        """Remove a stored record; returns False if there was none."""
+
+    def close(self) -> None:
+        """Release the backend's resources."""
+
+    def __enter__(self) -> "ContactBackend":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+_settings: Dict[str, Any] = {}
+
+
+def duplicate_policy(value: Optional[str] = None) -> str:
+    """The duplicate policy: ``value`` (from --duplicates), else ``[storage] duplicates``.
+
+    Raises:
+        ValueError: If the policy isn't keep, skip or merge
+    """
+    policy = (value or _settings.get("duplicates") or KEEP).lower()
+    if policy not in DUPLICATE_POLICIES:
+        raise ValueError(f"Unknown duplicate policy {policy!r}; expected keep, skip or merge")
+    return policy
+
+
+def configure_storage(config: Optional[Dict[str, Any]] = None) -> None:
+    """Apply the ``[storage]`` config section.
+
+    Args:
+        config: Loaded configuration; None restores the defaults
+    """
+    global _settings
+    _settings = dict((config or {}).get("storage") or {})
+
+
+def open_backend(name: Optional[str] = None, **options: Any) -> ContactBackend:
+    """Open a storage backend, by default the configured one.
+
+    Args:
+        name: "contacts", "sqlite", "memory", or a "module:Class" target
+        options: Keyword arguments for the backend (e.g. ``path`` for
+                 sqlite); default to the rest of ``[storage]``
+
+    Raises:
+        StorageError: If the backend is unknown or can't be opened
+    """
+    if name is None:
+        name = _settings.get("backend") or DEFAULT_BACKEND
+        options = {**{key: value for key, value in _settings.items() if key not in ("backend", "duplicates")},
+                   **options}
+    target = BACKENDS.get(name, name)
+    module_name, _, attribute = target.partition(":")
+    if not attribute:
+        raise StorageError(f"Unknown storage backend {name!r}; expected one of {', '.join(BACKENDS)}")
+    try:
+        backend_class = getattr(import_module(module_name), attribute)
+    except ImportError as e:
+        raise StorageError(f"Storage backend {name!r} is unavailable: {e}") from e
+    return backend_class(**options)
@@ -3,34 +3,24 @@
 from datetime import datetime
 from typing import Optional, List, Any, Union, Dict
 import subprocess
-import objc
-from Contacts import (CNMutableContact, CNContactStore, CNSaveRequest, CNLabeledValue,
-                      CNPhoneNumber, CNLabelURLAddressHomePage)
+from Contacts import (CNMutableContact, CNContactStore, CNLabeledValue,
+                      CNPhoneNumber, CNLabelURLAddressHomePage, CNLabelHome, CNLabelWork,
+                      CNLabelPhoneNumberMobile, CNLabelPhoneNumberMain, CNLabelPhoneNumberWorkFax)
 from Foundation import NSCalendar, NSDateComponents
 
-from jodie.constants import WEBMAIL_DOMAINS
-
-
-def get_label_for_email(email: str) -> str:
-    """
-    Determine the label for an email address based on its domain.
-
-    Args:
-        email (str): The email address to analyze.
-
-    Returns:
-        str: "work" if the email domain is neither a common webmail provider nor an educational institution (.edu),
-             otherwise "home".
-    """
-    # Extract the email's domain
-    email_domain: str = email.split('@')[-1].lower() if email else ""
-
-    # Check domain against webmail providers and education domains (.edu)
-    if email_domain not in WEBMAIL_DOMAINS and not email_domain.endswith('.edu'):
-        return "work"
-    else:
-        return "home"
+from jodie import metrics, profiling
+from jodie.contact.backend import StorageError
+from jodie.contact.record import HOMEPAGE, clean_phone, get_label_for_email, website_label
+from jodie.contact.session import ContactStoreSession, shared_session
 
+# Parsed phone labels (see jodie.parsers.phones) -> Contacts label constants
+PHONE_LABEL_CONSTANTS = {
+    'mobile': CNLabelPhoneNumberMobile,
+    'work': CNLabelWork,
+    'main': CNLabelPhoneNumberMain,
+    'fax': CNLabelPhoneNumberWorkFax,
+    'home': CNLabelHome,
+}
 
 def get_human_friendly_label(label: str) -> str:
     """
@@ -70,57 +60,8 @@ def get_label_for_website(url: str, email: Optional[str] = None, company: Option
     Returns:
         str: A label constant from Contacts framework (CNLabelURLAddress*) or a custom label string.
     """
-    # Common professional/social networks
-    professional_domains = {
-        'linkedin.com': 'LinkedIn',
-        'github.com': 'GitHub',
-        'twitter.com': 'Twitter',
-        'instagram.com': 'Instagram',
-        'facebook.com': 'Facebook',
-    }
-
-    # Common calendar/scheduling domains
-    calendar_domains = {
-        'calendly.com': 'Calendar',
-        'meet.google.com': 'Calendar',
-        'zoom.us': 'Calendar',
-    }
-
-    # Extract the domain from the URL
-    try:
-        # Remove protocol and www if present
-        domain = url.lower().replace('https://', '').replace('http://', '').replace('www.', '')
-        # Get the domain part
-        domain = domain.split('/')[0]
-    except:
-        # If URL parsing fails, default to homepage
-        return CNLabelURLAddressHomePage
-
-    # Rule 1: Check against known professional/social networks
-    for known_domain, label in professional_domains.items():
-        if known_domain in domain:
-            return label
-
-    # Rule 2: Check against known calendar domains
-    for known_domain, label in calendar_domains.items():
-        if known_domain in domain:
-            return label
-
-    # Rule 3: If email is work and domains match, set website to work
-    if email:
-        email_domain = email.split('@')[-1].lower()
-        if get_label_for_email(email) == "work" and email_domain in domain:
-            return "Work"
-
-    # Rule 4: If email is home/webmail and company name exists, check for company name in domain
-    if email and company and get_label_for_email(email) == "home":
-        # Split company name into words and check if any appear in domain
-        company_words = company.lower().split()
-        if any(word in domain for word in company_words):
-            return "Work"
-
-    # Rule 5: Fallback to homepage
-    return CNLabelURLAddressHomePage
+    label = website_label(url, email, company)
+    return CNLabelURLAddressHomePage if label == HOMEPAGE else label
 
 
 class WebsiteLabeledValue(CNLabeledValue):
@@ -149,7 +90,8 @@ class Contact:
         job_title: Optional[str] = None,
         company: Optional[str] = None,
         websites: Optional[Union[str, List[str], List[Dict[str, str]], List[CNLabeledValue]]] = None,
-        note: Optional[str] = None
+        note: Optional[str] = None,
+        phones: Optional[List[Dict[str, Optional[str]]]] = None
     ) -> None:
         """
         Initialize a Contact object with optional parameters for various contact fields.
@@ -164,6 +106,7 @@ class Contact:
             company: Company name of the contact
             websites: Website URL(s) of the contact
             note: Additional notes for the contact
+            phones: Labeled numbers ({'number', 'label', 'extension'}); replaces phone
         """
         self.contact: CNMutableContact = CNMutableContact.alloc().init()
         
@@ -176,6 +119,8 @@ class Contact:
         self.company = company
         self.websites = websites
         self.note = note
+        if phones:
+            self.phones = phones
 
         # Apple Contacts.app doesnt display created date by default
         # save the created date in a custom field
@@ -237,16 +182,20 @@ class Contact:
         )
         return result.returncode == 0
 
-    def save(self) -> 'Contact':
+    def save(self, store: Optional[Union[CNContactStore, ContactStoreSession]] = None) -> 'Contact':
         """
         Validate required fields and try to save to Contacts.app / Apple Address Book.
 
+        Args:
+            store: Contact store or ContactStoreSession to save into. The
+                   process-wide session is used when omitted.
+
         Returns:
             Contact: The saved contact instance
 
         Raises:
             ValueError: If required fields (first name, last name, and either email or phone) are missing
-            Exception: If the save operation fails
+            StorageError: If access to Contacts is denied or the save fails
         """
         # Check that we have first name, last name, and at least one contact method (email or phone)
         has_first_name = bool(self.contact.givenName())
@@ -255,17 +204,22 @@ class Contact:
         has_phone = bool(self.contact.phoneNumbers())
 
         if not (has_first_name and has_last_name and (has_email or has_phone)):
+            metrics.SAVES.inc("invalid")
             raise ValueError(
                 "Missing required fields. First name, last name, and at least one contact method (email or phone) are required.")
 
-        store: CNContactStore = CNContactStore.alloc().init()
-        request: CNSaveRequest = CNSaveRequest.alloc().init()
-        request.addContact_toContainerWithIdentifier_(self.contact, None)
-
-        error: Any = objc.nil
-        success, error = store.executeSaveRequest_error_(request, None)
-        if not success:
-            raise Exception(f"Failed to save contact: {error}")
+        if isinstance(store, ContactStoreSession):
+            session = store
+        else:
+            session = shared_session() if store is None else ContactStoreSession(store)
+        with profiling.timer("contact.save"):
+            try:
+                with metrics.STORE_SECONDS.time("save"):
+                    session.add([self.contact])
+            except StorageError:
+                metrics.SAVES.inc("failed")
+                raise
+        metrics.SAVES.inc("saved")
 
         # TODO: Notes disabled pending AppleScript refactor (ISS-000012)
         # After successful PyObjC save, apply note via AppleScript if present
@@ -358,12 +312,34 @@ class Contact:
         if not value or not value.strip():
             self.contact.setPhoneNumbers_([])
             return
-        cleaned_number = ''.join(ch for ch in value if ch.isdigit() or ch == '+')
+        cleaned_number = clean_phone(value)
         phone_number = CNPhoneNumber.phoneNumberWithStringValue_(cleaned_number)
         phone_label_value = CNLabeledValue.alloc().initWithLabel_value_(
             "mobile", phone_number)
         self.contact.setPhoneNumbers_([phone_label_value])
 
+    @property
+    def phones(self) -> List[Dict[str, Optional[str]]]:
+        """Get all phone numbers as dicts with 'number' and 'label' keys."""
+        labels = {constant: name for name, constant in PHONE_LABEL_CONSTANTS.items()}
+        return [{'number': entry.value().stringValue(), 'label': labels.get(entry.label(), entry.label())}
+                for entry in self.contact.phoneNumbers()]
+
+    @phones.setter
+    def phones(self, value: Optional[List[Dict[str, Optional[str]]]]) -> None:
+        """Set phone numbers from parsed entries; labels map to Contacts constants."""
+        labeled_values = []
+        for item in value or []:
+            number = item.get('number')
+            if not number:
+                continue
+            if item.get('extension'):
+                number = f"{number} ext. {item['extension']}"
+            label = PHONE_LABEL_CONSTANTS.get(item.get('label') or 'mobile', CNLabelPhoneNumberMobile)
+            labeled_values.append(CNLabeledValue.alloc().initWithLabel_value_(
+                label, CNPhoneNumber.phoneNumberWithStringValue_(number)))
+        self.contact.setPhoneNumbers_(labeled_values)
+
     @property
     def job_title(self) -> Optional[str]:
         """Get the contact's job title."""
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# jodie/contact/duplicates.py
+"""Exact duplicate detection on normalized contact keys.
+
+Two contacts are the same person if they share a key: the lower-cased
+email, the phone number (E.164 when its country is known, so
+"415-555-1234" matches "+14155551234"), or a LinkedIn or GitHub profile
+slug. ``DuplicateIndex`` maps every key of the stored contacts to an
+identifier, so checking an incoming contact is a few dict lookups however
+large the address book is.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+from jodie.contact.record import clean_phone
+from jodie.parsers.phones import normalize_phone
+
+Key = Tuple[str, str]
+
+# Key kinds in lookup order: the most specific match wins.
+KEY_KINDS = ("email", "linkedin", "github", "phone")
+
+# Shorter digit strings (extensions, short codes) would match unrelated people.
+MIN_PHONE_DIGITS = 7
+
+LINKEDIN_PROFILE = re.compile(r'^(?:[a-z]{2,3}\.)?linkedin\.com/(in|company)/([^/?#]+)')
+GITHUB_PROFILE = re.compile(r'^github\.com/([a-z0-9](?:[a-z0-9-]*[a-z0-9])?)(?:[/?#]|$)')
+# github.com/<name> paths that aren't people or organizations
+GITHUB_RESERVED = frozenset({'about', 'features', 'marketplace', 'orgs', 'settings', 'sponsors', 'topics'})
+
+# Filled in only where the stored contact has no value; phones and websites are appended
+SCALAR_FIELDS = ('first_name', 'last_name', 'email', 'job_title', 'company', 'note')
+
+
+def profile_key(url: Optional[str]) -> Optional[Key]:
+    """("linkedin", "in/<slug>") or ("github", "<user>") for a profile URL, else None."""
+    if not url:
+        return None
+    address = re.sub(r'^[a-z]+://', '', url.strip().lower())
+    address = re.sub(r'^(?:www\.|m\.)', '', address)
+    match = LINKEDIN_PROFILE.match(address)
+    if match:
+        return ("linkedin", f"{match.group(1)}/{unquote(match.group(2)).strip()}")
+    match = GITHUB_PROFILE.match(address)
+    if match and match.group(1) not in GITHUB_RESERVED:
+        return ("github", match.group(1))
+    return None
+
+
+def phone_key(number: Optional[str]) -> Optional[Key]:
+    """("phone", number) for a phone number, ignoring any extension.
+
+    The number is E.164 when its country can be determined, as the Contacts
+    backend stores it, so national and international forms of one number
+    share a key; otherwise its digits, cleaned like ``Contact.phone``.
+    """
+    normalized = normalize_phone(number) if number else None
+    if normalized is not None:
+        return ("phone", normalized.e164 or normalized.digits)
+    cleaned = clean_phone(re.split(r'\s*(?:ext\.?|x)\s*\d+\s*$', number or '', flags=re.I)[0])
+    if not cleaned or sum(ch.isdigit() for ch in cleaned) < MIN_PHONE_DIGITS:
+        return None
+    return ("phone", cleaned)
+
+
+def contact_keys(record: Dict[str, Any]) -> List[Key]:
+    """Every duplicate key of a record, in ``KEY_KINDS`` order."""
+    keys: Set[Key] = set()
+    email = (record.get('email') or '').strip().lower()
+    if email:
+        keys.add(("email", email))
+    numbers = [record.get('phone')] + [item.get('number') for item in record.get('phones') or []]
+    keys.update(key for key in map(phone_key, numbers) if key)
+    for site in record.get('websites') or []:
+        key = profile_key(site.get('url') if isinstance(site, dict) else site)
+        if key:
+            keys.add(key)
+    return sorted(keys, key=lambda key: (KEY_KINDS.index(key[0]), key[1]))
+
+
+class DuplicateIndex:
+    """Key -> identifier map over a set of contacts.
+
+    The first contact added under a key keeps it, so lookups return the
+    oldest match when the address book already has duplicates.
+    """
+
+    def __init__(self) -> None:
+        self._owners: Dict[Key, str] = {}
+        self._keys: Dict[str, List[Key]] = {}
+
+    @classmethod
+    def build(cls, records: Iterable[Dict[str, Any]]) -> "DuplicateIndex":
+        """Index stored records, each carrying its identifier under ``'id'``."""
+        index = cls()
+        for record in records:
+            index.add(record['id'], record)
+        return index
+
+    def add(self, identifier: str, record: Dict[str, Any]) -> None:
+        """Index a record's keys (again, after a merge adds some)."""
+        keys = self._keys.setdefault(identifier, [])
+        for key in contact_keys(record):
+            if key not in keys:
+                keys.append(key)
+            self._owners.setdefault(key, identifier)
+
+    def discard(self, identifier: str) -> None:
+        """Forget a deleted record."""
+        for key in self._keys.pop(identifier, []):
+            if self._owners.get(key) == identifier:
+                del self._owners[key]
+
+    def find(self, record: Dict[str, Any]) -> Optional[str]:
+        """Identifier of an indexed contact sharing a key with ``record``."""
+        for key in contact_keys(record):
+            owner = self._owners.get(key)
+            if owner is not None:
+                return owner
+        return None
+
+    def find_many(self, records: Iterable[Dict[str, Any]]) -> List[Optional[str]]:
+        """``find`` for each record, in order."""
+        return [self.find(record) for record in records]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+def merge_additions(existing: Dict[str, Any], incoming: Dict[str, Any]) -> Dict[str, Any]:
+    """What ``incoming`` adds to ``existing``: empty fields it fills, new
+    phone numbers and new websites. Nothing already stored is replaced.
+
+    Returns:
+        Dict of additions; empty if ``incoming`` adds nothing
+    """
+    additions: Dict[str, Any] = {name: incoming[name] for name in SCALAR_FIELDS
+                                 if incoming.get(name) and not existing.get(name)}
+    known_numbers = {phone_key(item.get('number')) for item in existing.get('phones') or []}
+    known_numbers.add(phone_key(existing.get('phone')))
+    incoming_phones = incoming.get('phones') or []
+    if not incoming_phones and incoming.get('phone'):
+        incoming_phones = [{'number': incoming['phone'], 'label': 'mobile', 'extension': None}]
+    phones = [item for item in incoming_phones if phone_key(item.get('number')) not in known_numbers]
+    if phones:
+        additions['phones'] = phones
+    known_urls = {site['url'].lower() for site in existing.get('websites') or []}
+    websites = [site for site in incoming.get('websites') or [] if site['url'].lower() not in known_urls]
+    if websites:
+        additions['websites'] = websites
+    return additions
+
+
+def apply_additions(record: Dict[str, Any], additions: Dict[str, Any]) -> Dict[str, Any]:
+    """Add ``merge_additions`` output to a record, in place; returns it."""
+    if additions.get('phones') and not record.get('phones') and record.get('phone'):
+        record['phones'] = [{'number': record['phone'], 'label': 'mobile', 'extension': None}]
+    for name, value in additions.items():
+        if name in ('phones', 'websites'):
+            record[name] = list(record.get(name) or []) + list(value)
+        else:
+            record[name] = value
+    if not record.get('phone') and record.get('phones'):
+        record['phone'] = clean_phone(record['phones'][0]['number'])
+    return record
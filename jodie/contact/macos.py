@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# jodie/contact/macos.py
+"""Contact storage in Contacts.app, through PyObjC and the Contacts framework."""
+
+from typing import Any, Dict, Iterator, List, Optional
+
+from Contacts import CNLabelURLAddressHomePage
+
+from jodie.contact.backend import ContactBackend, StorageError
+from jodie.contact.contact import PHONE_LABEL_CONSTANTS, Contact
+from jodie.contact.record import HOMEPAGE, clean_phone
+from jodie.contact.session import ContactStoreSession
+
+_PHONE_LABEL_NAMES = {constant: name for name, constant in PHONE_LABEL_CONSTANTS.items()}
+
+
+class ContactsBackend(ContactBackend):
+    """The user's Contacts.app address book.
+
+    Args:
+        store: CNContactStore to use; a new one is opened when omitted
+        session: ContactStoreSession to use instead, e.g. one shared with
+                 other code; it is left open on ``close``
+    """
+    name = "contacts"
+
+    def __init__(self, store: Any = None, session: Optional[ContactStoreSession] = None,
+                 **options: Any) -> None:
+        self._owns_session = session is None
+        self.session = session if session is not None else ContactStoreSession(store)
+
+    def _write(self, records: List[Dict[str, Any]]) -> List[str]:
+        # The whole chunk goes in one save request: one store round trip,
+        # and the request succeeds or fails as a unit.
+        contacts = [Contact(**_contact_fields(record)).contact for record in records]
+        self.session.add(contacts)
+        return [contact.identifier() for contact in contacts]
+
+    def _update(self, identifier: str, additions: Dict[str, Any]) -> None:
+        contact = self.session.fetch(identifier)
+        if contact is None:
+            raise StorageError(f"Contact {identifier} no longer exists")
+        contact = contact.mutableCopy()
+        for name, setter in (('first_name', contact.setGivenName_), ('last_name', contact.setFamilyName_),
+                             ('job_title', contact.setJobTitle_), ('company', contact.setOrganizationName_)):
+            if additions.get(name):
+                setter(additions[name])
+        # Labeled values built the way a new Contact builds them, then appended
+        added = Contact(email=additions.get('email'), phones=additions.get('phones'),
+                        websites=_contact_fields({'websites': additions.get('websites') or []})['websites']).contact
+        contact.setEmailAddresses_(list(contact.emailAddresses()) + list(added.emailAddresses()))
+        contact.setPhoneNumbers_(list(contact.phoneNumbers()) + list(added.phoneNumbers()))
+        contact.setUrlAddresses_(list(contact.urlAddresses()) + list(added.urlAddresses()))
+        self.session.update(contact)
+
+    def fetch(self, identifier: str) -> Optional[Dict[str, Any]]:
+        contact = self.session.fetch(identifier)
+        return _record(contact) if contact is not None else None
+
+    def contacts(self) -> Iterator[Dict[str, Any]]:
+        for contact in self.session.enumerate():
+            yield _record(contact)
+
+    def key_records(self) -> Iterator[Dict[str, Any]]:
+        # Fetch only identifiers, emails, phones and URLs: far less to load
+        # and bridge than full contacts.
+        for contact in self.session.enumerate(self.session.duplicate_keys):
+            yield _key_record(contact)
+
+    def _delete(self, identifier: str) -> bool:
+        contact = self.session.fetch(identifier, self.session.identifier_keys)
+        if contact is None:
+            return False
+        self.session.delete(contact)
+        return True
+
+    def close(self) -> None:
+        if self._owns_session:
+            self.session.close()
+
+
+def _contact_fields(record: Dict[str, Any]) -> Dict[str, Any]:
+    websites = [{'url': site['url'],
+                 'label': CNLabelURLAddressHomePage if site['label'] == HOMEPAGE else site['label']}
+                for site in record['websites']]
+    return {**record, 'websites': websites or None}
+
+
+def _key_record(contact: Any) -> Dict[str, Any]:
+    # Record fields duplicate keys read, from a contact fetched with DUPLICATE_KEYS
+    emails = contact.emailAddresses()
+    return {
+        'id': contact.identifier(),
+        'email': emails[0].value() if emails else None,
+        'phones': [{'number': entry.value().stringValue()} for entry in contact.phoneNumbers()],
+        'websites': [{'url': site.value()} for site in contact.urlAddresses()],
+    }
+
+
+def _record(contact: Any) -> Dict[str, Any]:
+    emails = contact.emailAddresses()
+    phones = [{'number': entry.value().stringValue(),
+               'label': _PHONE_LABEL_NAMES.get(entry.label(), entry.label()), 'extension': None}
+              for entry in contact.phoneNumbers()]
+    websites = [{'url': site.value(),
+                 'label': HOMEPAGE if site.label() == CNLabelURLAddressHomePage else site.label()}
+                for site in contact.urlAddresses()]
+    return {
+        'id': contact.identifier(),
+        'first_name': contact.givenName() or None,
+        'last_name': contact.familyName() or None,
+        'email': emails[0].value() if emails else None,
+        'phone': clean_phone(phones[0]['number']) if phones else None,
+        'phones': phones,
+        'job_title': contact.jobTitle() or None,
+        'company': contact.organizationName() or None,
+        'websites': websites,
+        'note': None,
+    }
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# jodie/contact/memory.py
+"""In-memory contact storage, for tests and trying jodie without Contacts."""
+
+import copy
+import threading
+import uuid
+from typing import Any, Dict, Iterator, List, Optional
+
+from jodie.contact.backend import ContactBackend, StorageError
+from jodie.contact.duplicates import apply_additions
+
+
+class MemoryBackend(ContactBackend):
+    """Records in a dict; gone when the process exits."""
+    name = "memory"
+
+    def __init__(self, **options: Any) -> None:
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _write(self, records: List[Dict[str, Any]]) -> List[str]:
+        identifiers = []
+        with self._lock:
+            for record in records:
+                identifier = str(uuid.uuid4()).upper()
+                self._records[identifier] = copy.deepcopy(record)
+                identifiers.append(identifier)
+        return identifiers
+
+    def _update(self, identifier: str, additions: Dict[str, Any]) -> None:
+        with self._lock:
+            if identifier not in self._records:
+                raise StorageError(f"Contact {identifier} no longer exists")
+            apply_additions(self._records[identifier], copy.deepcopy(additions))
+
+    def fetch(self, identifier: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            record = self._records.get(identifier)
+            return {'id': identifier, **copy.deepcopy(record)} if record is not None else None
+
+    def contacts(self) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            snapshot = list(self._records.items())
+        for identifier, record in snapshot:
+            yield {'id': identifier, **copy.deepcopy(record)}
+
+    def _delete(self, identifier: str) -> bool:
+        with self._lock:
+            return self._records.pop(identifier, None) is not None
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# jodie/contact/record.py
+"""Backend-neutral contact records.
+
+A record is a dict of Contact keyword arguments (first_name, last_name,
+email, phone, phones, job_title, company, websites, note), normalized the
+way ``Contact``'s setters normalize them. Storage backends save and return
+records, so none of this imports PyObjC.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from jodie.constants import WEBMAIL_DOMAINS
+
+RECORD_FIELDS = ('first_name', 'last_name', 'email', 'phone', 'phones', 'job_title', 'company', 'websites',
+                 'note')
+
+MISSING_REQUIRED = ("Missing required fields. First name, last name, and at least one contact method "
+                    "(email or phone) are required.")
+
+# Website label for a plain homepage; the Contacts backend stores it as
+# CNLabelURLAddressHomePage.
+HOMEPAGE = "homepage"
+
+PROFESSIONAL_DOMAINS = {
+    'linkedin.com': 'LinkedIn',
+    'github.com': 'GitHub',
+    'twitter.com': 'Twitter',
+    'instagram.com': 'Instagram',
+    'facebook.com': 'Facebook',
+}
+CALENDAR_DOMAINS = {
+    'calendly.com': 'Calendar',
+    'meet.google.com': 'Calendar',
+    'zoom.us': 'Calendar',
+}
+FRIENDLY_LABELS = {
+    HOMEPAGE: "Website",
+    "work": "Work",
+    "home": "Home",
+}
+
+
+def get_label_for_email(email: str) -> str:
+    """
+    Determine the label for an email address based on its domain.
+
+    Args:
+        email (str): The email address to analyze.
+
+    Returns:
+        str: "work" if the email domain is neither a common webmail provider nor an educational institution (.edu),
+             otherwise "home".
+    """
+    # Extract the email's domain
+    email_domain: str = email.split('@')[-1].lower() if email else ""
+
+    # Check domain against webmail providers and education domains (.edu)
+    if email_domain not in WEBMAIL_DOMAINS and not email_domain.endswith('.edu'):
+        return "work"
+    else:
+        return "home"
+
+
+def website_label(url: str, email: Optional[str] = None, company: Optional[str] = None) -> str:
+    """Label for a website URL: a known network, "Work", or ``HOMEPAGE``.
+
+    Args:
+        url: The website URL to label
+        email: The contact's email, to match a work domain
+        company: The contact's company, to match a webmail user's site
+
+    Returns:
+        Label string
+    """
+    if not url:
+        return HOMEPAGE
+    # Remove protocol and www, keep the host
+    domain = url.lower().replace('https://', '').replace('http://', '').replace('www.', '').split('/')[0]
+
+    for known_domain, label in PROFESSIONAL_DOMAINS.items():
+        if known_domain in domain:
+            return label
+    for known_domain, label in CALENDAR_DOMAINS.items():
+        if known_domain in domain:
+            return label
+
+    if email:
+        email_domain = email.split('@')[-1].lower()
+        if get_label_for_email(email) == "work" and email_domain in domain:
+            return "Work"
+        # Webmail user: a site matching the company name is still work
+        if company and get_label_for_email(email) == "home":
+            if any(word in domain for word in company.lower().split()):
+                return "Work"
+    return HOMEPAGE
+
+
+def clean_phone(value: Optional[str]) -> Optional[str]:
+    """Digits and '+' of a phone number, as ``Contact.phone`` stores it."""
+    if not value or not value.strip():
+        return None
+    return ''.join(ch for ch in value if ch.isdigit() or ch == '+') or None
+
+
+def missing_required(fields: Dict[str, Any]) -> bool:
+    """True if a save would reject these fields (see ``MISSING_REQUIRED``)."""
+    return not (fields.get('first_name') and fields.get('last_name')
+                and (fields.get('email') or fields.get('phone') or fields.get('phones')))
+
+
+def normalize_record(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize Contact keyword arguments into a record.
+
+    Strings are stripped (empty ones become None), the email is lower-cased,
+    the phone keeps only digits and '+', and websites become
+    ``{'url', 'label'}`` dicts labeled like ``Contact.websites`` does.
+    """
+    first_name, last_name = _text(fields.get('first_name')), _text(fields.get('last_name'))
+    email = _text(fields.get('email'))
+    email = email.lower() if email else None
+    company = _text(fields.get('company'))
+
+    phones = [{'number': item['number'], 'label': item.get('label') or 'mobile',
+               'extension': item.get('extension')}
+              for item in fields.get('phones') or [] if item.get('number')]
+    phone = clean_phone(fields.get('phone'))
+    if phones and not phone:
+        phone = clean_phone(phones[0]['number'])
+
+    return {
+        'first_name': first_name,
+        'last_name': last_name,
+        'email': email,
+        'phone': phone,
+        'phones': phones,
+        'job_title': _text(fields.get('job_title')),
+        'company': company,
+        'websites': _websites(fields.get('websites'), email, company),
+        'note': _text(fields.get('note')),
+    }
+
+
+def format_record(record: Dict[str, Any]) -> str:
+    """One-line summary of a record, as ``str(Contact)`` prints it."""
+    name = ' '.join(part for part in (record.get('first_name'), record.get('last_name')) if part)
+    websites = ", ".join(f"{FRIENDLY_LABELS.get(site['label'], site['label'])}: {site['url']}"
+                         for site in record.get('websites') or [])
+    return ", ".join([
+        f"Contact: {name or 'Unknown'}",
+        f"Email: {record.get('email')}",
+        f"Phone: {record.get('phone')}",
+        f"Job Title: {record.get('job_title')}",
+        f"Company: {record.get('company')}",
+        f"Websites: {websites or None}",
+    ])
+
+
+def _text(value: Any) -> Optional[str]:
+    if not isinstance(value, str) or not value.strip():
+        return None
+    return value.strip()
+
+
+def _websites(value: Any, email: Optional[str], company: Optional[str]) -> List[Dict[str, str]]:
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = [value]
+    websites = []
+    for item in value:
+        url, label = (item.get('url'), item.get('label')) if isinstance(item, dict) else (item, None)
+        if url and url.strip():
+            websites.append({'url': url.strip().lower(), 'label': label or website_label(url, email, company)})
+    return websites
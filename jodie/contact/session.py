@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# jodie/contact/session.py
+"""One Contacts framework store, set up once and reused.
+
+Opening a CNContactStore, checking authorization and looking up the
+default container each cost a trip into the Contacts daemon. A
+``ContactStoreSession`` does all three when it's created and keeps the
+results, so a long-running process (``jodie serve``, an import, a
+harvest) pays for them once rather than on every save.
+"""
+
+from typing import Any, List, Optional
+
+from Contacts import (CNAuthorizationStatusDenied, CNAuthorizationStatusNotDetermined,
+                      CNAuthorizationStatusRestricted, CNContactEmailAddressesKey, CNContactFamilyNameKey,
+                      CNContactFetchRequest, CNContactGivenNameKey, CNContactIdentifierKey,
+                      CNContactJobTitleKey, CNContactOrganizationNameKey, CNContactPhoneNumbersKey,
+                      CNContactStore, CNContactUrlAddressesKey, CNEntityTypeContacts, CNSaveRequest)
+
+from jodie.contact.backend import StorageError
+
+# Everything a record holds except the note, which needs an entitlement to read
+FETCH_KEYS = [CNContactIdentifierKey, CNContactGivenNameKey, CNContactFamilyNameKey,
+              CNContactEmailAddressesKey, CNContactPhoneNumbersKey, CNContactJobTitleKey,
+              CNContactOrganizationNameKey, CNContactUrlAddressesKey]
+
+# Just what jodie.contact.duplicates keys on, for building the duplicate index
+DUPLICATE_KEYS = [CNContactIdentifierKey, CNContactEmailAddressesKey, CNContactPhoneNumbersKey,
+                  CNContactUrlAddressesKey]
+
+NO_ACCESS = ("jodie can't access Contacts. Allow your terminal in System Settings > "
+             "Privacy & Security > Contacts.")
+
+
+class ContactStoreSession:
+    """A CNContactStore with its authorization status, default container
+    and fetch keys cached for the session's lifetime.
+
+    Args:
+        store: Existing CNContactStore to wrap; a new one is opened when omitted
+    """
+
+    def __init__(self, store: Any = None) -> None:
+        self.store = store if store is not None else CNContactStore.alloc().init()
+        self.authorization = CNContactStore.authorizationStatusForEntityType_(CNEntityTypeContacts)
+        self.container: Optional[str] = (self.store.defaultContainerIdentifier()
+                                         if self.authorized else None)
+        self.fetch_keys: List[Any] = list(FETCH_KEYS)
+        self.identifier_keys: List[Any] = [CNContactIdentifierKey]
+        self.duplicate_keys: List[Any] = list(DUPLICATE_KEYS)
+
+    @property
+    def authorized(self) -> bool:
+        """False once the user has denied (or policy restricts) access."""
+        return self.authorization not in (CNAuthorizationStatusDenied, CNAuthorizationStatusRestricted)
+
+    def add(self, contacts: List[Any]) -> None:
+        """Save new CNMutableContacts to the default container in one request."""
+        request = CNSaveRequest.alloc().init()
+        for contact in contacts:
+            request.addContact_toContainerWithIdentifier_(contact, self.container)
+        self.execute(request, f"save {len(contacts)} contacts")
+
+    def update(self, contact: Any) -> None:
+        """Save changes to a CNMutableContact copied from a fetched one."""
+        request = CNSaveRequest.alloc().init()
+        request.updateContact_(contact)
+        self.execute(request, "update contact")
+
+    def delete(self, contact: Any) -> None:
+        """Delete a fetched contact."""
+        request = CNSaveRequest.alloc().init()
+        request.deleteContact_(contact.mutableCopy())
+        self.execute(request, "delete contact")
+
+    def execute(self, request: Any, action: str = "save contacts") -> None:
+        """Run a CNSaveRequest on the session's store.
+
+        Raises:
+            StorageError: If access is denied or the request fails
+        """
+        self._require_access()
+        success, error = self.store.executeSaveRequest_error_(request, None)
+        if self.authorization == CNAuthorizationStatusNotDetermined:
+            # The first request prompted the user; remember their answer.
+            self._refresh_authorization()
+        if not success:
+            raise StorageError(f"Failed to {action}: {error}")
+
+    def fetch(self, identifier: str, keys: Optional[List[Any]] = None) -> Any:
+        """The unified contact with ``identifier``, or None."""
+        self._require_access()
+        contact, error = self.store.unifiedContactWithIdentifier_keysToFetch_error_(
+            identifier, keys or self.fetch_keys, None)
+        return contact
+
+    def enumerate(self, keys: Optional[List[Any]] = None) -> List[Any]:
+        """Every contact in the store, fetched with ``keys``."""
+        self._require_access()
+        found: List[Any] = []
+        request = CNContactFetchRequest.alloc().initWithKeysToFetch_(keys or self.fetch_keys)
+        success, error = self.store.enumerateContactsWithFetchRequest_error_usingBlock_(
+            request, None, lambda contact, stop: found.append(contact))
+        if not success:
+            raise StorageError(f"Failed to list contacts: {error}")
+        return found
+
+    def close(self) -> None:
+        """Drop the store; the session can't be used afterwards."""
+        self.store = None
+
+    def __enter__(self) -> "ContactStoreSession":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _require_access(self) -> None:
+        if self.store is None:
+            raise StorageError("Contact store session is closed")
+        if not self.authorized:
+            raise StorageError(NO_ACCESS)
+
+    def _refresh_authorization(self) -> None:
+        self.authorization = CNContactStore.authorizationStatusForEntityType_(CNEntityTypeContacts)
+        if self.authorized and self.container is None:
+            self.container = self.store.defaultContainerIdentifier()
+
+
+_shared: Optional[ContactStoreSession] = None
+
+
+def shared_session() -> ContactStoreSession:
+    """A process-wide session, opened on first use."""
+    global _shared
+    if _shared is None:
+        _shared = ContactStoreSession()
+    return _shared
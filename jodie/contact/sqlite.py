@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# jodie/contact/sqlite.py
+"""SQLite contact storage.
+
+One row per contact, holding the record as JSON. A batch is written in a
+single transaction, and the database runs in WAL mode so a reader (say, a
+second jodie process listing contacts) doesn't block a running import.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from jodie.contact.backend import ContactBackend, StorageError
+from jodie.contact.duplicates import apply_additions
+
+DB_FILE = "contacts.sqlite3"
+
+
+class SQLiteBackend(ContactBackend):
+    """Records in a SQLite file.
+
+    Args:
+        path: Database file; defaults to ``contacts.sqlite3`` in the user
+              data dir. ":memory:" keeps the database in this process.
+    """
+    name = "sqlite"
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, **options: Any) -> None:
+        if path is None:
+            from jodie.config import data_dir
+            path = data_dir() / DB_FILE
+        self.path = str(path)
+        self._lock = threading.Lock()
+        try:
+            if self.path != ":memory:":
+                Path(self.path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+                self.path = str(Path(self.path).expanduser())
+            self._db = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            with self._db:
+                self._db.execute("CREATE TABLE IF NOT EXISTS contacts (id TEXT PRIMARY KEY, "
+                                 "data TEXT NOT NULL, created REAL NOT NULL)")
+        except (OSError, sqlite3.Error) as e:
+            raise StorageError(f"Can't open contact database {self.path}: {e}") from e
+
+    def _write(self, records: List[Dict[str, Any]]) -> List[str]:
+        now = time.time()
+        rows = [(str(uuid.uuid4()).upper(), json.dumps(record, separators=(",", ":")), now)
+                for record in records]
+        try:
+            with self._lock, self._db:
+                self._db.executemany("INSERT INTO contacts (id, data, created) VALUES (?, ?, ?)", rows)
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to save contacts: {e}") from e
+        return [row[0] for row in rows]
+
+    def _update(self, identifier: str, additions: Dict[str, Any]) -> None:
+        try:
+            with self._lock, self._db:
+                row = self._db.execute("SELECT data FROM contacts WHERE id = ?", (identifier,)).fetchone()
+                if row is None:
+                    raise StorageError(f"Contact {identifier} no longer exists")
+                record = apply_additions(json.loads(row[0]), additions)
+                self._db.execute("UPDATE contacts SET data = ? WHERE id = ?",
+                                 (json.dumps(record, separators=(",", ":")), identifier))
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to update contact: {e}") from e
+
+    def fetch(self, identifier: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db.execute("SELECT data FROM contacts WHERE id = ?", (identifier,)).fetchone()
+        return {'id': identifier, **json.loads(row[0])} if row else None
+
+    def contacts(self) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            rows = self._db.execute("SELECT id, data FROM contacts ORDER BY created, rowid").fetchall()
+        for identifier, data in rows:
+            yield {'id': identifier, **json.loads(data)}
+
+    def _delete(self, identifier: str) -> bool:
+        with self._lock, self._db:
+            return self._db.execute("DELETE FROM contacts WHERE id = ?", (identifier,)).rowcount > 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -1,5 +1,9 @@
 from .clipboard import read_clipboard
 from .stdin import read_stdin
-from .signature import SignaturePreprocessor
+from .signature import SignatureLocator, SignaturePreprocessor
+from .records import detect_format, open_records, iter_records
+from .mailbox import iter_mailbox, SeenMessages
 
-__all__ = ['read_clipboard', 'read_stdin', 'SignaturePreprocessor']
+__all__ = ['read_clipboard', 'read_stdin', 'SignatureLocator', 'SignaturePreprocessor',
+           'detect_format', 'open_records', 'iter_records',
+           'iter_mailbox', 'SeenMessages']
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# jodie/input/mailbox.py
+"""Messages and their signatures from an mbox file or a Maildir.
+
+Files are memory-mapped and each message is scanned in place: only its
+headers and the tail of its plain-text body, where the signature sits,
+are decoded. ``SeenMessages`` records which Message-IDs a harvest has
+already processed.
+"""
+
+import hashlib
+import mmap
+import os
+import quopri
+import re
+from base64 import b64decode
+from binascii import Error as BinasciiError
+from dataclasses import dataclass
+from email.header import decode_header, make_header
+from email.parser import BytesHeaderParser
+from pathlib import Path
+from typing import Iterator, Optional, Set, Tuple, Union
+
+from jodie import metrics
+
+# Bytes kept from the end of a body when no "-- " delimiter is found.
+MAX_SIGNATURE_BYTES = 2048
+
+MBOX_SEPARATOR = b"\nFrom "
+# Body patterns start with a literal newline rather than ^ in MULTILINE
+# mode, which lets the regex engine skip ahead with a fast byte search.
+SIGNATURE_DELIMITER = re.compile(rb'\n-- ?\r?\n')
+# First line of quoted history; everything after it is someone else's mail.
+QUOTED_HISTORY = re.compile(
+    rb'\n(?:>|On [^\r\n]{0,300}wrote:\r?\n|-+ ?Original Message ?-+|From: |_{10,})'
+)
+HEADER_END = re.compile(rb'\r?\n\r?\n')
+
+# compat32 headers are plain strings; the default policy's structured
+# header objects cost more than the rest of the scan put together.
+_header_parser = BytesHeaderParser()
+
+
+@dataclass
+class HarvestedMessage:
+    """Signature region of one message plus the headers needed to use it."""
+    key: str
+    sender: Optional[str]
+    signature: str
+
+
+def iter_mailbox(path: Union[str, Path]) -> Iterator[HarvestedMessage]:
+    """Yield messages from an mbox file or a Maildir directory."""
+    path = Path(path)
+    if path.is_dir():
+        yield from metrics.counted(iter_maildir(path), 'maildir')
+    else:
+        yield from metrics.counted(iter_mbox(path), 'mbox')
+
+
+def iter_mbox(path: Union[str, Path]) -> Iterator[HarvestedMessage]:
+    """Scan an mbox file through a memory map, one message at a time.
+
+    Message boundaries are found with a byte search for ``\\nFrom `` lines;
+    only headers and the signature region of each body are ever decoded.
+    """
+    with _mapped(path) as buffer:
+        if buffer is None:
+            return
+        start = 0 if buffer[:5] == b"From " else buffer.find(MBOX_SEPARATOR)
+        while start != -1:
+            if buffer[start:start + 1] == b"\n":
+                start += 1
+            end = buffer.find(MBOX_SEPARATOR, start)
+            message_end = len(buffer) if end == -1 else end
+            # Skip the "From " envelope line itself.
+            body_start = buffer.find(b"\n", start, message_end)
+            if body_start != -1:
+                message = scan_message(buffer, body_start + 1, message_end)
+                if message:
+                    yield message
+            start = end
+
+
+def iter_maildir(path: Union[str, Path]) -> Iterator[HarvestedMessage]:
+    """Scan every message file under a Maildir's ``cur`` and ``new``."""
+    for folder in ('cur', 'new'):
+        directory = Path(path) / folder
+        if not directory.is_dir():
+            continue
+        for entry in sorted(os.scandir(directory), key=lambda item: item.name):
+            if not entry.is_file() or entry.name.startswith('.'):
+                continue
+            with _mapped(entry.path) as buffer:
+                if buffer is not None:
+                    message = scan_message(buffer, 0, len(buffer))
+                    if message:
+                        yield message
+
+
+def scan_message(buffer, start: int, end: int) -> Optional[HarvestedMessage]:
+    """Extract the signature region of a message stored at buffer[start:end].
+
+    Args:
+        buffer: bytes-like object (usually an mmap) holding the message
+        start: Offset of the first header line
+        end: Offset one past the last byte of the message
+
+    Returns:
+        HarvestedMessage, or None if the message has no text/plain body
+    """
+    header_end = HEADER_END.search(buffer, start, end)
+    if not header_end:
+        return None
+    header_bytes = bytes(buffer[start:header_end.start()])
+    headers = _header_parser.parsebytes(header_bytes)
+    key = (headers.get('Message-ID') or '').strip() or hashlib.sha1(header_bytes).hexdigest()
+
+    part = _text_part(buffer, headers, header_end.end(), end)
+    if part is None:
+        return None
+    part_headers, body_start, body_end = part
+
+    encoding = (part_headers.get('Content-Transfer-Encoding') or '').strip().lower()
+    charset = part_headers.get_content_charset() or 'utf-8'
+    if encoding == 'base64':
+        # base64 can't be cut mid-stream; decode the part, then locate.
+        try:
+            body = b"\n" + b64decode(bytes(buffer[body_start:body_end]))
+        except (BinasciiError, ValueError):
+            return None
+        region = body[slice(*signature_region(body, 1, len(body)))]
+    else:
+        region = bytes(buffer[slice(*signature_region(buffer, body_start, body_end))])
+        if encoding == 'quoted-printable':
+            region = quopri.decodestring(region)
+
+    try:
+        signature = region.decode(charset, errors='replace')
+    except LookupError:
+        signature = region.decode('utf-8', errors='replace')
+    return HarvestedMessage(key=key, sender=_decode_header(headers.get('From')), signature=signature)
+
+
+def signature_region(buffer, start: int, end: int) -> Tuple[int, int]:
+    """Bound the part of a body likely to hold the sender's signature.
+
+    The body is cut at the first line of quoted history, then narrowed to
+    what follows the last ``-- `` delimiter, or to the last
+    MAX_SIGNATURE_BYTES bytes (from a line start) when there is none.
+    ``buffer[start - 1]`` must be the newline that ends the line before the
+    body.
+    """
+    quoted = QUOTED_HISTORY.search(buffer, start - 1, end)
+    if quoted:
+        end = quoted.start() + 1
+
+    delimiter = None
+    for delimiter in SIGNATURE_DELIMITER.finditer(buffer, start - 1, end):
+        pass
+    if delimiter:
+        return delimiter.end(), end
+
+    if end - start > MAX_SIGNATURE_BYTES:
+        line_start = buffer.find(b"\n", end - MAX_SIGNATURE_BYTES, end)
+        start = end - MAX_SIGNATURE_BYTES if line_start == -1 else line_start + 1
+    return start, end
+
+
+def _text_part(buffer, headers, body_start: int, body_end: int):
+    """Find the first text/plain part, descending into multipart bodies."""
+    content_type = headers.get_content_type()
+    if content_type == 'text/plain':
+        return headers, body_start, body_end
+    if not content_type.startswith('multipart/'):
+        return None
+
+    boundary = headers.get_param('boundary')
+    if not boundary:
+        return None
+    marker = b"--" + str(boundary).encode('ascii', errors='ignore')
+    position = buffer.find(marker, body_start, body_end)
+    while position != -1:
+        part_start = buffer.find(b"\n", position, body_end)
+        if part_start == -1 or buffer[position + len(marker):position + len(marker) + 2] == b"--":
+            return None
+        part_start += 1
+        next_marker = buffer.find(marker, part_start, body_end)
+        part_end = body_end if next_marker == -1 else next_marker
+        header_end = HEADER_END.search(buffer, part_start, part_end)
+        if header_end:
+            part_headers = _header_parser.parsebytes(bytes(buffer[part_start:header_end.start()]))
+            found = _text_part(buffer, part_headers, header_end.end(), part_end)
+            if found:
+                return found
+        position = next_marker
+    return None
+
+
+def _decode_header(value: Optional[str]) -> Optional[str]:
+    """Decode RFC 2047 encoded-words (=?utf-8?q?...?=) in a header value."""
+    if not value:
+        return None
+    try:
+        return str(make_header(decode_header(value)))
+    except (LookupError, ValueError):
+        return value
+
+
+class _mapped:
+    """Context manager yielding a read-only mmap of a file, or None if empty."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = path
+        self._file = None
+        self._map = None
+
+    def __enter__(self) -> Optional[mmap.mmap]:
+        self._file = open(self.path, 'rb')
+        if os.fstat(self._file.fileno()).st_size == 0:
+            return None
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def __exit__(self, *exc_info) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+
+class SeenMessages:
+    """Append-only on-disk record of Message-IDs already harvested."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._seen: Set[str] = set()
+        if self.path.exists():
+            with open(self.path, encoding='utf-8') as handle:
+                self._seen.update(line.rstrip('\n') for line in handle if line.strip())
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._seen
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def add(self, keys) -> None:
+        """Record keys as processed and persist them immediately."""
+        new = [key for key in keys if key not in self._seen]
+        if not new:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as handle:
+            handle.writelines(key + '\n' for key in new)
+        self._seen.update(new)
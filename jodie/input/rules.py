@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# jodie/input/rules.py
+"""Named regex rules for signature preprocessing.
+
+``RuleSet`` tests a line against every noise or separator rule in one
+regex pass and counts which rule fired; ``user_rules`` reads the extra
+rules from the ``[preprocess]`` section of .jodierc.
+"""
+
+import re
+import sys
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Mapping, Match, Optional, Pattern, Tuple
+
+# Numbered or named backreferences; these would point at the wrong group
+# once the rule is wrapped in the combined alternation.
+BACKREFERENCE = re.compile(r'\\(?:[1-9]|g<)|\(\?P=|\(\?\(')
+
+
+class RuleSet:
+    """Named regex rules compiled into a single alternation.
+
+    Each rule becomes one branch of a combined pattern, so a line is tested
+    against every rule in one regex pass instead of one pass per rule. The
+    branch that matched tells which rule fired; rules earlier in the mapping
+    win ties. Hits are counted per rule name.
+
+    A rule that can't share the alternation (inline global flags such as
+    ``(?i)``, backreferences, named groups) is compiled on its own instead
+    and tried in its place in the priority order.
+    """
+
+    def __init__(self, rules: Mapping[str, str], flags: int = 0) -> None:
+        """
+        Args:
+            rules: Rule name -> regex pattern, in priority order
+            flags: re flags applied to every rule
+
+        Raises:
+            re.error: If a pattern does not compile
+        """
+        self.rules = dict(rules)
+        self.hits: Counter = Counter()
+        self._names: Dict[str, str] = {}
+        # (pattern, rule name) tried in priority order: alternations of
+        # combinable rules (name None; the branch tells) and the rules that
+        # had to be compiled on their own
+        self._patterns: List[Tuple[Pattern[str], Optional[str]]] = []
+        branches: List[str] = []
+        for name, pattern in self.rules.items():
+            try:
+                alone = re.compile(pattern, flags)
+            except re.error as e:
+                raise re.error(f"rule {name!r}: {e.msg}", pattern) from None
+            group = f"_rule{len(self._names)}"
+            branch = f"(?P<{group}>{pattern})"
+            if not alone.groupindex and not BACKREFERENCE.search(pattern):
+                try:
+                    re.compile('|'.join(branches + [branch]), flags)
+                except re.error:
+                    pass
+                else:
+                    self._names[group] = name
+                    branches.append(branch)
+                    continue
+            if branches:
+                self._patterns.append((re.compile('|'.join(branches), flags), None))
+                branches = []
+            self._patterns.append((alone, name))
+        if branches:
+            self._patterns.append((re.compile('|'.join(branches), flags), None))
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def match(self, text: str) -> Optional[str]:
+        """Return the name of the rule matching at the start of text, or None."""
+        for pattern, rule in self._patterns:
+            found = pattern.match(text)
+            if found:
+                name = rule or self._names[found.lastgroup]
+                self.hits[name] += 1
+                return name
+        return None
+
+    def split(self, text: str) -> List[str]:
+        """Split text wherever any rule matches, counting each split."""
+        parts: List[str] = []
+        start = 0
+        for found, name in self._finditer(text):
+            self.hits[name] += 1
+            parts.append(text[start:found.start()])
+            start = found.end()
+        parts.append(text[start:])
+        return parts
+
+    def _finditer(self, text: str) -> Iterator[Tuple[Match[str], str]]:
+        """(match, rule name) for each non-overlapping match, left to right."""
+        if len(self._patterns) == 1:
+            pattern, rule = self._patterns[0]
+            for found in pattern.finditer(text):
+                yield found, rule or self._names[found.lastgroup]
+            return
+        # Leftmost match across the patterns; the earlier pattern wins ties
+        pos = 0
+        while pos <= len(text):
+            candidates = [(found, rule) for found, rule in
+                          ((pattern.search(text, pos), rule) for pattern, rule in self._patterns) if found]
+            if not candidates:
+                return
+            found, rule = min(candidates, key=lambda candidate: candidate[0].start())
+            yield found, rule or self._names[found.lastgroup]
+            pos = found.end() + (found.end() == found.start())
+
+
+def user_rules(config: Mapping[str, Any], kind: str) -> Dict[str, str]:
+    """Read the ``[preprocess.<kind>]`` rules from a loaded config.
+
+    Rules whose pattern does not compile are skipped with a warning so a
+    typo in .jodierc doesn't stop parsing.
+    """
+    rules: Dict[str, str] = {}
+    for name, pattern in (config.get("preprocess", {}).get(kind) or {}).items():
+        try:
+            re.compile(str(pattern))
+        except re.error as e:
+            sys.stderr.write(f"Warning: Ignoring preprocess.{kind} rule {name!r}: {e}\n")
+            continue
+        rules[str(name)] = str(pattern)
+    return rules
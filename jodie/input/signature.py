@@ -1,55 +1,212 @@
 import re
-from typing import List
+from typing import Any, Dict, List, Optional
+
+from jodie import profiling
+
+from .rules import RuleSet, user_rules
+
+
+class SignatureLocator:
+    """Find the signature block at the end of a pasted message.
+
+    Pasted text is often a whole thread. The first line of quoted history is
+    found with one regex search, then lines are examined upwards from the
+    end of the newest message until a signature delimiter ("-- "), a
+    sign-off ("Best,"), or a line of prose. At most MAX_LINES lines are
+    examined, so the per-line work depends on the signature, not the thread.
+    """
+
+    # Lines examined from the end before giving up on finding a boundary
+    MAX_LINES = 40
+
+    # Longer lines are prose if they also read like a sentence: mostly
+    # lower-case words, or a sentence break inside. A title such as "Senior
+    # Vice President of Global Business Development, EMEA and APAC" is long
+    # but title-cased.
+    MAX_SIGNATURE_WORDS = 10
+
+    # Lines longer than this are prose whatever their shape
+    MAX_LINE_WORDS = 24
+
+    # A sentence ending followed by the start of another
+    SENTENCE_BREAK = re.compile(r'[a-z][.?!][ \t]+[A-Z]')
+
+    # Start of quoted or forwarded history; preceded by a newline so the
+    # search can skip ahead quickly instead of testing every position.
+    HISTORY = re.compile(
+        r'\n[ \t]*(?:>|On [^\n]{0,300}wrote:[ \t]*(?:\n|$)|-+ ?Original Message ?-+|From:[ \t]|_{10,})',
+        re.IGNORECASE,
+    )
+
+    DELIMITER = re.compile(r'^(?:--|[-_=*~]{3,})$')
+
+    SIGN_OFF = re.compile(
+        r'^(?:best|best regards|kind regards|warm regards|warmest regards|regards|warmly|'
+        r'thanks|thank you|many thanks|cheers|sincerely|yours truly|all the best|'
+        r'talk soon|take care)(?: so much| again| a lot| all)?[ \t]*[,.!\u2014-]*$',
+        re.IGNORECASE,
+    )
+
+    # Client-added lines under the signature
+    TRAILER = re.compile(r'^(?:sent from my |get outlook for )', re.IGNORECASE)
+
+    # Anything that looks like an email, URL or phone number
+    CONTACT_HINT = re.compile(r'@|https?://|www\.|\+\d|\d{3}\D{0,2}\d{3}\D?\d{4}')
+
+    # Trailing words that end in a period without ending a sentence
+    ABBREVIATIONS = {'inc', 'ltd', 'co', 'corp', 'llc', 'llp', 'jr', 'sr', 'phd', 'md', 'esq',
+                     'st', 'ave', 'rd', 'blvd', 'ste'}
+
+    @classmethod
+    def locate(cls, text: str) -> str:
+        """Return the signature block of a message (possibly all of it)."""
+        if not text:
+            return ''
+
+        history = cls.HISTORY.search(text)
+        # A header block at the very top is the message's own header.
+        while history and not text[:history.start()].strip():
+            history = cls.HISTORY.search(text, history.end())
+        end = history.start() if history else len(text)
+
+        block: List[str] = []
+        examined = 0
+        while end >= 0 and examined < cls.MAX_LINES:
+            start = text.rfind('\n', 0, end) + 1
+            line = text[start:end].strip()
+            end = start - 1
+            if not line:
+                continue
+            examined += 1
+            if cls.TRAILER.match(line):
+                continue
+            if cls.DELIMITER.match(line) or cls.SIGN_OFF.match(line):
+                if block:
+                    break
+                continue
+            if block and cls.is_prose(line):
+                break
+            block.append(line)
+
+        return '\n'.join(reversed(block))
+
+    @classmethod
+    def is_prose(cls, line: str) -> bool:
+        """True if a line reads like message text rather than contact details."""
+        if cls.CONTACT_HINT.search(line):
+            return False
+        words = line.split()
+        if len(words) > cls.MAX_LINE_WORDS:
+            return True
+        if len(words) > cls.MAX_SIGNATURE_WORDS:
+            lower = sum(1 for word in words if word[0].islower())
+            if lower * 2 > len(words) or cls.SENTENCE_BREAK.search(line):
+                return True
+        if line[-1] in '.?!:' and len(words) > 1:
+            return words[-1].rstrip('.').lower() not in cls.ABBREVIATIONS
+        return False
+
 
 class SignaturePreprocessor:
-    """Preprocess email signatures before parsing."""
-
-    # Noise patterns to filter out
-    NOISE_PATTERNS = [
-        r'^>.*$',           # Quoted replies
-        r'^On .* wrote:$',  # Forwarded headers
-        r'^-+\s*Original Message\s*-+$',
-        r'^From:.*$',
-        r'^Sent:.*$',
-        r'^To:.*$',
-        r'^Subject:.*$',
-    ]
+    """Preprocess email signatures before parsing.
+
+    Noise and separator rules are compiled once into a RuleSet each, from
+    the built-in rules below plus any under ``[preprocess.noise]`` and
+    ``[preprocess.separators]`` in .jodierc. Noise rules are matched at the
+    start of each line. ``rule_hits()`` reports how often each rule fired.
+    """
+
+    # Noise lines to filter out, by rule name
+    NOISE_RULES = {
+        'quoted_reply': r'^>.*$',
+        'reply_header': r'^On .* wrote:$',
+        'original_message': r'^-+\s*Original Message\s*-+$',
+        'from_header': r'^From:.*$',
+        'sent_header': r'^Sent:.*$',
+        'to_header': r'^To:.*$',
+        'subject_header': r'^Subject:.*$',
+    }
 
     # Pronouns to strip from names
     PRONOUNS = r'\s*\([^)]*(?:he|she|they|him|her|them)[^)]*\)\s*'
+    PRONOUN_PATTERN = re.compile(PRONOUNS, re.IGNORECASE)
+
+    # Common separators, by rule name
+    SEPARATOR_RULES = {
+        'bullets': r'[•·|–—]',
+    }
+
+    _noise: Optional[RuleSet] = None
+    _separators: Optional[RuleSet] = None
+    _pronoun_hits = 0
+
+    @classmethod
+    def configure(cls, config: Optional[Dict[str, Any]] = None) -> None:
+        """(Re)build the rule sets and reset hit counters.
 
-    # Common separators
-    SEPARATORS = r'[•·|–—]'
+        Args:
+            config: Loaded configuration; defaults to ``load_config()``
+        """
+        if config is None:
+            from jodie.config import load_config
+            config = load_config()
+        cls._noise = RuleSet({**cls.NOISE_RULES, **user_rules(config, 'noise')}, re.IGNORECASE)
+        cls._separators = RuleSet({**cls.SEPARATOR_RULES, **user_rules(config, 'separators')})
+        cls._pronoun_hits = 0
 
     @classmethod
-    def preprocess(cls, text: str) -> List[str]:
-        """Clean and split signature text into parseable tokens."""
+    def rule_hits(cls) -> Dict[str, int]:
+        """Hits per rule since the rules were configured.
+
+        Returns:
+            Dict keyed "noise.<name>", "separators.<name>" and "pronouns"
+        """
+        if cls._noise is None:
+            cls.configure()
+        hits = {f"noise.{name}": cls._noise.hits[name] for name in cls._noise.rules}
+        hits.update({f"separators.{name}": cls._separators.hits[name] for name in cls._separators.rules})
+        hits["pronouns"] = cls._pronoun_hits
+        return hits
+
+    @classmethod
+    def preprocess(cls, text: str, locate: bool = True) -> List[str]:
+        """Clean and split signature text into parseable tokens.
+
+        Args:
+            text: Signature, message or pasted thread
+            locate: Narrow the text to its signature block first
+
+        Returns:
+            List of cleaned lines and line parts
+        """
         if not text:
             return []
+        with profiling.timer("preprocess"):
+            return cls._preprocess(text, locate)
+
+    @classmethod
+    def _preprocess(cls, text: str, locate: bool) -> List[str]:
+        if locate:
+            with profiling.timer("preprocess.locate"):
+                text = SignatureLocator.locate(text)
+        if cls._noise is None:
+            cls.configure()
+        noise, separators = cls._noise, cls._separators
 
         lines = []
         for line in text.strip().split('\n'):
             line = line.strip()
 
-            # Skip empty lines
-            if not line:
-                continue
-
-            # Skip noise patterns
-            skip = False
-            for pattern in cls.NOISE_PATTERNS:
-                if re.match(pattern, line, re.IGNORECASE):
-                    skip = True
-                    break
-            if skip:
+            # Skip empty lines and noise
+            if not line or noise.match(line):
                 continue
 
             # Strip pronouns
-            line = re.sub(cls.PRONOUNS, '', line, flags=re.IGNORECASE)
+            line, stripped = cls.PRONOUN_PATTERN.subn('', line)
+            cls._pronoun_hits += stripped
 
-            # Split by common separators
-            parts = re.split(cls.SEPARATORS, line)
-            for part in parts:
+            # Split by separators
+            for part in separators.split(line):
                 part = part.strip()
                 if part:
                     lines.append(part)
@@ -1,7 +1,11 @@
 import sys
 
+from jodie import metrics
+
 def read_stdin() -> str:
     """Read from stdin (for heredoc/pipe)."""
     if sys.stdin.isatty():
         raise RuntimeError("No input provided via stdin")
-    return sys.stdin.read()
+    text = sys.stdin.read()
+    metrics.RECORDS_READ.inc('stdin')
+    return text
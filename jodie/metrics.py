@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# jodie/metrics.py
+"""Counters and latency histograms for unattended runs, in OpenMetrics text.
+
+Off by default, like ``jodie.profiling``; while off, updates return
+immediately. ``configure_metrics`` (the CLI's ``--metrics`` or
+``[metrics] path`` in ``.jodierc``) turns them on and names the file that
+``flush()`` rewrites after every import or harvest batch and at exit, for
+a node_exporter textfile collector or similar to pick up. ``render()``
+returns the same text on demand.
+
+Metrics cover the current process. Records parsed in ``--workers`` pool
+processes are counted when their results come back, but the stage
+latencies of those workers are not.
+"""
+
+import atexit
+import os
+import sys
+import threading
+from bisect import bisect_left
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+enabled = False
+
+_path: Optional[str] = None
+_exit_hook = False
+
+# Parse stages take microseconds; store calls take milliseconds to seconds.
+STAGE_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025,
+                 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+STORE_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Family:
+    """One named metric and its samples, keyed by label values."""
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        self._samples: Dict[Tuple[str, ...], Any] = {}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+    def _label_text(self, values: Tuple[str, ...], extra: str = "") -> str:
+        pairs = [f'{label}="{_escape(value)}"' for label, value in zip(self.labels, values)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {_escape(self.documentation)}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Family):
+    """Monotonic count, e.g. records parsed or saves by result."""
+    kind = "counter"
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        """Add ``amount`` to the sample for ``label_values``."""
+        if not enabled:
+            return
+        with self._lock:
+            self._samples[label_values] = self._samples.get(label_values, 0) + amount
+
+    def value(self, *label_values: str) -> float:
+        """Current count for ``label_values`` (0 if never incremented)."""
+        with self._lock:
+            return self._samples.get(label_values, 0)
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            samples = sorted(self._samples.items())
+        if not samples and not self.labels:
+            samples = [((), 0)]
+        for values, count in samples:
+            lines.append(f"{self.name}_total{self._label_text(values)} {_number(count)}")
+        return lines
+
+
+class Histogram(_Family):
+    """Distribution of durations in seconds over fixed bucket bounds."""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = STAGE_BUCKETS) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, seconds: float, *label_values: str) -> None:
+        """Record one observation for ``label_values``."""
+        if not enabled:
+            return
+        with self._lock:
+            sample = self._samples.get(label_values)
+            if sample is None:
+                # Per-bucket counts (the last one is +Inf), then the sum
+                sample = self._samples[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+            sample[0][bisect_left(self.buckets, seconds)] += 1
+            sample[1] += seconds
+
+    def time(self, *label_values: str) -> Any:
+        """Context manager observing how long its block takes."""
+        return Timer(self._observe_ns, *label_values) if enabled else NULL_TIMER
+
+    def _observe_ns(self, elapsed_ns: int, *label_values: str) -> None:
+        self.observe(elapsed_ns / 1e9, *label_values)
+
+    def count(self, *label_values: str) -> int:
+        """Number of observations for ``label_values``."""
+        with self._lock:
+            sample = self._samples.get(label_values)
+            return sum(sample[0]) if sample else 0
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            samples = sorted((values, (list(counts), total)) for values, (counts, total) in self._samples.items())
+        for values, (counts, total) in samples:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                bucket_labels = self._label_text(values, 'le="' + le + '"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_count{self._label_text(values)} {cumulative}")
+            lines.append(f"{self.name}_sum{self._label_text(values)} {_number(total)}")
+        return lines
+
+
+class Timer:
+    """Context manager calling ``record(elapsed_ns, *args)`` when its block ends.
+
+    Shared by histograms and ``jodie.profiling`` stage timers.
+    """
+    __slots__ = ("record", "args", "start")
+
+    def __init__(self, record: Callable[..., None], *args: Any) -> None:
+        self.record = record
+        self.args = args
+
+    def __enter__(self) -> "Timer":
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.record(perf_counter_ns() - self.start, *self.args)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+# Handed out instead of a Timer while timing is off
+NULL_TIMER = _NullTimer()
+
+
+class Registry:
+    """Ordered collection of metric families rendered together."""
+
+    def __init__(self) -> None:
+        self._families: Dict[str, _Family] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(name, documentation, labels))
+
+    def histogram(self, name: str, documentation: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = STAGE_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, documentation, labels, buckets))
+
+    def _add(self, family: Any) -> Any:
+        with self._lock:
+            if family.name in self._families:
+                raise ValueError(f"Metric {family.name!r} is already registered")
+            self._families[family.name] = family
+        return family
+
+    def reset(self) -> None:
+        """Zero every metric."""
+        for family in list(self._families.values()):
+            family.reset()
+
+    def render(self) -> str:
+        """All metrics in the OpenMetrics text format."""
+        lines: List[str] = []
+        for family in list(self._families.values()):
+            lines.extend(family.render())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+RECORDS_READ = REGISTRY.counter(
+    "jodie_records_read", "Input records read, by source.", ("source",))
+RECORDS_PARSED = REGISTRY.counter(
+    "jodie_records_parsed", "Records run through the contact parser.")
+FIELD_HITS = REGISTRY.counter(
+    "jodie_field_hits", "Parsed records with a value for each field.", ("field",))
+STAGE_SECONDS = REGISTRY.histogram(
+    "jodie_stage_duration_seconds", "Time spent per parse, preprocess and save stage.", ("stage",))
+SAVES = REGISTRY.counter(
+    "jodie_saves", "Contact saves, by result (saved, failed, invalid, duplicate).", ("result",))
+STORE_SECONDS = REGISTRY.histogram(
+    "jodie_store_duration_seconds", "Storage backend call latency, by operation.", ("operation",),
+    buckets=STORE_BUCKETS)
+
+
+def enable(on: bool = True) -> None:
+    """Turn metric updates on (or off); values collected so far are kept."""
+    global enabled
+    enabled = on
+
+
+def configure_metrics(config: Optional[Dict[str, Any]] = None, path: Optional[str] = None) -> None:
+    """Turn metrics on when a file to write them to is given.
+
+    Args:
+        config: Loaded jodie config; its [metrics] path is used when ``path`` is None
+        path: File to write OpenMetrics text to (the CLI's ``--metrics``)
+    """
+    global _path, _exit_hook
+    _path = path or ((config or {}).get("metrics") or {}).get("path") or None
+    if _path:
+        _path = os.path.expanduser(_path)
+        enable()
+        if not _exit_hook:
+            atexit.register(flush)
+            _exit_hook = True
+
+
+def observe_parse(fields: Optional[Dict[str, Any]]) -> None:
+    """Count one parsed record and the fields it produced."""
+    if not enabled or fields is None:
+        return
+    RECORDS_PARSED.inc()
+    for name, value in fields.items():
+        if value:
+            FIELD_HITS.inc(name)
+
+
+def counted(records: Iterable[Any], source: str) -> Iterator[Any]:
+    """Pass ``records`` through, counting each one as read from ``source``."""
+    for record in records:
+        RECORDS_READ.inc(source)
+        yield record
+
+
+def render() -> str:
+    """Current metrics as OpenMetrics text."""
+    return REGISTRY.render()
+
+
+def write(path: str) -> None:
+    """Atomically replace ``path`` with the current metrics."""
+    import tempfile
+
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temp_path = tempfile.mkstemp(dir=directory, prefix=".jodie-metrics-")
+    try:
+        with os.fdopen(handle, "w", encoding="utf-8") as output:
+            output.write(render())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def flush() -> None:
+    """Write metrics to the configured file, if any."""
+    if not (enabled and _path):
+        return
+    try:
+        write(_path)
+    except OSError as e:
+        sys.stderr.write(f"Warning: could not write metrics to {_path}: {e}\n")
+
+
+def reset() -> None:
+    """Zero every metric."""
+    REGISTRY.reset()
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if isinstance(value, int) or float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
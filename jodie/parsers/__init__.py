@@ -1,16 +1,33 @@
 #!/usr/bin/env python3
 # jodie/parsers/__init__.py
-from jodie.parsers.parsers import (
-    BaseParser,
-    EmailParser,
-    NameParser,
-    WebsiteParser,
-    TitleParser,
-    PhoneParser
-)
-from jodie.parsers.extractor import parse_contact_fields
-from jodie.parsers.base import ParseResult
-from jodie.parsers.pipeline import ParserPipeline
+#
+# Exports load on first access (PEP 562): importing one parser doesn't
+# import the batch pool, the segmenter or the pipeline.
+
+from importlib import import_module
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    "BaseParser": "parsers",
+    "EmailParser": "parsers",
+    "NameParser": "parsers",
+    "WebsiteParser": "parsers",
+    "TitleParser": "parsers",
+    "PhoneParser": "parsers",
+    "PhoneNumber": "phones",
+    "normalize_phone": "phones",
+    "scan_phones": "phones",
+    "parse_contact_fields": "extractor",
+    "extract_contact_fields": "extractor",
+    "Extraction": "extractor",
+    "parse_contact_fields_many": "batch",
+    "BatchResult": "batch",
+    "parse_contacts": "segmenter",
+    "split_contacts": "segmenter",
+    "ParseResult": "base",
+    "ParserPipeline": "pipeline",
+    "ParseSession": "session",
+}
 
 __all__ = (
     "BaseParser",
@@ -19,7 +36,30 @@ __all__ = (
     "WebsiteParser",
     "TitleParser",
     "PhoneParser",
+    "PhoneNumber",
+    "normalize_phone",
+    "scan_phones",
     "parse_contact_fields",
+    "extract_contact_fields",
+    "Extraction",
+    "parse_contact_fields_many",
+    "BatchResult",
+    "parse_contacts",
+    "split_contacts",
     "ParseResult",
-    "ParserPipeline"
+    "ParserPipeline",
+    "ParseSession"
 )
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'jodie.parsers' has no attribute {name!r}")
+    value = getattr(import_module(f"jodie.parsers.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -30,12 +30,16 @@ class BaseParser(ABC):
     """Abstract base class for all parsers.
 
     To create a new parser:
-    1. Create a new file in jodie/parsers/
-    2. Subclass BaseParser
-    3. Set name, priority, and field_name class attributes
-    4. Implement the parse() classmethod
+    1. Subclass BaseParser in your own package
+    2. Set name, priority, and field_name class attributes
+    3. Implement the parse() classmethod
+    4. Register it under the ``jodie.parsers`` entry point group, e.g.
+       ``[project.entry-points."jodie.parsers"] pronouns = "pkg:PronounParser"``
+    5. Enable it by name in the ``[parsers]`` section of .jodierc
 
-    Parsers are auto-discovered by the Pipeline.
+    Enabled parsers run in priority order alongside the built-in stages
+    (email 100, website 90, phone 80, title 60, name 50, company 40), on
+    the text earlier stages left unclaimed; see jodie.parsers.registry.
     """
     name: str = ""
     priority: int = 0  # Higher = runs first
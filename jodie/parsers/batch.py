@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# jodie/parsers/batch.py
+"""Batch parsing of many records over a process or thread pool."""
+
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from jodie import metrics
+
+from .cache import cache_settings, configure_cache
+from .extractor import parse_contact_fields
+from .inference import configure_inference
+from .registry import configure_stages
+from .titles import title_matcher
+
+DEFAULT_CHUNKSIZE = 64
+
+# Chunks kept in flight per worker; bounds memory when the input is a
+# stream much larger than what fits in RAM.
+PENDING_CHUNKS_PER_WORKER = 2
+
+
+@dataclass
+class BatchResult:
+    """Outcome of parsing one record in a batch.
+
+    Exactly one of ``fields`` and ``error`` is set, except for a None
+    record, which is passed over unparsed and has neither. ``error`` is a
+    string so results cross process boundaries without pickling exception
+    objects.
+    """
+    index: int
+    fields: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the record parsed without raising."""
+        return self.error is None
+
+
+def warm_up(settings: Optional[Dict[str, Any]] = None) -> None:
+    """Build parser lexicons once so per-record calls only do matching.
+
+    Args:
+        settings: Parse cache, parser and behavior config to install (in worker processes)
+    """
+    if settings:
+        configure_cache(settings)
+        configure_inference(settings)
+        configure_stages(settings)
+    title_matcher()
+
+
+def parse_contact_fields_many(
+    records: Iterable[Any],
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    threads: bool = False,
+) -> Iterator[BatchResult]:
+    """Parse many records, yielding results in input order.
+
+    Records are anything ``parse_contact_fields`` accepts (a string or a
+    list of strings), or None for a record the caller handles itself: it
+    gets a result, to keep the order, but is never sent to a worker. The
+    input is consumed lazily in chunks, so arbitrarily long streams can be
+    parsed with bounded memory.
+
+    Args:
+        records: Iterable of records to parse
+        workers: Number of pool workers; None or 1 parses in this process
+        chunksize: Records sent to a worker at a time
+        threads: Use a thread pool instead of a process pool
+
+    Yields:
+        BatchResult for every record, in the order records were given
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    chunks = _chunked(enumerate(records), chunksize)
+    if not workers or workers <= 1:
+        warm_up()
+        for chunk in chunks:
+            yield from _parse_chunk(chunk)
+        return
+
+    # Imported here: concurrent.futures.process pulls in multiprocessing,
+    # which single-process callers never need.
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    if threads:
+        pool = ThreadPoolExecutor(max_workers=workers, initializer=warm_up)
+    else:
+        # Worker processes get the parent's cache config; the cache itself
+        # (and its database connection) is never shared across processes.
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=warm_up,
+                                   initargs=(cache_settings(),))
+    with pool:
+        for result in _stream_ordered(pool, chunks, workers * PENDING_CHUNKS_PER_WORKER):
+            if not threads:
+                # Worker processes' counts stay in the workers; count here.
+                metrics.observe_parse(result.fields)
+            yield result
+
+
+def _stream_ordered(pool: Any, chunks: Iterator[List[Tuple[int, Any]]],
+                    max_pending: int) -> Iterator[BatchResult]:
+    pending = deque()
+    try:
+        for chunk in chunks:
+            # None records stay here; only real ones make the round trip.
+            records = [(index, record) for index, record in chunk if record is not None]
+            passed = [BatchResult(index=index) for index, record in chunk if record is None]
+            pending.append((pool.submit(_parse_chunk, records) if records else None, passed))
+            if len(pending) >= max_pending:
+                yield from _merged(*pending.popleft())
+        while pending:
+            yield from _merged(*pending.popleft())
+    finally:
+        # Consumer stopped early: don't parse chunks nobody will read.
+        for future, _ in pending:
+            if future is not None:
+                future.cancel()
+
+
+def _merged(future: Any, passed: List[BatchResult]) -> List[BatchResult]:
+    parsed = future.result() if future is not None else []
+    return sorted(parsed + passed, key=lambda result: result.index) if passed else parsed
+
+
+def _chunked(items: Iterable[Tuple[int, Any]], size: int) -> Iterator[List[Tuple[int, Any]]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _parse_chunk(chunk: List[Tuple[int, Any]]) -> List[BatchResult]:
+    results = []
+    for index, record in chunk:
+        if record is None:
+            results.append(BatchResult(index=index))
+            continue
+        try:
+            results.append(BatchResult(index=index, fields=parse_contact_fields(record)))
+        except Exception as e:
+            results.append(BatchResult(index=index, error=f"{type(e).__name__}: {e}"))
+    return results
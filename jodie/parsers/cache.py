@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+# jodie/parsers/cache.py
+"""Content-addressed cache of parse results.
+
+Results are keyed by a hash of the normalized input segments plus a parser
+version, which hashes the parser source, the constants it reads and the
+parsing-related config, and a digest of the stage and inference setup in
+effect when the key is made, so reconfiguring them without a new cache
+(``configure_stages``, ``configure_inference``) is covered too. Editing any
+of those changes every key, so stale entries are never read; they simply
+age out.
+
+An in-process LRU is always on. A persistent SQLite tier under the user
+cache dir can be enabled with ``configure_cache`` (the CLI does so from the
+``[cache]`` section of .jodierc) and is trimmed to a size budget by least
+recent use.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+DEFAULT_MEMORY_ENTRIES = 1024
+DEFAULT_MAX_MB = 32
+DB_FILE = "parse-cache.sqlite3"
+
+# Config sections that change parse output
+VERSION_CONFIG_SECTIONS = ("parsers", "behavior")
+
+_MISSING = object()
+
+# Digest of the live stage and inference setup; None until next needed
+_setup: Optional[str] = None
+
+
+@lru_cache(maxsize=None)
+def _source_digest() -> str:
+    package = Path(__file__).resolve().parent
+    digest = hashlib.sha256()
+    for path in sorted(package.glob("*.py")) + [package.parent / "constants.py"]:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def parser_version(config: Optional[Dict[str, Any]] = None) -> str:
+    """Hash of everything that determines parse output.
+
+    Args:
+        config: Loaded configuration; only parsing-related sections count
+
+    Returns:
+        Hex digest to mix into cache keys
+    """
+    digest = hashlib.sha256(_source_digest().encode())
+    if config:
+        from .registry import plugin_versions
+
+        relevant = {name: config.get(name) for name in VERSION_CONFIG_SECTIONS}
+        relevant["plugins"] = plugin_versions(config)
+        digest.update(json.dumps(relevant, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def setup_changed() -> None:
+    """Note that the stage or inference setup changed, so keys change too."""
+    global _setup
+    _setup = None
+
+
+def setup_digest() -> str:
+    """Hash of the stage and inference setup in effect."""
+    global _setup
+    if _setup is None:
+        from .inference import inference_settings
+        from .registry import stage_settings
+
+        live = {"parsers": stage_settings(), "behavior": inference_settings()}
+        _setup = hashlib.sha256(json.dumps(live, sort_keys=True, default=str).encode()).hexdigest()
+    return _setup
+
+
+class ParseCache:
+    """Two-tier cache: bounded in-memory LRU, optional SQLite store.
+
+    Values must be JSON-serializable. Disk writes are buffered and flushed
+    in one short transaction every FLUSH_EVERY entries (and on ``flush`` or
+    ``close``), so worker processes sharing the database rarely wait on
+    each other. Disk errors disable the persistent tier with a warning
+    rather than failing the parse.
+    """
+
+    FLUSH_EVERY = 64
+
+    def __init__(self, memory_entries: int = DEFAULT_MEMORY_ENTRIES, path: Optional[Path] = None,
+                 max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024, version: str = "") -> None:
+        self.memory_entries = memory_entries
+        self.path = Path(path) if path else None
+        self.max_bytes = max_bytes
+        self.version = version or parser_version()
+        self.hits = self.misses = 0
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self._db_bytes = 0
+        self._writes: Dict[str, Tuple[str, int]] = {}
+        self._touched: Dict[str, float] = {}
+        self._pid = os.getpid()
+        if self.path:
+            self._open()
+
+    def key(self, namespace: str, segments: Iterable[str]) -> str:
+        """Cache key for a namespace ("fields", "pipeline") and input segments."""
+        digest = hashlib.sha256(f"{namespace}\0{self.version}\0{setup_digest()}\0".encode())
+        digest.update("\n".join(segments).encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Look a key up in memory, then on disk."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+            value = self._disk_get(key)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._remember(key, value)
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value in both tiers."""
+        with self._lock:
+            self._remember(key, value)
+            self._disk_put(key, value)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing and storing it on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def flush(self) -> None:
+        """Write buffered entries to the persistent tier."""
+        with self._lock:
+            self._flush()
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._writes.clear()
+            self._touched.clear()
+            if self._db is not None:
+                with self._db:
+                    self._db.execute("DELETE FROM entries")
+                self._db_bytes = 0
+
+    def close(self) -> None:
+        """Flush and close the persistent tier, if open."""
+        with self._lock:
+            self._flush()
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _open(self) -> None:
+        try:
+            import sqlite3
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            with self._db:
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, "
+                    "value TEXT NOT NULL, size INTEGER NOT NULL, used REAL NOT NULL)"
+                )
+                self._db.execute("CREATE INDEX IF NOT EXISTS entries_used ON entries (used)")
+            self._db_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        except Exception as e:
+            self._disable(e)
+
+    def _disk_get(self, key: str) -> Any:
+        if self._db is None:
+            return _MISSING
+        if key in self._writes:
+            return json.loads(self._writes[key][0])
+        try:
+            row = self._db.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        except Exception as e:
+            self._disable(e)
+            return _MISSING
+        if row is None:
+            return _MISSING
+        self._touched[key] = time.time()
+        return json.loads(row[0])
+
+    def _disk_put(self, key: str, value: Any) -> None:
+        if self._db is None:
+            return
+        encoded = json.dumps(value, separators=(",", ":"))
+        self._writes[key] = (encoded, len(key) + len(encoded))
+        if len(self._writes) + len(self._touched) >= self.FLUSH_EVERY:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._db is None or not (self._writes or self._touched):
+            return
+        now = time.time()
+        try:
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO entries (key, value, size, used) VALUES (?, ?, ?, ?)",
+                    [(key, encoded, size, now) for key, (encoded, size) in self._writes.items()],
+                )
+                self._db.executemany("UPDATE entries SET used = ? WHERE key = ?",
+                                     [(used, key) for key, used in self._touched.items()])
+                self._db_bytes += sum(size for _, size in self._writes.values())
+                if self._db_bytes > self.max_bytes:
+                    self._evict()
+        except Exception as e:
+            self._disable(e)
+        self._writes.clear()
+        self._touched.clear()
+
+    def _evict(self) -> None:
+        # Trim to 90% of the budget so eviction doesn't run on every flush.
+        target = self.max_bytes * 0.9
+        rows = self._db.execute("SELECT key, size FROM entries ORDER BY used").fetchall()
+        total = sum(size for _, size in rows)
+        doomed = []
+        for key, size in rows:
+            if total <= target:
+                break
+            doomed.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM entries WHERE key = ?", doomed)
+        self._db_bytes = total
+
+    def _disable(self, error: Exception) -> None:
+        sys.stderr.write(f"Warning: Parse cache at {self.path} disabled: {error}\n")
+        if self._db is not None:
+            try:
+                self._db.close()
+            except Exception:
+                pass
+        self._db = None
+
+
+_cache: Optional[ParseCache] = None
+_settings: Dict[str, Any] = {}
+
+
+def copy_value(value: Any) -> Any:
+    """Copy a cached value's lists and dicts, all the way down.
+
+    Cached values are JSON-shaped, so this is a cheaper ``copy.deepcopy``;
+    callers get something they can modify without touching the entry.
+    """
+    if isinstance(value, list):
+        return [copy_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: copy_value(item) for key, item in value.items()}
+    return value
+
+
+def configure_cache(config: Optional[Dict[str, Any]] = None) -> Optional[ParseCache]:
+    """Install the process-wide cache from the ``[cache]`` config section.
+
+    Args:
+        config: Loaded configuration; None restores the memory-only default
+
+    Returns:
+        The new cache, or None if caching is disabled
+    """
+    global _cache, _settings
+    from jodie.config import DEFAULT_CONFIG, cache_dir
+
+    config = config or DEFAULT_CONFIG
+    settings = {**DEFAULT_CONFIG["cache"], **(config.get("cache") or {})}
+    if _cache is not None and _cache._pid == os.getpid():
+        # A forked worker must not close the parent's database connection.
+        _cache.close()
+    _settings = {"cache": settings, **{name: config.get(name) for name in VERSION_CONFIG_SECTIONS}}
+    if not settings.get("enabled", True):
+        _cache = None
+        return None
+
+    path = None
+    if settings.get("persistent"):
+        path = Path(settings.get("path") or cache_dir() / DB_FILE)
+    _cache = ParseCache(
+        memory_entries=int(settings.get("memory_entries", DEFAULT_MEMORY_ENTRIES)),
+        path=path,
+        max_bytes=int(float(settings.get("max_mb", DEFAULT_MAX_MB)) * 1024 * 1024),
+        version=parser_version(config),
+    )
+    if path:
+        atexit.register(_cache.close)
+    return _cache
+
+
+def cache_settings() -> Dict[str, Any]:
+    """Config that recreates the current cache, e.g. in worker processes."""
+    return dict(_settings)
+
+
+def active_cache() -> Optional[ParseCache]:
+    """The process-wide cache, created memory-only on first use."""
+    if _cache is None and not _settings:
+        configure_cache()
+    return _cache
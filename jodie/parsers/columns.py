@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# jodie/parsers/columns.py
+"""Column-to-field mapping for tabular contact data.
+
+Structured exports (CRM CSVs, LinkedIn connections) put the same field in
+the same column on every row. Instead of running the free-text heuristics on
+every row, a sample of rows is parsed with ``extract_contact_fields`` and
+the field spans are attributed back to the cells they came from. The
+winning column for each field is then applied to every row with only a
+light per-cell check.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from .extractor import extract_contact_fields
+from .parsers import EmailParser, NameParser, PhoneParser
+
+# Column header (normalized) -> contact field
+COLUMN_ALIASES = {
+    'first_name': 'first_name', 'first': 'first_name', 'firstname': 'first_name',
+    'given_name': 'first_name',
+    'last_name': 'last_name', 'last': 'last_name', 'lastname': 'last_name',
+    'surname': 'last_name', 'family_name': 'last_name',
+    'full_name': 'full_name', 'name': 'full_name',
+    'email': 'email', 'email_address': 'email', 'e_mail': 'email',
+    'phone': 'phone', 'phone_number': 'phone', 'mobile': 'phone',
+    'job_title': 'job_title', 'title': 'job_title', 'position': 'job_title',
+    'company': 'company', 'organization': 'company', 'organisation': 'company',
+    'websites': 'websites', 'website': 'websites', 'url': 'websites',
+    'linkedin': 'linkedin',
+    'note': 'note', 'notes': 'note',
+}
+
+# Fields that more than one column may feed.
+MULTI_COLUMN_FIELDS = frozenset({'websites'})
+
+# Share of a column's non-empty sampled cells that must agree on a field.
+MIN_AGREEMENT = 0.5
+
+# Share of a cell a field's span must cover for the cell to vote for it;
+# cells holding several fields (free-text rows) don't describe a column.
+MIN_COVERAGE = 0.8
+
+EXPLICIT = "explicit"
+HEADER = "header"
+INFERRED = "inferred"
+
+
+@dataclass
+class ColumnMapping:
+    """Which column feeds which contact field, and why.
+
+    ``fields`` is the mapping that gets applied; ``sources`` says whether
+    each entry came from an explicit override, the header name, or the
+    sampled values; ``inferred`` keeps what the sample alone suggested so
+    overrides can be shown next to it.
+    """
+    fields: Dict[str, str] = field(default_factory=dict)
+    sources: Dict[str, str] = field(default_factory=dict)
+    inferred: Dict[str, str] = field(default_factory=dict)
+    columns: List[str] = field(default_factory=list)
+    sampled: int = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.fields)
+
+
+def normalize_column(name: str) -> str:
+    """Normalize a header like "First Name" to "first_name"."""
+    return '_'.join(name.strip().lower().replace('-', ' ').split())
+
+
+def infer_column_mapping(rows: Sequence[Mapping[str, Any]],
+                         explicit: Optional[Dict[str, str]] = None) -> ColumnMapping:
+    """Work out the column mapping from a sample of rows.
+
+    Args:
+        rows: Sampled rows (column -> cell text)
+        explicit: column -> field overrides, applied last
+
+    Returns:
+        ColumnMapping combining overrides, header names and inferred fields
+    """
+    columns: List[str] = []
+    for row in rows:
+        for column, value in row.items():
+            if isinstance(value, str) and column not in columns:
+                columns.append(column)
+
+    votes = {column: Counter() for column in columns}
+    filled: Counter = Counter()
+    for row in rows:
+        present = [column for column in columns if row.get(column) and isinstance(row[column], str)]
+        cells = [" ".join(row[column].split()) for column in present]
+        extraction = extract_contact_fields(cells)
+        if len(extraction.segments) != len(cells):
+            # A cell vanished during normalization; offsets won't line up.
+            continue
+        filled.update(present)
+
+        def covers(index: int, start: int, end: int) -> bool:
+            segment_start, segment_end = extraction.segments[index]
+            overlap = min(end, segment_end) - max(start, segment_start)
+            return overlap >= MIN_COVERAGE * (segment_end - segment_start)
+
+        for field_name, spans in extraction.spans.items():
+            if field_name in ("last_name", "phones"):
+                continue  # share their spans with first_name and phone
+            for start, end in spans:
+                first = extraction.segment_at(start)
+                last = extraction.segment_at(end - 1)
+                if first is None or last is None or not covers(first, start, end):
+                    continue
+                if first == last:
+                    votes[present[first]]["full_name" if field_name == "first_name" else field_name] += 1
+                elif field_name == "first_name" and last == first + 1 and covers(last, start, end):
+                    votes[present[first]]["first_name"] += 1
+                    votes[present[last]]["last_name"] += 1
+
+    mapping = ColumnMapping(columns=columns, sampled=len(rows))
+    candidates = sorted(
+        ((count, column, field_name)
+         for column in columns for field_name, count in votes[column].items()
+         if count >= MIN_AGREEMENT * filled[column]),
+        key=lambda candidate: -candidate[0],
+    )
+    for _, column, field_name in candidates:
+        if column in mapping.inferred:
+            continue
+        if field_name not in MULTI_COLUMN_FIELDS and field_name in mapping.inferred.values():
+            continue
+        mapping.inferred[column] = field_name
+
+    explicit = explicit or {}
+    for column in columns + [column for column in explicit if column not in columns]:
+        if column in explicit:
+            mapping.fields[column], mapping.sources[column] = explicit[column], EXPLICIT
+        elif normalize_column(column) in COLUMN_ALIASES:
+            mapping.fields[column], mapping.sources[column] = COLUMN_ALIASES[normalize_column(column)], HEADER
+        elif column in mapping.inferred:
+            mapping.fields[column], mapping.sources[column] = mapping.inferred[column], INFERRED
+
+    # A field claimed by an override or header beats one inferred elsewhere.
+    claimed = {field_name for column, field_name in mapping.fields.items()
+               if mapping.sources[column] != INFERRED}
+    for column in list(mapping.fields):
+        field_name = mapping.fields[column]
+        if (mapping.sources[column] == INFERRED and field_name in claimed
+                and field_name not in MULTI_COLUMN_FIELDS):
+            del mapping.fields[column]
+            del mapping.sources[column]
+
+    return mapping
+
+
+def apply_column_mapping(row: Mapping[str, Any], mapping: ColumnMapping) -> Dict[str, str]:
+    """Read a row through the mapping, validating email and phone cells.
+
+    Returns:
+        Dict of field -> value for cells that passed validation
+    """
+    fields: Dict[str, str] = {}
+    for column, field_name in mapping.fields.items():
+        value = row.get(column)
+        if not value:
+            continue
+        if isinstance(value, list):
+            value = ', '.join(value)
+        value = value.strip()
+
+        if field_name == 'email':
+            value = EmailParser.parse(value)
+        elif field_name == 'phone':
+            value = PhoneParser.parse(value)
+        if not value:
+            continue
+
+        if field_name in MULTI_COLUMN_FIELDS and field_name in fields:
+            fields[field_name] += ', ' + value
+        elif field_name not in fields:
+            fields[field_name] = value
+    return fields
+
+
+def split_full_name(fields: Dict[str, str]) -> Dict[str, str]:
+    """Fill first/last name from a full-name cell when they are missing."""
+    full_name = fields.get('full_name')
+    if full_name and not (fields.get('first_name') and fields.get('last_name')):
+        first, last = NameParser.parse(full_name)
+        fields.setdefault('first_name', first)
+        fields.setdefault('last_name', last)
+    return fields
@@ -2,118 +2,203 @@
 # jodie/parsers/extractor.py
 """Contact field extraction shared by CLI auto mode and parser pipeline."""
 
-import re
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from bisect import bisect_right
+from time import perf_counter_ns
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 
-from jodie.constants import WEBMAIL_DOMAINS
-from .parsers import EmailParser, NameParser, PhoneParser, TitleParser, WebsiteParser
+from jodie import metrics, profiling
 
+from .cache import active_cache, copy_value
+from .inference import confidence_threshold, infer_missing
+from .lexer import WORD, TokenBuffer
+from .registry import active_stages, disabled_fields, disabled_token_kinds
 
-EMAIL_PATTERN = re.compile(
-    r'<(\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)>'
-    r'|(\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)'
-)
-WEBSITE_PATTERN = re.compile(r'https?://[^\s]+|www\.[^\s]+', re.IGNORECASE)
-PHONE_PATTERNS = [
-    re.compile(r'\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b'),
-    re.compile(r'\b[0-9]{10}\b'),
-    re.compile(r'\+?[0-9]{1,3}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{3,4}\b'),
-]
 
-BUSINESS_TERMS = {
-    "inc", "inc.", "llc", "ltd", "ltd.", "corp", "corp.", "corporation",
-    "co", "co.", "company", "technologies", "technology", "systems", "labs",
-    "studio", "studios", "group", "partners", "ventures", "capital"
-}
+Span = Tuple[int, int]
+
+
+@dataclass
+class Extraction:
+    """Extracted fields plus the character spans each one was read from.
+
+    Spans are offsets into ``text``, the whitespace-normalized join of the
+    input segments; ``segments`` holds each segment's own span. Inferred
+    fields (e.g. company from the email domain) have no span; ``inferred``
+    names the rule that filled them. ``confidence`` scores every field.
+    """
+    fields: Dict[str, Any]
+    text: str
+    spans: Dict[str, List[Span]] = field(default_factory=dict)
+    segments: List[Span] = field(default_factory=list)
+    confidence: Dict[str, float] = field(default_factory=dict)
+    inferred: Dict[str, str] = field(default_factory=dict)
+
+    def consumed_text(self, field_name: str) -> str:
+        """Return the source text a field was extracted from."""
+        return " ".join(self.text[start:end] for start, end in self.spans.get(field_name, []))
+
+    def segment_at(self, offset: int) -> Optional[int]:
+        """Return the index of the segment containing a text offset."""
+        index = bisect_right(self.segments, (offset, len(self.text) + 1)) - 1
+        if index >= 0 and self.segments[index][0] <= offset < self.segments[index][1]:
+            return index
+        return None
 
 
 def parse_contact_fields(arguments: Any) -> Dict[str, Any]:
-    """Extract contact fields from text independent of shell argument shape."""
-    segments = _normalize_arguments(arguments)
-    fields: Dict[str, Any] = {
-        "first_name": None,
-        "last_name": None,
-        "email": None,
-        "phone": None,
-        "job_title": None,
-        "company": None,
-        "websites": [],
-        "note": None,
-    }
-
-    working = _join_segments(segments)
-    consumed_texts: List[str] = []
-
-    email_match = EMAIL_PATTERN.search(working)
-    if email_match:
-        email_text = next((part for part in email_match.groups() if part), email_match.group(0))
-        fields["email"] = EmailParser.parse(email_match.group(0)) or email_text
-
-        name_candidate = _name_before_email(working[:email_match.start()])
-        if name_candidate:
-            first_name, last_name, consumed_name = name_candidate
-            fields["first_name"] = first_name
-            fields["last_name"] = last_name
-            working = _remove_first(working, consumed_name)
-            consumed_texts.append(consumed_name)
-
-        working = _remove_first(working, email_match.group(0))
-        consumed_texts.append(email_match.group(0))
-
-    while True:
-        website_match = WEBSITE_PATTERN.search(working)
-        if not website_match:
-            break
-        website = WebsiteParser.parse(website_match.group(0))
-        if website:
-            fields["websites"].append(website)
-        working = _remove_first(working, website_match.group(0))
-        consumed_texts.append(website_match.group(0))
-
-    if not fields["phone"]:
-        phone_match = _find_phone_match(working)
-        if phone_match:
-            phone = PhoneParser.parse(phone_match.group(0))
-            if phone:
-                fields["phone"] = phone
-                working = _remove_first(working, phone_match.group(0))
-                consumed_texts.append(phone_match.group(0))
-
-    if not fields["job_title"]:
-        title_match = _find_title_match(working)
-        if title_match:
-            title, consumed_title = title_match
-            fields["job_title"] = title
-            working = _remove_first(working, consumed_title)
-            consumed_texts.append(consumed_title)
-
-    residual_segments = _residual_segments(segments, consumed_texts)
-
-    if not fields["first_name"]:
-        name_candidate = _pick_name_segment(residual_segments)
-        if name_candidate:
-            first_name, last_name, consumed_name = name_candidate
-            fields["first_name"] = first_name
-            fields["last_name"] = last_name
-            working = _remove_first(working, consumed_name)
-            consumed_texts.append(consumed_name)
-
-    if not fields["first_name"]:
-        split_fields = _split_name_company(_clean_text(working))
-        if split_fields:
-            first_name, last_name, company_name = split_fields
-            fields["first_name"] = first_name
-            fields["last_name"] = last_name
-            fields["company"] = company_name
-
-    company = _company_from_residual(working, fields["websites"])
-    if not fields["company"] and company:
-        fields["company"] = company
-
-    if not fields["company"] and fields["email"]:
-        fields["company"] = _company_from_email(fields["email"])
-
-    return fields
+    """Extract contact fields from text independent of shell argument shape.
+
+    Results are cached by normalized input; see ``jodie.parsers.cache``.
+    """
+    with profiling.timer("parse_contact_fields"):
+        segments = normalize_segments(arguments)
+        cache = active_cache()
+        if cache is None:
+            fields = extract_contact_fields(segments).fields
+            metrics.observe_parse(fields)
+            return fields
+        fields = cache.get_or_compute(cache.key("fields", segments),
+                                      lambda: extract_contact_fields(segments).fields)
+    metrics.observe_parse(fields)
+    # Callers may modify what they get back, phones' dicts included; the
+    # cached copy must not change.
+    return copy_value(fields)
+
+
+def normalize_segments(arguments: Any) -> List[str]:
+    """Split input into the whitespace-collapsed segments the parser sees.
+
+    Inputs that normalize to the same segments parse identically.
+    """
+    return [" ".join(segment.split()) for segment in _normalize_arguments(arguments)]
+
+
+def extract_contact_fields(arguments: Any) -> Extraction:
+    """Extract contact fields along with the spans they were read from.
+
+    The input is tokenized once; the enabled stages (see
+    ``jodie.parsers.registry``) run in priority order, each claiming tokens
+    by marking their spans consumed, so later stages only see what is left.
+    A stage is skipped once the fields it reads are at the confidence
+    threshold, and the text stages (title, name, company) are skipped
+    entirely when no words are left. Missing fields are then inferred
+    lazily from the ones found; see ``jodie.parsers.inference``.
+    """
+    with profiling.timer("parse.tokenize"):
+        buffer = TokenBuffer(_normalize_arguments(arguments))
+    return extract_from_buffer(buffer)
+
+
+def extract_from_buffer(buffer: TokenBuffer, memo: Optional[Dict[str, Any]] = None) -> Extraction:
+    """Run the enabled stages and inference over an already tokenized input.
+
+    Args:
+        buffer: Tokenized input segments; consumed as stages claim text
+        memo: Per-segment results to reuse across calls (see
+            ``jodie.parsers.session``); None computes everything afresh
+
+    Returns:
+        Extraction for the buffer's text
+    """
+    state = ExtractionState(buffer, memo)
+    for kind in disabled_token_kinds():
+        # Keep what a disabled stage would have read out of other fields.
+        for token in list(buffer.unconsumed(kind)):
+            buffer.consume(token.start, token.end)
+
+    if profiling.timing():
+        return _extract_profiled(state)
+
+    for stage in active_stages():
+        if getattr(stage, "needs_words", True) and buffer.first(WORD) is None:
+            continue
+        stage.run(state)
+
+    inferred = infer_missing(state.fields, state.confidence, skip=state.disabled)
+    return _extraction(state, inferred)
+
+
+def _extract_profiled(state: "ExtractionState") -> Extraction:
+    """``extract_from_buffer`` with per-stage timers and field sources."""
+    sources: Dict[str, str] = {}
+    # Field sources are only reported by profiling, not by metrics
+    track_sources = profiling.enabled
+    for stage in active_stages():
+        if getattr(stage, "needs_words", True) and state.buffer.first(WORD) is None:
+            continue
+        before = dict(state.confidence) if track_sources else {}
+        start = perf_counter_ns()
+        stage.run(state)
+        profiling.record(f"parse.{stage.name}", perf_counter_ns() - start)
+        if track_sources:
+            for field_name, score in state.confidence.items():
+                if before.get(field_name) != score:
+                    sources[field_name] = stage.name
+
+    with profiling.timer("parse.inference"):
+        inferred = infer_missing(state.fields, state.confidence, skip=state.disabled)
+    if not track_sources:
+        return _extraction(state, inferred)
+    sources.update((field_name, f"inference.{rule}") for field_name, rule in inferred.items())
+    for field_name, stage_name in sources.items():
+        if state.fields.get(field_name) not in (None, [], ""):
+            profiling.record_source(field_name, stage_name)
+    return _extraction(state, inferred)
+
+
+def _extraction(state: "ExtractionState", inferred: Dict[str, str]) -> Extraction:
+    buffer = state.buffer
+    return Extraction(fields=state.fields, text=buffer.text, spans=state.spans, segments=buffer.segments,
+                      confidence=state.confidence, inferred=inferred)
+
+
+class ExtractionState:
+    """Working state shared by the stages of one extraction.
+
+    Stages write ``fields`` and call ``claim`` for the text they read, so
+    later stages no longer see it, and ``wanted`` to ask whether a field
+    can still be improved at a given confidence. ``memo``, when set, holds
+    results keyed by segment text that stay valid from one call to the next.
+    """
+
+    def __init__(self, buffer: TokenBuffer, memo: Optional[Dict[str, Any]] = None) -> None:
+        self.buffer = buffer
+        self.memo = memo
+        self.fields: Dict[str, Any] = {
+            "first_name": None,
+            "last_name": None,
+            "email": None,
+            "phone": None,
+            "job_title": None,
+            "company": None,
+            "websites": [],
+            "phones": [],
+            "note": None,
+        }
+        self.spans: Dict[str, List[Span]] = {}
+        self.confidence: Dict[str, float] = {}
+        self.threshold = confidence_threshold()
+        self.disabled = disabled_fields()
+
+    def claim(self, field_names: Tuple[str, ...], start: int, end: int, score: float) -> None:
+        """Consume ``start:end`` as the source of ``field_names``."""
+        self.buffer.consume(start, end)
+        for field_name in field_names:
+            if field_name == "websites":
+                self.spans.setdefault(field_name, []).append((start, end))
+            else:
+                self.spans[field_name] = [(start, end)]
+            self.confidence[field_name] = score
+
+    def wanted(self, field_name: str, score: float) -> bool:
+        """True if reading ``field_name`` at ``score`` would improve it."""
+        return (field_name not in self.disabled
+                and self.confidence.get(field_name, 0.0) < min(score, self.threshold))
+
+    def enabled(self, field_name: str) -> bool:
+        """True unless the stage that fills ``field_name`` is switched off."""
+        return field_name not in self.disabled
 
 
 def _normalize_arguments(arguments: Any) -> List[str]:
@@ -140,211 +225,3 @@ def _strip_wrapping_quotes(text: str) -> str:
     while len(text) >= 2 and text[0] == text[-1] and text[0] in "'\"":
         text = text[1:-1].strip()
     return text
-
-
-def _join_segments(segments: Iterable[str]) -> str:
-    return _clean_text(" ".join(segments))
-
-
-def _clean_text(text: str) -> str:
-    return re.sub(r'\s+', ' ', text or '').strip()
-
-
-def _remove_first(text: str, needle: str) -> str:
-    if not needle:
-        return _clean_text(text)
-
-    index = text.lower().find(needle.lower())
-    if index == -1:
-        return _clean_text(text)
-
-    return _clean_text(f"{text[:index]} {text[index + len(needle):]}")
-
-
-def _name_before_email(prefix: str) -> Optional[Tuple[str, str, str]]:
-    candidate = prefix.strip().strip("<")
-    if not candidate:
-        return None
-
-    parts = re.split(r'[\n\r|•·;,:\u2013\u2014]+', candidate)
-    candidate = parts[-1].strip()
-    if not candidate:
-        return None
-
-    first_name, last_name = NameParser.parse(candidate)
-    if _plausible_name(candidate, first_name, last_name):
-        return first_name, last_name, candidate
-    return None
-
-
-def _find_phone_match(text: str) -> Optional[re.Match]:
-    for pattern in PHONE_PATTERNS:
-        match = pattern.search(text)
-        if match and PhoneParser.parse(match.group(0)):
-            return match
-    return None
-
-
-def _find_title_match(text: str) -> Optional[Tuple[str, str]]:
-    text = text or ""
-
-    connector_match = re.search(
-        r'\b(?:vp|head|director|president|vice president)\s+of\s+'
-        r'[A-Za-z][A-Za-z&/-]*(?:\s+[A-Za-z][A-Za-z&/-]*){0,2}\b',
-        text,
-        re.IGNORECASE,
-    )
-    if connector_match:
-        raw = connector_match.group(0)
-        return TitleParser.parse(raw) or raw, raw
-
-    for title in _title_candidates():
-        pattern = r'(?<!\w)' + re.escape(title).replace(r'\ ', r'\s+') + r'(?!\w)'
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            raw = _expand_compound_title(text, match)
-            return TitleParser.parse(raw) or raw, raw
-
-    return None
-
-
-def _expand_compound_title(text: str, match: re.Match) -> str:
-    """Grow a title match across connectors like ``&``/``and``/``/``.
-
-    Handles roles such as "CEO & Co-founder" so the whole expression is
-    treated as the title rather than leaving the other half as company text.
-    """
-    token_alt = "|".join(
-        re.escape(title).replace(r"\ ", r"\s+") for title in _title_candidates()
-    )
-    connector = r"\s*(?:&|\+|/|,|\band\b)\s*"
-    compound = re.compile(
-        rf"(?<!\w)(?:{token_alt})(?:{connector}(?:{token_alt}))+(?!\w)",
-        re.IGNORECASE,
-    )
-    for span in compound.finditer(text):
-        if span.start() <= match.start() and span.end() >= match.end():
-            return span.group(0)
-    return match.group(0)
-
-
-def _title_candidates() -> List[str]:
-    candidates = set(TitleParser.COMMON_TITLES)
-    for prefix in TitleParser.PREFIXES:
-        for title in TitleParser.COMMON_TITLES:
-            if not title.startswith(prefix + " "):
-                candidates.add(f"{prefix} {title}")
-    return sorted(candidates, key=lambda value: (len(value.split()), len(value)), reverse=True)
-
-
-def _residual_segments(segments: List[str], consumed_texts: List[str]) -> List[str]:
-    residuals = []
-    for segment in segments:
-        residual = segment
-        for consumed in sorted(consumed_texts, key=len, reverse=True):
-            residual = _remove_first(residual, consumed)
-        residual = _clean_text(residual)
-        if residual:
-            residuals.append(residual)
-    return residuals
-
-
-def _pick_name_segment(segments: List[str]) -> Optional[Tuple[str, str, str]]:
-    best_candidate = None
-    best_score = 0
-
-    for segment in segments:
-        if EmailParser.parse(segment) or WebsiteParser.parse(segment) or PhoneParser.parse(segment):
-            continue
-        if _looks_like_company(segment):
-            continue
-
-        first_name, last_name = NameParser.parse(segment)
-        if not _plausible_name(segment, first_name, last_name):
-            continue
-
-        score = 1
-        if first_name:
-            score += 1
-        if last_name:
-            score += 2
-        if len(segment.split()) <= 3:
-            score += 1
-
-        if score > best_score:
-            best_candidate = (first_name, last_name, segment)
-            best_score = score
-
-    return best_candidate
-
-
-def _plausible_name(text: str, first_name: str, last_name: str) -> bool:
-    if not first_name and not last_name:
-        return False
-
-    words = text.split()
-    if not words or len(words) > 4:
-        return False
-
-    lowered = {word.lower().strip(".,") for word in words}
-    if lowered & BUSINESS_TERMS:
-        return False
-
-    if any(char.isdigit() for char in text):
-        return False
-
-    return True
-
-
-def _looks_like_company(text: str) -> bool:
-    words = {word.lower().strip(".,") for word in text.split()}
-    return bool(words & BUSINESS_TERMS)
-
-
-def _company_from_residual(text: str, websites: List[str]) -> Optional[str]:
-    residual = _clean_text(text).strip(" ,;|-")
-    if not residual:
-        return None
-
-    if websites:
-        for url in websites:
-            domain = url.split("//")[-1].split("/")[0].lower()
-            if residual.lower() in domain or domain in residual.lower():
-                return residual
-
-    return residual
-
-
-def _split_name_company(text: str) -> Optional[Tuple[str, str, str]]:
-    words = text.split()
-    if len(words) < 3:
-        return None
-
-    business_index = None
-    for index, word in enumerate(words):
-        if word.lower().strip(".,") in BUSINESS_TERMS:
-            business_index = index
-            break
-
-    if business_index is not None and business_index >= 3:
-        company_start = max(2, business_index - 2)
-        name_text = " ".join(words[:company_start])
-        company_text = " ".join(words[company_start:])
-    else:
-        return None
-
-    first_name, last_name = NameParser.parse(name_text)
-    if _plausible_name(name_text, first_name, last_name) and len(company_text.split()) >= 2:
-        return first_name, last_name, company_text
-    return None
-
-
-def _company_from_email(email: str) -> Optional[str]:
-    if not email or "@" not in email:
-        return None
-
-    domain = email.split("@", 1)[1].lower()
-    if domain in WEBMAIL_DOMAINS:
-        return None
-
-    return domain.split(".")[0].title()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# jodie/parsers/inference.py
+"""Cross-field inference, declared as rules over the fields they need.
+
+Each rule fills one or more target fields from fields that are already
+known, e.g. company from the email domain. Rules run lazily: a rule is
+only evaluated while its targets are still missing, rules for the same
+target are tried in declaration order until one succeeds, and a rule's
+required fields may themselves be inferred first.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+from jodie.constants import PROFILE_DOMAINS, ROLE_ADDRESSES, WEBMAIL_DOMAINS
+
+from .cache import setup_changed
+
+# Stages stop refining a field once its confidence reaches this
+DEFAULT_CONFIDENCE_THRESHOLD = 0.85
+
+_LOCAL_PART_SEPARATOR = re.compile(r'[._-]')
+_SECOND_LEVEL_LABELS = {"ac", "co", "com", "gov", "net", "org"}
+
+
+@dataclass(frozen=True)
+class InferenceRule:
+    """Fill ``targets`` from the values of ``requires``.
+
+    ``infer`` receives the required values in order and returns one value
+    per target, or None when it can't tell. Inferred values get the rule's
+    ``confidence``. A rule only applies when all its targets are missing.
+    """
+    name: str
+    targets: Tuple[str, ...]
+    requires: Tuple[str, ...]
+    infer: Callable[..., Optional[Tuple[Any, ...]]]
+    confidence: float
+    setting: str = ""  # behavior flag that turns the rule off when false
+
+
+def company_from_email(email: str) -> Optional[Tuple[str]]:
+    """Company from a work email's domain ("jane@acme.io" -> "Acme")."""
+    if not email or "@" not in email:
+        return None
+    domain = email.rsplit("@", 1)[1].lower()
+    if domain in WEBMAIL_DOMAINS:
+        return None
+    name = _domain_name(domain)
+    return (name,) if name else None
+
+
+def company_from_website(websites: Sequence[str]) -> Optional[Tuple[str]]:
+    """Company from the first website that isn't a profile or webmail host."""
+    for url in websites:
+        host = url.split("//")[-1].split("/")[0].split(":")[0].lower()
+        if host.startswith("www."):
+            host = host[4:]
+        if host in PROFILE_DOMAINS or host in WEBMAIL_DOMAINS:
+            continue
+        name = _domain_name(host)
+        if name:
+            return (name,)
+    return None
+
+
+def name_from_email(email: str) -> Optional[Tuple[str, str]]:
+    """First and last name from a "first.last" style local part."""
+    if not email or "@" not in email:
+        return None
+    local = email.rsplit("@", 1)[0].split("+")[0].lower()
+    if local in ROLE_ADDRESSES:
+        return None
+    parts = _LOCAL_PART_SEPARATOR.split(local)
+    if len(parts) == 3 and len(parts[1]) == 1:
+        parts = [parts[0], parts[2]]  # middle initial
+    if len(parts) != 2 or not all(part.isalpha() and len(part) > 1 for part in parts):
+        return None
+    if parts[0] in ROLE_ADDRESSES:
+        return None
+    return parts[0].title(), parts[1].title()
+
+
+INFERENCE_RULES: Tuple[InferenceRule, ...] = (
+    InferenceRule("company_from_email", ("company",), ("email",), company_from_email, 0.6,
+                  "auto_infer_company"),
+    InferenceRule("company_from_website", ("company",), ("websites",), company_from_website, 0.55,
+                  "auto_infer_company"),
+    InferenceRule("name_from_email", ("first_name", "last_name"), ("email",), name_from_email, 0.5,
+                  "auto_infer_name"),
+)
+
+
+def infer_missing(fields: Dict[str, Any], confidence: Dict[str, float],
+                  rules: Optional[Iterable[InferenceRule]] = None,
+                  skip: Iterable[str] = ()) -> Dict[str, str]:
+    """Fill missing fields in place from the rules that apply.
+
+    Args:
+        fields: Extracted field values
+        confidence: Per-field confidence, updated for inferred fields
+        rules: Rules to consider instead of INFERENCE_RULES
+        skip: Fields never to infer (their parse stage is switched off)
+
+    Returns:
+        Inferred field name -> name of the rule that filled it
+    """
+    by_target = _by_target if rules is None else _rules_by_target(rules, _disabled)
+    inferred: Dict[str, str] = {}
+    resolving: Set[str] = set()
+
+    def resolve(name: str) -> bool:
+        if _present(fields.get(name)):
+            return True
+        if name in resolving:
+            return False  # rules that depend on each other
+        resolving.add(name)
+        try:
+            for rule in by_target.get(name, ()):
+                if any(target in skip for target in rule.targets):
+                    continue
+                if len(rule.targets) > 1 and any(_present(fields.get(target)) for target in rule.targets):
+                    continue
+                if not all(resolve(required) for required in rule.requires):
+                    continue
+                values = rule.infer(*(fields[required] for required in rule.requires))
+                if not values:
+                    continue
+                for target, value in zip(rule.targets, values):
+                    fields[target] = value
+                    confidence[target] = rule.confidence
+                    inferred[target] = rule.name
+                return True
+            return False
+        finally:
+            resolving.discard(name)
+
+    for target in by_target:
+        if target not in skip and not _present(fields.get(target)):
+            resolve(target)
+    return inferred
+
+
+def _rules_by_target(rules: Iterable[InferenceRule], disabled: FrozenSet[str]) -> Dict[str, List[InferenceRule]]:
+    by_target: Dict[str, List[InferenceRule]] = {}
+    for rule in rules:
+        if rule.name not in disabled:
+            for target in rule.targets:
+                by_target.setdefault(target, []).append(rule)
+    return by_target
+
+
+_threshold = DEFAULT_CONFIDENCE_THRESHOLD
+_disabled: FrozenSet[str] = frozenset()
+_by_target = _rules_by_target(INFERENCE_RULES, _disabled)
+
+
+def configure_inference(config: Optional[Dict[str, Any]] = None) -> None:
+    """Apply the ``[behavior]`` config section.
+
+    Args:
+        config: Loaded configuration; None restores the defaults
+    """
+    global _threshold, _disabled, _by_target
+    behavior = (config or {}).get("behavior") or {}
+    _threshold = float(behavior.get("confidence_threshold", DEFAULT_CONFIDENCE_THRESHOLD))
+    _disabled = frozenset(rule.name for rule in INFERENCE_RULES
+                          if rule.setting and not behavior.get(rule.setting, True))
+    _by_target = _rules_by_target(INFERENCE_RULES, _disabled)
+    setup_changed()
+
+
+def inference_settings() -> Dict[str, Any]:
+    """The ``[behavior]`` settings in effect."""
+    return {"confidence_threshold": _threshold, "disabled": sorted(_disabled)}
+
+
+def confidence_threshold() -> float:
+    """Confidence at which extraction stops refining a field."""
+    return _threshold
+
+
+def _present(value: Any) -> bool:
+    return value is not None and value != [] and value != ""
+
+
+def _domain_name(host: str) -> Optional[str]:
+    labels = [label for label in host.split(".") if label]
+    if len(labels) < 2:
+        return None
+    index = -2
+    if len(labels) > 2 and len(labels[-1]) == 2 and labels[-2] in _SECOND_LEVEL_LABELS:
+        index = -3  # acme.co.uk
+    return labels[index].title()
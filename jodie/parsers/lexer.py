@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# jodie/parsers/lexer.py
+"""Single-pass tokenizer for contact text.
+
+The joined input segments are tokenized once into typed spans (email, url,
+phone, word, separator) over a single buffer. Extraction stages mark spans
+as consumed instead of rebuilding the working string after every match, so
+the cost of a parse stays linear in the size of the input.
+"""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+from .phones import PHONE_PATTERN_SOURCE
+
+EMAIL = "email"
+URL = "url"
+PHONE = "phone"
+WORD = "word"
+SEPARATOR = "separator"
+
+_EMAIL_ADDRESS = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'
+
+TOKEN_PATTERN = re.compile(
+    rf'(?P<{EMAIL}><{_EMAIL_ADDRESS}>|{_EMAIL_ADDRESS})'
+    rf'|(?P<{URL}>(?i:https?://[^\s]+|www\.[^\s]+))'
+    rf'|(?P<{PHONE}>{PHONE_PATTERN_SOURCE})'
+    rf'|(?P<{WORD}>\w+)'
+    rf'|(?P<{SEPARATOR}>[^\w\s])'
+)
+
+
+@dataclass
+class Token:
+    """A typed span of the token buffer."""
+    kind: str
+    start: int
+    end: int
+    text: str
+    consumed: bool = False
+
+
+def tokenize(text: str, offset: int = 0) -> List[Token]:
+    """Split text into typed tokens in one left-to-right scan.
+
+    Args:
+        text: Text to tokenize
+        offset: Added to every token's start and end
+
+    Returns:
+        Tokens in order of appearance; whitespace is not tokenized
+    """
+    return [
+        Token(match.lastgroup, match.start() + offset, match.end() + offset, match.group(0))
+        for match in TOKEN_PATTERN.finditer(text)
+    ]
+
+
+class TokenBuffer:
+    """Tokenized view of the input segments with span-based consumption.
+
+    Segments are joined with single spaces after collapsing their internal
+    whitespace; ``segments`` keeps each segment's (start, end) offsets in
+    ``text`` so per-segment residuals can be read back without re-scanning.
+    Each segment is tokenized on its own, so no token spans two segments.
+
+    Args:
+        segments: Input segments
+        tokenizer: Returns one segment's tokens with offsets relative to it,
+            instead of tokenizing here. Its tokens are copied, so it may
+            hand out cached lists (see ``jodie.parsers.session``).
+    """
+
+    def __init__(self, segments: Sequence[str],
+                 tokenizer: Optional[Callable[[str], List[Token]]] = None) -> None:
+        parts: List[str] = []
+        self.segments: List[Tuple[int, int]] = []
+        self.tokens: List[Token] = []
+        offset = 0
+        for segment in segments:
+            collapsed = " ".join(segment.split())
+            if not collapsed:
+                continue
+            if parts:
+                offset += 1
+            self.segments.append((offset, offset + len(collapsed)))
+            parts.append(collapsed)
+            if tokenizer is None:
+                self.tokens.extend(tokenize(collapsed, offset))
+            else:
+                self.tokens.extend(Token(token.kind, token.start + offset, token.end + offset, token.text)
+                                   for token in tokenizer(collapsed))
+            offset += len(collapsed)
+
+        self.text = " ".join(parts)
+        self._starts = [token.start for token in self.tokens]
+        self._segment_starts = [start for start, _ in self.segments]
+
+    def unconsumed(self, kind: Optional[str] = None) -> Iterator[Token]:
+        """Yield tokens not yet consumed, optionally filtered by kind."""
+        for token in self.tokens:
+            if not token.consumed and (kind is None or token.kind == kind):
+                yield token
+
+    def first(self, kind: str) -> Optional[Token]:
+        """Return the first unconsumed token of the given kind."""
+        return next(self.unconsumed(kind), None)
+
+    def consume(self, start: int, end: int) -> None:
+        """Mark every token overlapping ``[start, end)`` as consumed."""
+        index = max(bisect_right(self._starts, start) - 1, 0)
+        for token in self.tokens[index:]:
+            if token.start >= end:
+                break
+            if token.end > start:
+                token.consumed = True
+
+    def remaining(self, start: int = 0, end: Optional[int] = None) -> Tuple[str, List[int]]:
+        """Render the unconsumed text between two buffer offsets.
+
+        Consumed spans collapse to a single space, matching what removing
+        them from the string and normalizing whitespace would produce. Gaps
+        that cross a segment boundary render as a newline instead, so
+        callers can tell where one input line ended.
+
+        Args:
+            start: Buffer offset to start from
+            end: Buffer offset to stop at (defaults to end of buffer)
+
+        Returns:
+            (text, offsets) where offsets[i] is the buffer offset of text[i]
+        """
+        if end is None:
+            end = len(self.text)
+
+        pieces: List[str] = []
+        offsets: List[int] = []
+        previous_end = None
+        gap = False
+        index = max(bisect_right(self._starts, start) - 1, 0)
+        for token in self.tokens[index:]:
+            if token.start >= end:
+                break
+            if token.end <= start:
+                continue
+            if token.consumed:
+                gap = True
+                continue
+
+            token_start, token_end = max(token.start, start), min(token.end, end)
+            if pieces and (gap or token_start > previous_end):
+                crosses = (bisect_right(self._segment_starts, token_start)
+                           > bisect_right(self._segment_starts, previous_end))
+                pieces.append("\n" if crosses else " ")
+                offsets.append(previous_end)
+            pieces.append(self.text[token_start:token_end])
+            offsets.extend(range(token_start, token_end))
+            previous_end = token_end
+            gap = False
+
+        return "".join(pieces), offsets
+
+    def segment_residuals(self) -> List[Tuple[str, int, int]]:
+        """Return the unconsumed text left in each segment.
+
+        Returns:
+            (text, start, end) for every segment with text remaining, where
+            start/end bound the remaining text in buffer offsets
+        """
+        residuals = []
+        for segment_start, segment_end in self.segments:
+            text, offsets = self.remaining(segment_start, segment_end)
+            if text:
+                residuals.append((text, offsets[0], offsets[-1] + 1))
+        return residuals
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 # jodie/parsers/parsers.py
 import re
-from nameparser import HumanName
+from functools import lru_cache
+
+from .phones import scan_phones
 
 class BaseParser:
     """
@@ -95,6 +97,9 @@ class TitleParser(BaseParser):
         "full stack", "front end", "back end", "full-stack", "front-end", "back-end"
     }
 
+    _MAX_TITLE_WORDS = max(len(title.split()) for title in COMMON_TITLES)
+    _MAX_PREFIX_WORDS = max(len(prefix.split()) for prefix in PREFIXES)
+
     @classmethod
     def parse(cls, text):
         """
@@ -126,16 +131,17 @@ class TitleParser(BaseParser):
                 return text
             
             # Then check for prefix + title combinations
-            for i in range(len(words)):
+            for i in range(min(len(words), cls._MAX_PREFIX_WORDS)):
                 prefix = " ".join(words[:i+1])
                 if prefix in cls.PREFIXES:
                     remaining = " ".join(words[i+1:])
                     if remaining in cls.COMMON_TITLES:
                         return text
             
-            # Finally check if any part matches a known title
+            # Finally check if any part matches a known title; no phrase
+            # longer than the longest title can match.
             for i in range(len(words)):
-                for j in range(i + 1, len(words) + 1):
+                for j in range(i + 1, min(len(words), i + cls._MAX_TITLE_WORDS) + 1):
                     phrase = " ".join(words[i:j])
                     if phrase in cls.COMMON_TITLES:
                         return text
@@ -161,47 +167,22 @@ class PhoneParser(BaseParser):
         - 10 digits: 5167763192
         - With country code: +15167763192, 15167763192
         - With separators: 516-776-3192, 516.776.3192, (516) 776-3192
-        - International formats: +1 516 776 3192
-        
+        - International formats: +1 516 776 3192, +44 (0)20 7946 0958
+
+        North American numbers are returned as 10 national digits; others
+        as E.164 (see ``jodie.parsers.phones``).
+
         Returns the cleaned phone number or None if no valid phone found.
         """
         if not isinstance(text, str) or not text.strip():
             return None
             
-        # Remove common non-digit characters for analysis
+        numbers = scan_phones(text)
+        if numbers:
+            return numbers[0].value
+
         digits_only = ''.join(ch for ch in text if ch.isdigit())
-        
-        # Various phone number patterns
-        phone_patterns = [
-            # US phone numbers with various formatting
-            r'\+?1?[-.\s]?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b',
-            # 10 digit number
-            r'\b([0-9]{10})\b',
-            # International format with country code
-            r'\+?([0-9]{1,3})[-.\s]?([0-9]{3,4})[-.\s]?([0-9]{3,4})[-.\s]?([0-9]{3,4})\b'
-        ]
-        
-        for pattern in phone_patterns:
-            matches = cls.find_matches(pattern, text)
-            if matches:
-                # For tuple matches, join the groups
-                if isinstance(matches[0], tuple):
-                    # Remove empty groups and join
-                    phone_digits = ''.join(group for group in matches[0] if group)
-                else:
-                    phone_digits = matches[0]
-                
-                # Validate phone number length
-                if len(phone_digits) == 10:
-                    # US phone number without country code
-                    return phone_digits
-                elif len(phone_digits) == 11 and phone_digits.startswith('1'):
-                    # US phone number with country code
-                    return phone_digits[1:]  # Return without country code
-                elif 7 <= len(phone_digits) <= 15:
-                    # International phone number
-                    return phone_digits
-        
+
         # Fallback: if we have exactly 10 or 11 digits, treat as phone
         if len(digits_only) == 10:
             return digits_only
@@ -212,6 +193,15 @@ class PhoneParser(BaseParser):
 
 
 class NameParser(BaseParser):
+    # Plain ASCII "First Last" and "First M. Last": nameparser would split
+    # these the same way, so they skip HumanName entirely.
+    SIMPLE_NAME = re.compile(
+        r"([A-Za-z]+(?:['-][A-Za-z]+)*) (?:([A-Za-z]\.?) )?([A-Za-z]+(?:['-][A-Za-z]+)*)"
+    )
+
+    # Distinct name strings whose split is memoized
+    CACHE_SIZE = 4096
+
     @classmethod
     def parse(cls, text):
         """
@@ -222,22 +212,61 @@ class NameParser(BaseParser):
         :param text: The text to parse.
         :return: A tuple of (first_name, last_name).
         """
-        # Check for email in the text.
-        email = EmailParser.parse(text)
-        if email:
-            # Extract the portion of text before the email for name parsing.
-            name_portion_index = text.find(email)
-            name_portion = text[:name_portion_index].strip()
-            name_portion = name_portion.rstrip('<').strip()
-        else:
-            # Use the entire text if no email is found.
-            name_portion = text.strip()
-
+        name_portion = cls._name_portion(text)
         if not name_portion:
             return "", ""
 
-        # Use the `HumanName` class to parse the name intelligently.
-        name = HumanName(name_portion)
+        first, middle, last = cls.split(name_portion)
+        return first, f"{middle} {last}".strip()
 
-        # Return the first and last names as a tuple.
-        return name.first, f"{name.middle} {name.last}".strip()
+    @classmethod
+    def first_last(cls, text):
+        """
+        Parse a name into first and last name, dropping any middle name.
+
+        :param text: The name to parse.
+        :return: A tuple of (first_name, last_name).
+        """
+        first, _, last = cls.split(text.strip()) if text and text.strip() else ("", "", "")
+        return first, last
+
+    @staticmethod
+    @lru_cache(maxsize=CACHE_SIZE)
+    def split(name):
+        """
+        Split a name into (first, middle, last) as `nameparser` would.
+
+        Common plain shapes are split directly; everything else goes through
+        `HumanName`. Results are memoized, so changes to nameparser's
+        CONSTANTS at runtime need a `NameParser.split.cache_clear()`.
+
+        :param name: The name to split.
+        :return: A tuple of (first, middle, last).
+        """
+        # Imported here so configs with the name stage off never load it.
+        from nameparser import HumanName
+        from nameparser.config import CONSTANTS
+
+        match = NameParser.SIMPLE_NAME.fullmatch(name)
+        if match and not CONSTANTS.force_mixed_case_capitalization and not any(
+            word.lower().rstrip('.') in CONSTANTS.suffixes_prefixes_titles
+            or word.lower().rstrip('.') in CONSTANTS.conjunctions
+            for word in match.groups() if word
+        ):
+            first, middle, last = match.groups()
+            return first, middle or "", last
+
+        human_name = HumanName(name)
+        return human_name.first, human_name.middle, human_name.last
+
+    @staticmethod
+    def _name_portion(text):
+        # Only text containing "@" can hold an email; skip the regex otherwise.
+        email = EmailParser.parse(text) if '@' in text else None
+        if email:
+            # Extract the portion of text before the email for name parsing.
+            name_portion_index = text.find(email)
+            name_portion = text[:name_portion_index].strip()
+            return name_portion.rstrip('<').strip()
+        # Use the entire text if no email is found.
+        return text.strip()
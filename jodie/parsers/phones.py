@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# jodie/parsers/phones.py
+"""Phone number scanning and E.164 normalization.
+
+Candidates are found with one regex (``PHONE_PATTERN``, also embedded in the
+lexer's token pattern); each candidate is then normalized in a single walk
+over its characters, with the country code and number length checked
+against ``COUNTRY_CODES`` rather than a cascade of per-format regexes.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+# Calling code -> (min, max) digits of the national significant number.
+# Codes are prefix-free, so a number's code is found by trying its first
+# one, two and three digits.
+COUNTRY_CODES: Dict[str, Tuple[int, int]] = {
+    '1': (10, 10), '7': (10, 10), '20': (8, 10), '27': (9, 9), '30': (10, 10),
+    '31': (9, 9), '32': (8, 9), '33': (9, 9), '34': (9, 9), '36': (8, 9),
+    '39': (6, 11), '40': (9, 9), '41': (9, 9), '43': (4, 13), '44': (9, 10),
+    '45': (8, 8), '46': (7, 10), '47': (8, 8), '48': (9, 9), '49': (6, 13),
+    '51': (8, 9), '52': (10, 10), '53': (8, 8), '54': (10, 11), '55': (10, 11),
+    '56': (9, 9), '57': (8, 10), '58': (10, 10), '60': (8, 10), '61': (9, 9),
+    '62': (8, 12), '63': (8, 10), '64': (8, 10), '65': (8, 8), '66': (8, 9),
+    '81': (9, 10), '82': (8, 10), '84': (9, 10), '86': (10, 11), '90': (10, 10),
+    '91': (10, 10), '92': (9, 10), '93': (9, 9), '94': (9, 9), '95': (7, 10),
+    '98': (10, 10), '212': (9, 9), '213': (8, 9), '216': (8, 8), '218': (8, 9),
+    '221': (9, 9), '233': (9, 9), '234': (8, 10), '254': (9, 9), '255': (9, 9),
+    '256': (9, 9), '260': (9, 9), '263': (9, 9), '351': (9, 9), '352': (6, 11),
+    '353': (7, 9), '354': (7, 7), '356': (8, 8), '357': (8, 8), '358': (5, 12),
+    '359': (8, 9), '370': (8, 8), '371': (8, 8), '372': (7, 8), '380': (9, 9),
+    '381': (8, 9), '385': (8, 9), '386': (8, 8), '420': (9, 9), '421': (9, 9),
+    '852': (8, 8), '853': (8, 8), '855': (8, 9), '880': (10, 10), '886': (8, 9),
+    '961': (7, 8), '962': (8, 9), '965': (8, 8), '966': (9, 9), '971': (8, 9),
+    '972': (8, 9), '974': (8, 8), '977': (8, 10),
+}
+
+# Default country for numbers written without an international prefix
+DEFAULT_COUNTRY = '1'
+
+# Numbers whose country isn't in the table still need a plausible length.
+MIN_DIGITS, MAX_DIGITS = 7, 15
+
+# Labels written before a number ("M: 415 ...", "Office 415 ...")
+PHONE_LABELS = {
+    'm': 'mobile', 'mob': 'mobile', 'mobile': 'mobile', 'mobil': 'mobile', 'c': 'mobile',
+    'cell': 'mobile', 'cellphone': 'mobile', 'handy': 'mobile',
+    'o': 'work', 'office': 'work', 'w': 'work', 'work': 'work', 'd': 'work', 'direct': 'work',
+    't': 'work', 'tel': 'work', 'telephone': 'work', 'p': 'work', 'ph': 'work', 'phone': 'work',
+    'main': 'main', 'f': 'fax', 'fax': 'fax', 'h': 'home', 'home': 'home',
+}
+
+_EXTENSION = r'(?:[ \t]*(?i:ext\.?|extension|x|\#)[ \t]*[0-9]{1,6}\b)?'
+
+# One alternation per written shape: international (+CC or 00CC, with an
+# optional "(0)" trunk digit), North American, and grouped digits.
+PHONE_PATTERN_SOURCE = (
+    r'(?:(?:\+|\b00)[1-9][0-9]{0,2}(?:[-. \t]?(?:\(0\)[-. \t]?)?\(?[0-9]{1,5}\)?){2,5}\b'
+    r'|\+?(?:1[-. \t]?)?\(?[0-9]{3}\)?[-. \t]?[0-9]{3}[-. \t]?[0-9]{4}\b'
+    r'|\+?[0-9]{1,3}[-. \t]?[0-9]{3,4}[-. \t]?[0-9]{3,4}[-. \t]?[0-9]{3,4}\b)'
+    + _EXTENSION
+)
+PHONE_PATTERN = re.compile(PHONE_PATTERN_SOURCE)
+
+_LABEL_BEFORE = re.compile(r'(?<![A-Za-z])([A-Za-z]+)(\.?[ \t]*[:.]?)[ \t]*$')
+
+
+@dataclass
+class PhoneNumber:
+    """A normalized phone number and where it was found.
+
+    ``digits`` includes the country code when there is one. ``country_code``
+    is None for a national number of unknown country, and "" for an
+    international number whose code isn't in COUNTRY_CODES.
+    """
+    digits: str
+    country_code: Optional[str] = None
+    extension: Optional[str] = None
+    label: Optional[str] = None
+    start: int = 0
+    end: int = 0
+
+    @property
+    def e164(self) -> Optional[str]:
+        """"+<country><number>", or None for a national number of unknown country."""
+        return f"+{self.digits}" if self.country_code is not None else None
+
+    @property
+    def national(self) -> str:
+        """The number without its country code."""
+        return self.digits[len(self.country_code or ''):]
+
+    @property
+    def value(self) -> str:
+        """The form stored in the ``phone`` field.
+
+        North American numbers keep their 10-digit national form; others
+        are E.164 when the country is known and plain digits otherwise.
+        """
+        if self.country_code == '1':
+            return self.national
+        return self.e164 or self.digits
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        """Entry for the ``phones`` field."""
+        return {'number': self.e164 or self.digits, 'label': self.label, 'extension': self.extension}
+
+
+def normalize_phone(text: str, label: Optional[str] = None) -> Optional[PhoneNumber]:
+    """Normalize one written phone number.
+
+    Args:
+        text: A phone candidate such as "+44 (0)20 7946 0958 ext. 12"
+        label: Label to attach, e.g. "mobile"
+
+    Returns:
+        PhoneNumber, or None if the digits don't form a valid number
+    """
+    digits: List[str] = []
+    extension: List[str] = []
+    international = False
+    in_extension = False
+    index = 0
+    length = len(text)
+    while index < length:
+        char = text[index]
+        if char.isdigit():
+            (extension if in_extension else digits).append(char)
+        elif char == '+' and not digits:
+            international = True
+        elif char == '(' and text.startswith('(0)', index) and digits:
+            index += 3  # trunk prefix inside an international number
+            continue
+        elif char.isalpha() or char == '#':
+            in_extension = True
+        index += 1
+
+    number = ''.join(digits)
+    if not international:
+        if number.startswith('00'):
+            number, international = number[2:], True
+        elif number.startswith('011') and len(number) > 11:
+            number, international = number[3:], True
+
+    if international:
+        country_code = _calling_code(number)
+        if country_code:
+            low, high = COUNTRY_CODES[country_code]
+            if not low <= len(number) - len(country_code) <= high:
+                return None
+        elif not MIN_DIGITS + 1 <= len(number) <= MAX_DIGITS:
+            return None
+    elif len(number) == 10:
+        number, country_code = DEFAULT_COUNTRY + number, DEFAULT_COUNTRY
+    elif len(number) == 11 and number.startswith(DEFAULT_COUNTRY):
+        country_code = DEFAULT_COUNTRY
+    elif MIN_DIGITS <= len(number) <= MAX_DIGITS:
+        country_code = None  # national format of an unknown country
+    else:
+        return None
+
+    return PhoneNumber(
+        digits=number,
+        country_code=country_code,
+        extension=''.join(extension) or None,
+        label=label,
+        end=len(text),
+    )
+
+
+def scan_phones(text: str) -> List[PhoneNumber]:
+    """Find every valid phone number in text, with labels and spans."""
+    numbers: List[PhoneNumber] = []
+    for match in PHONE_PATTERN.finditer(text):
+        label = label_before(text, match.start())
+        number = normalize_phone(match.group(0), label[0] if label else None)
+        if number:
+            number.start, number.end = match.span()
+            numbers.append(number)
+    return numbers
+
+
+def label_before(text: str, start: int) -> Optional[Tuple[str, int]]:
+    """Find a label word ("Mobile:", "O.") immediately before offset start.
+
+    A single letter only counts when punctuated ("M:", "M."), so an initial
+    in a name just before a number isn't read as a label.
+
+    Returns:
+        (label, offset where the label word starts), or None
+    """
+    found = _LABEL_BEFORE.search(text, max(0, start - 24), start)
+    if not found or (len(found.group(1)) == 1 and not found.group(2).strip()):
+        return None
+    label = label_for(found.group(1))
+    return (label, found.start()) if label else None
+
+
+def label_for(word: str) -> Optional[str]:
+    """Map a label word like "Cell" or "F" to mobile/work/main/fax/home."""
+    return PHONE_LABELS.get(word.lower())
+
+
+def primary_phone(numbers: List[PhoneNumber]) -> Optional[PhoneNumber]:
+    """The number to store as the contact's phone: the first that isn't a fax."""
+    for number in numbers:
+        if number.label != 'fax':
+            return number
+    return numbers[0] if numbers else None
+
+
+def _calling_code(number: str) -> str:
+    for size in (1, 2, 3):
+        if number[:size] in COUNTRY_CODES:
+            return number[:size]
+    return ''
@@ -4,14 +4,18 @@
 
 from typing import Any, Dict, List
 from .base import ParseResult
-from .extractor import parse_contact_fields
+from .cache import active_cache, copy_value
+from .extractor import Extraction, extract_contact_fields, normalize_segments
 
 
 class ParserPipeline:
     """Orchestrates parsers to extract contact fields from text.
 
-    The pipeline delegates to the shared extract-and-remove parser used by
-    CLI auto mode, then wraps values in ParseResult objects.
+    The pipeline delegates to the shared span-based extractor used by CLI
+    auto mode, then wraps values in ParseResult objects whose consumed_text
+    is the text each field was read from and whose confidence reflects how
+    it was found. Fields filled by ``jodie.parsers.inference`` rules have
+    source "inferred".
     """
 
     @classmethod
@@ -24,30 +28,55 @@ class ParserPipeline:
         Returns:
             Dict mapping field names to ParseResults
         """
-        results: Dict[str, ParseResult] = {}
-        fields = parse_contact_fields(lines)
+        segments = normalize_segments(lines)
+        cache = active_cache()
+        if cache is None:
+            rows = cls._extract(segments)
+        else:
+            rows = cache.get_or_compute(cache.key("pipeline", segments), lambda: cls._extract(segments))
 
-        for field_name, value in fields.items():
-            if value is None or value == []:
-                continue
-            results[field_name] = ParseResult(
-                value=value,
-                confidence=0.95,
-                consumed_text=" ".join(lines),
-                source="parsed",
-            )
-
-        return results
+        return cls._results(rows)
 
     @classmethod
-    def _apply_inference(cls, results: Dict[str, ParseResult]) -> None:
-        """Apply cross-field inference after parsing.
+    def from_extraction(cls, extraction: Extraction) -> Dict[str, ParseResult]:
+        """Wrap an existing extraction's fields in ParseResults.
 
         Args:
-            results: Dict of parsed results (modified in place)
+            extraction: Result of ``extract_contact_fields`` or a ParseSession
+
+        Returns:
+            Dict mapping field names to ParseResults
         """
-        # Inference is handled by parse_contact_fields.
-        pass
+        return cls._results(cls._rows(extraction))
+
+    @classmethod
+    def _results(cls, rows: Dict[str, List[Any]]) -> Dict[str, ParseResult]:
+        return {
+            field_name: ParseResult(
+                value=copy_value(value),
+                confidence=confidence,
+                consumed_text=consumed_text,
+                source=source,
+            )
+            for field_name, (value, confidence, consumed_text, source) in rows.items()
+        }
+
+    @classmethod
+    def _extract(cls, segments: List[str]) -> Dict[str, List[Any]]:
+        """Extract fields as plain [value, confidence, consumed_text, source] rows."""
+        return cls._rows(extract_contact_fields(segments))
+
+    @classmethod
+    def _rows(cls, extraction: Extraction) -> Dict[str, List[Any]]:
+        rows: Dict[str, List[Any]] = {}
+        for field_name, value in extraction.fields.items():
+            if value is None or value == []:
+                continue
+            consumed_text = extraction.consumed_text(field_name)
+            source = "parsed" if consumed_text and field_name not in extraction.inferred else "inferred"
+            rows[field_name] = [value, extraction.confidence.get(field_name, 0.0), consumed_text, source]
+
+        return rows
 
     @classmethod
     def to_dict(cls, results: Dict[str, ParseResult]) -> Dict[str, Any]:
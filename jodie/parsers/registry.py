@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# jodie/parsers/registry.py
+"""Registry of extraction stages, built in and from plugins.
+
+Built-in stages are named after the ``[parsers]`` config switches (email,
+website, phone, title, name, company) and are imported only when enabled.
+Third-party parsers register under the ``jodie.parsers`` entry point group
+and are enabled by naming them in ``[parsers]``; entry points are only
+scanned when some enabled name isn't built in, so the default setup never
+pays for plugin discovery.
+"""
+
+import sys
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from .cache import setup_changed
+from .lexer import EMAIL, PHONE, URL
+
+ENTRY_POINT_GROUP = "jodie.parsers"
+
+
+@dataclass(frozen=True)
+class StageSpec:
+    """Where a built-in stage lives and what it reads.
+
+    ``tokens`` is the token kind the stage claims; when the stage is
+    disabled those tokens are still set aside so they don't end up in
+    other fields (an email address read as a company name).
+    """
+    name: str
+    target: str  # "module:attribute", imported when the stage is enabled
+    fields: Tuple[str, ...]
+    tokens: Optional[str] = None
+
+
+BUILTIN_STAGES: Tuple[StageSpec, ...] = (
+    StageSpec("email", "jodie.parsers.stages:EmailStage", ("email",), EMAIL),
+    StageSpec("website", "jodie.parsers.stages:WebsiteStage", ("websites",), URL),
+    StageSpec("phone", "jodie.parsers.stages:PhoneStage", ("phone", "phones"), PHONE),
+    StageSpec("title", "jodie.parsers.stages:TitleStage", ("job_title",)),
+    StageSpec("name", "jodie.parsers.stages:NameStage", ("first_name", "last_name")),
+    StageSpec("company", "jodie.parsers.stages:CompanyStage", ("company",)),
+)
+_BUILTIN_NAMES = frozenset(spec.name for spec in BUILTIN_STAGES)
+
+
+class ParserStage:
+    """Run a ``jodie.parsers.base.BaseParser`` plugin as a stage.
+
+    The parser sees the text no earlier stage claimed. Its result fills
+    ``field_name`` when the field can still be improved, and the text it
+    reports as consumed is claimed so later stages skip it.
+    """
+    needs_words = True
+
+    def __init__(self, parser: Any) -> None:
+        self.parser = parser
+        self.name = parser.name
+        self.priority = parser.priority
+        self.fields = (parser.field_name,)
+
+    def run(self, state: Any) -> None:
+        field_name = self.parser.field_name
+        remaining, offsets = state.buffer.remaining()
+        result = self.parser.parse(remaining)
+        if result is None or not state.wanted(field_name, result.confidence):
+            return
+        state.fields[field_name] = result.value
+        consumed = (result.consumed_text or "").strip()
+        start = remaining.find(consumed) if consumed else -1
+        if start < 0:
+            state.confidence[field_name] = result.confidence
+            return
+        state.claim((field_name,), offsets[start], offsets[start + len(consumed) - 1] + 1,
+                    result.confidence)
+
+
+_toggles: Dict[str, Any] = {}
+_active: Optional[List[Any]] = None
+_disabled: Optional[FrozenSet[str]] = None
+
+
+def configure_stages(config: Optional[Dict[str, Any]] = None) -> None:
+    """Apply the ``[parsers]`` config section.
+
+    Args:
+        config: Loaded configuration; None restores the defaults
+    """
+    global _toggles, _active, _disabled
+    _toggles = dict((config or {}).get("parsers") or {})
+    _active = _disabled = None
+    setup_changed()
+
+
+def stage_settings() -> Dict[str, Any]:
+    """The ``[parsers]`` switches in effect."""
+    return dict(_toggles)
+
+
+def stage_enabled(name: str) -> bool:
+    """True if a stage runs: built-ins default on, plugins default off."""
+    return bool(_toggles.get(name, name in _BUILTIN_NAMES))
+
+
+def disabled_fields() -> FrozenSet[str]:
+    """Fields whose built-in stage is switched off."""
+    global _disabled
+    if _disabled is None:
+        _disabled = frozenset(field for spec in BUILTIN_STAGES if not stage_enabled(spec.name)
+                              for field in spec.fields)
+    return _disabled
+
+
+def disabled_token_kinds() -> Tuple[str, ...]:
+    """Token kinds of switched-off stages, to be set aside unparsed."""
+    return tuple(spec.tokens for spec in BUILTIN_STAGES if spec.tokens and not stage_enabled(spec.name))
+
+
+def active_stages() -> List[Any]:
+    """Enabled stages in priority order, importing them on first use."""
+    global _active
+    if _active is None:
+        stages = [_load(spec.target) for spec in BUILTIN_STAGES if stage_enabled(spec.name)]
+        stages.extend(_load_plugins())
+        _active = sorted((stage for stage in stages if stage is not None),
+                         key=lambda stage: -stage.priority)
+    return _active
+
+
+def plugin_names() -> List[str]:
+    """Names enabled in ``[parsers]`` that aren't built-in stages."""
+    return sorted(name for name, enabled in _toggles.items() if enabled and name not in _BUILTIN_NAMES)
+
+
+def plugin_versions(config: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+    """Installed version of each enabled plugin's distribution, for cache keys."""
+    names = [name for name, enabled in ((config or {}).get("parsers") or {}).items()
+             if enabled and name not in _BUILTIN_NAMES]
+    if not names:
+        return {}
+    versions = {}
+    for entry_point in _entry_points():
+        if entry_point.name in names:
+            dist = getattr(entry_point, "dist", None)
+            versions[entry_point.name] = f"{entry_point.value}@{dist.version if dist else ''}"
+    return versions
+
+
+def _load(target: str) -> Any:
+    module_name, _, attribute = target.partition(":")
+    return getattr(import_module(module_name), attribute)
+
+
+def _load_plugins() -> List[Any]:
+    wanted = plugin_names()
+    if not wanted:
+        return []
+    stages = []
+    found = {entry_point.name: entry_point for entry_point in _entry_points()}
+    for name in wanted:
+        if name not in found:
+            sys.stderr.write(f"Warning: Parser {name!r} is enabled but not installed\n")
+            continue
+        try:
+            loaded = found[name].load()
+        except Exception as e:
+            sys.stderr.write(f"Warning: Skipping parser {name!r}: {e}\n")
+            continue
+        stages.append(loaded if hasattr(loaded, "run") else ParserStage(loaded))
+    return stages
+
+
+def _entry_points() -> List[Any]:
+    from importlib.metadata import entry_points
+
+    found = entry_points()
+    if hasattr(found, "select"):
+        return list(found.select(group=ENTRY_POINT_GROUP))
+    return list(found.get(ENTRY_POINT_GROUP, []))  # Python 3.9
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# jodie/parsers/segmenter.py
+"""Split text describing many people into one block per person.
+
+Segmentation is a single pass over the lines. Blank lines separate
+paragraphs; inside a paragraph, each email address (or, when a paragraph
+has none, each phone number) anchors one person. The lines that came
+before the first anchor tell how a record is laid out, so a new record
+starts that many lines before each later anchor ("Name / Title / email"
+stacks) or right at it (one "Name <email>" per line).
+"""
+
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .batch import parse_contact_fields_many
+from .lexer import EMAIL, PHONE, tokenize
+
+# A short paragraph with no email or phone ("Jane Smith / CEO") is carried
+# into the next block when that block starts right at its anchor.
+MAX_LEAD_LINES = 3
+MAX_LEAD_WORDS = 8
+
+
+def split_contacts(text: str) -> List[str]:
+    """Split a blob into per-person blocks.
+
+    Args:
+        text: Pasted thread, attendee list, team page, etc.
+
+    Returns:
+        Blocks of newline-separated lines, each with an email or phone
+    """
+    blocks: List[str] = []
+    lead: List[str] = []
+    for paragraph in _paragraphs(text or ''):
+        anchors = [_anchor(line) for line in paragraph]
+        if not any(anchors):
+            lead = paragraph if _is_lead(paragraph) else []
+            continue
+        split = _split_paragraph(paragraph, anchors)
+        if anchors[0]:
+            split[0] = lead + split[0]
+        lead = []
+        blocks.extend('\n'.join(block) for block in split)
+    return blocks
+
+
+def parse_contacts(text: str, workers: Optional[int] = None, threads: bool = False,
+                   preprocess: Optional[Callable[[str], Any]] = None) -> List[Dict[str, Any]]:
+    """Parse every contact in a blob.
+
+    Blocks from ``split_contacts`` are parsed with
+    ``parse_contact_fields_many``. Blocks that yield neither email nor
+    phone are dropped, as are later blocks repeating an email address
+    (a signature quoted throughout a thread).
+
+    Args:
+        text: Text describing several people
+        workers: Parse blocks over this many pool workers
+        threads: Use threads instead of processes for the pool
+        preprocess: Applied to each block before parsing, e.g. noise removal
+
+    Returns:
+        Contact fields in the order the people appear
+    """
+    blocks = split_contacts(text)
+    records = [preprocess(block) for block in blocks] if preprocess else blocks
+    contacts: List[Dict[str, Any]] = []
+    emails = set()
+    for result in parse_contact_fields_many(records, workers=workers, threads=threads):
+        if not result.ok:
+            sys.stderr.write(f"Warning: Skipping block {result.index + 1}: {result.error}\n")
+            continue
+        fields = result.fields
+        if not (fields['email'] or fields['phone']):
+            continue
+        email = (fields['email'] or '').lower()
+        if email in emails:
+            continue
+        if email:
+            emails.add(email)
+        contacts.append(fields)
+    return contacts
+
+
+def _paragraphs(text: str) -> List[List[str]]:
+    paragraphs: List[List[str]] = [[]]
+    for line in text.splitlines():
+        line = line.strip()
+        if line:
+            paragraphs[-1].append(line)
+        elif paragraphs[-1]:
+            paragraphs.append([])
+    return [paragraph for paragraph in paragraphs if paragraph]
+
+
+def _anchor(line: str) -> Optional[str]:
+    kinds = {token.kind for token in tokenize(line)}
+    if EMAIL in kinds:
+        return EMAIL
+    return PHONE if PHONE in kinds else None
+
+
+def _is_lead(paragraph: List[str]) -> bool:
+    return (len(paragraph) <= MAX_LEAD_LINES
+            and all(len(line.split()) <= MAX_LEAD_WORDS for line in paragraph))
+
+
+def _split_paragraph(lines: List[str], anchors: List[Optional[str]]) -> List[List[str]]:
+    key = EMAIL if EMAIL in anchors else PHONE
+    positions = [index for index, anchor in enumerate(anchors) if anchor == key]
+    lead = positions[0]
+
+    starts = [0]
+    for previous, current in zip(positions, positions[1:]):
+        if key == PHONE and current == previous + 1:
+            continue  # consecutive numbers (mobile, office) belong to one person
+        starts.append(max(previous + 1, current - lead))
+    bounds: List[Tuple[int, int]] = list(zip(starts, starts[1:] + [len(lines)]))
+    return [lines[start:end] for start, end in bounds]
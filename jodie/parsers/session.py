@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# jodie/parsers/session.py
+"""Incremental parsing of contact text that is edited a line at a time.
+
+A ParseSession keeps each segment's tokens and name classification keyed
+by the segment's text. After an edit only new or changed segments are
+tokenized and classified; the cross-segment stages (which email comes
+first, which segment is the name, what text is left for the company) and
+inference rerun over the cached pieces. Results match
+``extract_contact_fields`` on the same segments.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from .base import ParseResult
+from .extractor import Extraction, extract_from_buffer, normalize_segments
+from .lexer import Token, TokenBuffer, tokenize
+from .pipeline import ParserPipeline
+
+# Memoized classifications kept per live segment before the memo is reset
+MEMO_ENTRIES_PER_SEGMENT = 4
+
+
+class ParseSession:
+    """Parse state kept across edits to one contact's text.
+
+    Segments are the whitespace-collapsed input lines the parser sees (see
+    ``normalize_segments``). Edits mark the session stale; the next read of
+    ``extraction``, ``fields`` or ``results`` parses once, so several edits
+    between renders cost a single parse.
+
+    Example:
+        session = ParseSession(["Jane Smith", "CEO", "jane@acme.io"])
+        session.set(1, "VP of Sales")
+        session.fields["job_title"]  # "VP of Sales"
+    """
+
+    def __init__(self, lines: Any = None) -> None:
+        self._segments: List[str] = normalize_segments(lines)
+        self._tokens: Dict[str, List[Token]] = {}
+        self._memo: Dict[str, Any] = {}
+        self._extraction: Optional[Extraction] = None
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    @property
+    def segments(self) -> List[str]:
+        """The current segments, in order."""
+        return list(self._segments)
+
+    def set(self, index: int, text: str) -> None:
+        """Replace one segment with the segments of ``text``.
+
+        Multi-line text becomes several segments; blank text removes the
+        segment.
+        """
+        index = self._index(index)
+        self._edit(index, index + 1, text)
+
+    def insert(self, index: int, text: str) -> None:
+        """Insert the segments of ``text`` before position ``index``."""
+        self._edit(index, index, text)
+
+    def remove(self, index: int) -> None:
+        """Remove one segment."""
+        index = self._index(index)
+        self._edit(index, index + 1, None)
+
+    def update(self, lines: Any) -> None:
+        """Replace the whole input; unchanged lines reuse their cached work."""
+        segments = normalize_segments(lines)
+        if segments != self._segments:
+            self._segments = segments
+            self._extraction = None
+
+    @property
+    def extraction(self) -> Extraction:
+        """Extraction for the current segments, parsing if anything changed."""
+        if self._extraction is None:
+            self._extraction = self._extract()
+        return self._extraction
+
+    @property
+    def fields(self) -> Dict[str, Any]:
+        """Extracted field values, as ``parse_contact_fields`` returns them."""
+        return {name: list(value) if isinstance(value, list) else value
+                for name, value in self.extraction.fields.items()}
+
+    @property
+    def results(self) -> Dict[str, ParseResult]:
+        """Per-field ParseResults, as ``ParserPipeline.parse`` returns them."""
+        return ParserPipeline.from_extraction(self.extraction)
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += len(self._segments)
+        if not 0 <= index < len(self._segments):
+            raise IndexError("segment index out of range")
+        return index
+
+    def _edit(self, start: int, end: int, text: Optional[str]) -> None:
+        replacement = normalize_segments(text)
+        if self._segments[start:end] != replacement:
+            self._segments[start:end] = replacement
+            self._extraction = None
+
+    def _tokenize(self, segment: str) -> List[Token]:
+        tokens = self._tokens.get(segment)
+        if tokens is None:
+            tokens = self._tokens[segment] = tokenize(segment)
+        return tokens
+
+    def _extract(self) -> Extraction:
+        live = set(self._segments)
+        self._tokens = {segment: tokens for segment, tokens in self._tokens.items() if segment in live}
+        if len(self._memo) > MEMO_ENTRIES_PER_SEGMENT * (len(live) + 1):
+            self._memo.clear()
+        return extract_from_buffer(TokenBuffer(self._segments, self._tokenize), self._memo)
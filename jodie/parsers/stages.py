@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# jodie/parsers/stages.py
+"""Built-in extraction stages.
+
+Each stage reads one kind of field from the text earlier stages left
+unclaimed. Stages are run by ``extract_contact_fields`` in priority order
+(higher first); see ``jodie.parsers.registry`` for how they are enabled.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from jodie import profiling
+
+from .lexer import EMAIL, PHONE, URL
+from .parsers import EmailParser, NameParser, PhoneParser, TitleParser, WebsiteParser
+from .phones import label_before, normalize_phone, primary_phone
+
+NAME_BOUNDARY_PATTERN = re.compile(r'[\n\r|•·;,:\u2013\u2014]+')
+TITLE_CONNECTOR_PATTERN = re.compile(
+    r'\b(?:vp|head|director|president|vice president)\s+of\s+'
+    r'[A-Za-z][A-Za-z&/-]*(?:[ \t]+[A-Za-z][A-Za-z&/-]*){0,2}\b',
+    re.IGNORECASE,
+)
+
+BUSINESS_TERMS = {
+    "inc", "inc.", "llc", "ltd", "ltd.", "corp", "corp.", "corporation",
+    "co", "co.", "company", "technologies", "technology", "systems", "labs",
+    "studio", "studios", "group", "partners", "ventures", "capital"
+}
+
+Span = Tuple[int, int]
+
+# Confidence of each way a field can be read. A later stage replaces a
+# field only when it reads it with more confidence than it already has
+# and the field is still below the configured threshold.
+EMAIL_CONFIDENCE = 0.99
+RAW_EMAIL_CONFIDENCE = 0.7
+WEBSITE_CONFIDENCE = 0.95
+PHONE_CONFIDENCE = 0.95
+NATIONAL_PHONE_CONFIDENCE = 0.75  # country unknown
+NAME_BEFORE_EMAIL_CONFIDENCE = 0.9
+TITLE_CONFIDENCE = 0.85
+NAME_SEGMENT_CONFIDENCE = 0.8
+FIRST_NAME_ONLY_PENALTY = 0.25  # "Jane <jane@...>": a fuller name may follow
+NAME_COMPANY_SPLIT_CONFIDENCE = 0.7
+RESIDUAL_COMPANY_CONFIDENCE = 0.6
+
+_UNSCORED = object()
+
+
+class EmailStage:
+    """First email address, and the name written just before it."""
+    name = "email"
+    priority = 100
+    needs_words = False
+
+    @classmethod
+    def run(cls, state) -> None:
+        buffer, fields = state.buffer, state.fields
+        email_token = buffer.first(EMAIL)
+        if not email_token:
+            return
+        email = EmailParser.parse(email_token.text)
+        fields["email"] = email or email_token.text.strip("<>")
+
+        if state.enabled("first_name"):
+            name_candidate = _name_before_email(buffer.text[:email_token.start])
+            if name_candidate:
+                first_name, last_name, start, end = name_candidate
+                fields["first_name"] = first_name
+                fields["last_name"] = last_name
+                state.claim(("first_name", "last_name"), start, end,
+                            _name_score(NAME_BEFORE_EMAIL_CONFIDENCE, last_name))
+
+        state.claim(("email",), email_token.start, email_token.end,
+                    EMAIL_CONFIDENCE if email else RAW_EMAIL_CONFIDENCE)
+
+
+class WebsiteStage:
+    """Every URL; ones that don't parse are set aside."""
+    name = "website"
+    priority = 90
+    needs_words = False
+
+    @classmethod
+    def run(cls, state) -> None:
+        for token in state.buffer.unconsumed(URL):
+            website = WebsiteParser.parse(token.text)
+            if website:
+                state.fields["websites"].append(website)
+                state.claim(("websites",), token.start, token.end, WEBSITE_CONFIDENCE)
+            else:
+                state.buffer.consume(token.start, token.end)
+
+
+class PhoneStage:
+    """Every phone number with its label; the first non-fax one is primary."""
+    name = "phone"
+    priority = 80
+    needs_words = False
+
+    @classmethod
+    def run(cls, state) -> None:
+        buffer = state.buffer
+        numbers = []
+        for token in list(buffer.unconsumed(PHONE)):
+            label = label_before(buffer.text, token.start)
+            number = normalize_phone(token.text, label[0] if label else None)
+            if number:
+                number.start, number.end = token.start, token.end
+                numbers.append(number)
+                buffer.consume(label[1] if label else token.start, token.end)
+        primary = primary_phone(numbers)
+        if primary:
+            state.fields["phone"] = primary.value
+            state.fields["phones"] = [number.to_dict() for number in numbers]
+            state.spans["phone"] = [(primary.start, primary.end)]
+            state.spans["phones"] = [(number.start, number.end) for number in numbers]
+            state.confidence["phone"] = state.confidence["phones"] = (
+                PHONE_CONFIDENCE if primary.e164 else NATIONAL_PHONE_CONFIDENCE)
+
+
+class TitleStage:
+    """Job title from the title lexicon or a "VP of ..." phrase."""
+    name = "title"
+    priority = 60
+    needs_words = True
+
+    @classmethod
+    def run(cls, state) -> None:
+        if not state.wanted("job_title", TITLE_CONFIDENCE):
+            return
+        remaining, offsets = state.buffer.remaining()
+        title_match = _find_title_match(remaining)
+        if title_match:
+            title, start, end = title_match
+            state.fields["job_title"] = title
+            state.claim(("job_title",), *_to_buffer_span(offsets, start, end), TITLE_CONFIDENCE)
+
+
+class NameStage:
+    """Name from the best-looking segment, else "Name Company Inc" text."""
+    name = "name"
+    priority = 50
+    needs_words = True
+
+    @classmethod
+    def run(cls, state) -> None:
+        buffer, fields = state.buffer, state.fields
+        if state.wanted("first_name", NAME_SEGMENT_CONFIDENCE):
+            with profiling.timer("parse.name.residuals"):
+                residuals = buffer.segment_residuals()
+            with profiling.timer("parse.name.pick"):
+                name_candidate = _pick_name_segment([text for text, _, _ in residuals], state.memo)
+            if name_candidate:
+                first_name, last_name, index = name_candidate
+                score = _name_score(NAME_SEGMENT_CONFIDENCE, last_name)
+                if state.wanted("first_name", score):
+                    fields["first_name"] = first_name
+                    fields["last_name"] = last_name
+                    state.claim(("first_name", "last_name"), residuals[index][1], residuals[index][2], score)
+
+        if state.wanted("first_name", NAME_COMPANY_SPLIT_CONFIDENCE):
+            with profiling.timer("parse.name.split"):
+                remaining, offsets = buffer.remaining()
+                split_fields = _split_name_company(remaining)
+            if split_fields:
+                first_name, last_name, company_name = split_fields
+                fields["first_name"] = first_name
+                fields["last_name"] = last_name
+                company_start = len(remaining) - len(company_name)
+                state.claim(("first_name", "last_name"), *_to_buffer_span(offsets, 0, company_start - 1),
+                            NAME_COMPANY_SPLIT_CONFIDENCE)
+                if state.enabled("company"):
+                    fields["company"] = company_name
+                    state.claim(("company",), *_to_buffer_span(offsets, company_start, len(remaining)),
+                                NAME_COMPANY_SPLIT_CONFIDENCE)
+
+
+class CompanyStage:
+    """Company from whatever text no other stage claimed."""
+    name = "company"
+    priority = 40
+    needs_words = True
+
+    @classmethod
+    def run(cls, state) -> None:
+        if not state.wanted("company", RESIDUAL_COMPANY_CONFIDENCE):
+            return
+        remaining, offsets = state.buffer.remaining()
+        company = _company_from_residual(remaining, state.fields["websites"])
+        if company:
+            state.fields["company"] = company
+            start = len(remaining) - len(remaining.lstrip(" ,;|-\n"))
+            state.claim(("company",), *_to_buffer_span(offsets, start, start + len(company)),
+                        RESIDUAL_COMPANY_CONFIDENCE)
+
+
+def _name_score(score: float, last_name: Optional[str]) -> float:
+    return score if last_name else score - FIRST_NAME_ONLY_PENALTY
+
+
+def _to_buffer_span(offsets: List[int], start: int, end: int) -> Span:
+    """Map a span of rendered remaining text back to buffer offsets."""
+    return offsets[start], offsets[end - 1] + 1
+
+
+def _clean_text(text: str) -> str:
+    return re.sub(r'\s+', ' ', text or '').strip()
+
+
+def _name_before_email(prefix: str) -> Optional[Tuple[str, str, int, int]]:
+    stripped = prefix.rstrip().rstrip("<")
+    start = len(stripped) - len(stripped.lstrip().lstrip("<"))
+
+    for boundary in NAME_BOUNDARY_PATTERN.finditer(stripped, start):
+        start = boundary.end()
+    start += len(stripped[start:]) - len(stripped[start:].lstrip())
+    candidate = stripped[start:].rstrip()
+    if not candidate:
+        return None
+
+    first_name, last_name = NameParser.parse(candidate)
+    if _plausible_name(candidate, first_name, last_name):
+        return first_name, last_name, start, start + len(candidate)
+    return None
+
+
+def _find_title_match(text: str) -> Optional[Tuple[str, int, int]]:
+    text = text or ""
+
+    connector_match = TITLE_CONNECTOR_PATTERN.search(text)
+    if connector_match:
+        span = connector_match.span()
+    else:
+        from .titles import title_matcher
+        span = title_matcher().find(text)
+        if not span:
+            return None
+
+    raw = _clean_text(text[span[0]:span[1]])
+    return TitleParser.parse(raw) or raw, span[0], span[1]
+
+
+def _pick_name_segment(segments: List[str], memo: Optional[Dict[str, Any]] = None) -> Optional[Tuple[str, str, int]]:
+    best_candidate = None
+    best_score = 0
+
+    for index, segment in enumerate(segments):
+        if memo is None:
+            scored = _score_name_segment(segment)
+        else:
+            scored = memo.get(segment, _UNSCORED)
+            if scored is _UNSCORED:
+                scored = memo[segment] = _score_name_segment(segment)
+        if scored and scored[2] > best_score:
+            best_candidate = (scored[0], scored[1], index)
+            best_score = scored[2]
+
+    return best_candidate
+
+
+def _score_name_segment(segment: str) -> Optional[Tuple[str, str, int]]:
+    if EmailParser.parse(segment) or WebsiteParser.parse(segment) or PhoneParser.parse(segment):
+        return None
+    if _looks_like_company(segment):
+        return None
+
+    first_name, last_name = NameParser.parse(segment)
+    if not _plausible_name(segment, first_name, last_name):
+        return None
+
+    score = 1
+    if first_name:
+        score += 1
+    if last_name:
+        score += 2
+    if len(segment.split()) <= 3:
+        score += 1
+    return first_name, last_name, score
+
+
+def _plausible_name(text: str, first_name: str, last_name: str) -> bool:
+    if not first_name and not last_name:
+        return False
+
+    words = text.split()
+    if not words or len(words) > 4:
+        return False
+
+    lowered = {word.lower().strip(".,") for word in words}
+    if lowered & BUSINESS_TERMS:
+        return False
+
+    if any(char.isdigit() for char in text):
+        return False
+
+    return True
+
+
+def _looks_like_company(text: str) -> bool:
+    words = {word.lower().strip(".,") for word in text.split()}
+    return bool(words & BUSINESS_TERMS)
+
+
+def _company_from_residual(text: str, websites: List[str]) -> Optional[str]:
+    residual = _clean_text(text).strip(" ,;|-")
+    if not residual:
+        return None
+
+    if websites:
+        for url in websites:
+            domain = url.split("//")[-1].split("/")[0].lower()
+            if residual.lower() in domain or domain in residual.lower():
+                return residual
+
+    return residual
+
+
+def _split_name_company(text: str) -> Optional[Tuple[str, str, str]]:
+    words = text.split()
+    if len(words) < 3:
+        return None
+
+    business_index = None
+    for index, word in enumerate(words):
+        if word.lower().strip(".,") in BUSINESS_TERMS:
+            business_index = index
+            break
+
+    if business_index is not None and business_index >= 3:
+        company_start = max(2, business_index - 2)
+        name_text = " ".join(words[:company_start])
+        company_text = " ".join(words[company_start:])
+    else:
+        return None
+
+    first_name, last_name = NameParser.parse(name_text)
+    if _plausible_name(name_text, first_name, last_name) and len(company_text.split()) >= 2:
+        return first_name, last_name, company_text
+    return None
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# jodie/parsers/titles.py
+"""Word-level title matcher built once from the ``TitleParser`` lexicon.
+
+Every title (and every prefix + title combination) is loaded into a trie
+keyed on lower-cased words. A single left-to-right pass over the words of
+the input finds the longest title starting at each word, which is enough to
+pick the best title and to grow it into compound titles like
+"CEO & Co-founder".
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .parsers import TitleParser
+
+
+WORD_PATTERN = re.compile(r'\w+')
+
+# Connectors allowed between the halves of a compound title.
+CONNECTOR_SYMBOLS = frozenset({"&", "+", "/", ","})
+CONNECTOR_WORDS = frozenset({"and"})
+
+_TERMINAL = None
+
+
+def _normalize_gap(gap: str) -> str:
+    """Collapse whitespace-only gaps so ``vice  president`` still matches."""
+    return " " if gap.isspace() else gap
+
+
+class TitleMatcher:
+    """Find titles in text with a trie instead of one regex per title.
+
+    Titles are split into ``\\w+`` words; the text between two words of a
+    title (a space or a hyphen) is part of the trie key, so "co-founder"
+    does not match "co founder" and vice versa, exactly as the per-title
+    regexes did.
+    """
+
+    def __init__(self, titles: Iterable[str]) -> None:
+        self._root: Dict = {}
+        for title in titles:
+            self.add(title)
+
+    def add(self, title: str) -> None:
+        """Add a single title to the trie.
+
+        Args:
+            title: Title text, e.g. "senior software engineer"
+        """
+        lowered = title.lower()
+        node = self._root
+        previous_end = None
+        for match in WORD_PATTERN.finditer(lowered):
+            gap = "" if previous_end is None else _normalize_gap(lowered[previous_end:match.start()])
+            node = node.setdefault((gap, match.group(0)), {})
+            previous_end = match.end()
+        if node is not self._root:
+            # Longer titles (by words, then characters) take precedence.
+            node[_TERMINAL] = (len(title.split()), len(title))
+
+    def find(self, text: str) -> Optional[Tuple[int, int]]:
+        """Locate the best title in text, expanded across compound connectors.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            (start, end) character offsets of the title, or None
+        """
+        words = [(m.group(0).lower(), m.start(), m.end()) for m in WORD_PATTERN.finditer(text or "")]
+        if not words:
+            return None
+
+        longest = self._longest_matches(text, words)
+        if not longest:
+            return None
+
+        best_start, (best_end, _) = max(
+            longest.items(), key=lambda item: (item[1][1], -item[0])
+        )
+        start, end = best_start, best_end
+        for chain_start, chain_end in self._compound_chains(text, words, longest):
+            if chain_start <= best_start and chain_end >= best_end:
+                start, end = chain_start, chain_end
+                break
+
+        return words[start][1], words[end - 1][2]
+
+    def _longest_matches(self, text: str, words: List[Tuple[str, int, int]]) -> Dict[int, Tuple[int, Tuple[int, int]]]:
+        """Map each word index to the end index and rank of its longest title."""
+        longest: Dict[int, Tuple[int, Tuple[int, int]]] = {}
+        count = len(words)
+        for index in range(count):
+            node = self._root.get(("", words[index][0]))
+            position = index
+            found = None
+            while node is not None:
+                position += 1
+                if _TERMINAL in node:
+                    found = (position, node[_TERMINAL])
+                if position >= count:
+                    break
+                gap = _normalize_gap(text[words[position - 1][2]:words[position][1]])
+                node = node.get((gap, words[position][0]))
+            if found:
+                longest[index] = found
+        return longest
+
+    @staticmethod
+    def _compound_chains(text: str, words: List[Tuple[str, int, int]],
+                         longest: Dict[int, Tuple[int, Tuple[int, int]]]) -> List[Tuple[int, int]]:
+        """Join adjacent titles separated by connectors, scanning left to right."""
+        chains = []
+        count = len(words)
+        index = 0
+        while index < count:
+            if index not in longest:
+                index += 1
+                continue
+
+            end = longest[index][0]
+            parts = 1
+            while end < count:
+                gap = text[words[end - 1][2]:words[end][1]]
+                if gap.strip() in CONNECTOR_SYMBOLS and end in longest:
+                    end = longest[end][0]
+                elif (
+                    (not gap or gap.isspace())
+                    and words[end][0] in CONNECTOR_WORDS
+                    and end + 1 < count
+                    and text[words[end][2]:words[end + 1][1]].isspace()
+                    and end + 1 in longest
+                ):
+                    end = longest[end + 1][0]
+                else:
+                    break
+                parts += 1
+
+            if parts > 1:
+                chains.append((index, end))
+                index = end
+            else:
+                index += 1
+        return chains
+
+
+def title_candidates() -> List[str]:
+    """Every known title plus each prefix + title combination, longest first."""
+    candidates = set(TitleParser.COMMON_TITLES)
+    for prefix in TitleParser.PREFIXES:
+        for title in TitleParser.COMMON_TITLES:
+            if not title.startswith(prefix + " "):
+                candidates.add(f"{prefix} {title}")
+    return sorted(candidates, key=lambda value: (len(value.split()), len(value)), reverse=True)
+
+
+@lru_cache(maxsize=None)
+def title_matcher() -> TitleMatcher:
+    """Return the process-wide matcher, building it on first use."""
+    return TitleMatcher(title_candidates())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# jodie/profiling.py
+"""Opt-in timers for where a parse, a preprocess or a save spends its time.
+
+Off by default; while off, instrumented code pays one global lookup per
+stage. ``enable()`` (the CLI's ``--profile``) turns the timers on and
+``collect_stats()`` reports total time and call counts per stage, plus
+which stage produced each field. Stats cover the current process only;
+pool workers keep their own. While ``jodie.metrics`` is on, the same
+timers also feed its stage latency histogram.
+"""
+
+import threading
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from jodie import metrics
+
+enabled = False
+
+_lock = threading.Lock()
+_times: Dict[str, int] = {}
+_calls: Counter = Counter()
+_sources: Dict[str, Counter] = {}
+
+
+def enable(on: bool = True) -> None:
+    """Turn the timers on (or off); stats collected so far are kept."""
+    global enabled
+    enabled = on
+
+
+def timing() -> bool:
+    """True while stage timers record, for profiling or for metrics."""
+    return enabled or metrics.enabled
+
+
+def timer(name: str) -> Any:
+    """Context manager timing its block as stage ``name`` while timing."""
+    return metrics.Timer(_timed, name) if enabled or metrics.enabled else metrics.NULL_TIMER
+
+
+def _timed(elapsed_ns: int, name: str) -> None:
+    record(name, elapsed_ns)
+
+
+def record(name: str, elapsed_ns: int) -> None:
+    """Add one call of stage ``name`` that took ``elapsed_ns``."""
+    if metrics.enabled:
+        metrics.STAGE_SECONDS.observe(elapsed_ns / 1e9, name)
+    if not enabled:
+        return
+    with _lock:
+        _times[name] = _times.get(name, 0) + elapsed_ns
+        _calls[name] += 1
+
+
+def record_source(field_name: str, stage: str) -> None:
+    """Note that ``stage`` produced the value of ``field_name``."""
+    if not enabled:
+        return
+    with _lock:
+        _sources.setdefault(field_name, Counter())[stage] += 1
+
+
+def reset() -> None:
+    """Forget all collected stats."""
+    with _lock:
+        _times.clear()
+        _calls.clear()
+        _sources.clear()
+
+
+def collect_stats(reset_after: bool = False) -> Dict[str, Any]:
+    """Snapshot of the stats collected since the last reset.
+
+    Args:
+        reset_after: Clear the stats once read
+
+    Returns:
+        {"stages": {name: {"calls", "total_ms", "mean_us"}},
+         "fields": {field: {stage: times produced}}}
+    """
+    with _lock:
+        stats = {
+            "stages": {
+                name: {
+                    "calls": _calls[name],
+                    "total_ms": total / 1e6,
+                    "mean_us": total / _calls[name] / 1e3,
+                }
+                for name, total in sorted(_times.items())
+            },
+            "fields": {field_name: dict(counts) for field_name, counts in sorted(_sources.items())},
+        }
+    if reset_after:
+        reset()
+    return stats
+
+
+def format_stats(stats: Optional[Dict[str, Any]] = None) -> str:
+    """Human-readable report of ``collect_stats()``, slowest stage first."""
+    stats = stats or collect_stats()
+    rows = [f"{'stage':<32} {'calls':>8} {'total ms':>10} {'mean us':>10}"]
+    for name, stage in sorted(stats["stages"].items(), key=lambda item: -item[1]["total_ms"]):
+        rows.append(f"{name:<32} {stage['calls']:>8} {stage['total_ms']:>10.3f} {stage['mean_us']:>10.1f}")
+    if stats["fields"]:
+        rows.append("")
+        rows.append(f"{'field':<32} produced by")
+        for field_name, sources in stats["fields"].items():
+            produced = ", ".join(f"{stage} ({count})" if count > 1 else stage
+                                 for stage, count in sorted(sources.items(), key=lambda item: -item[1]))
+            rows.append(f"{field_name:<32} {produced}")
+    return "\n".join(rows)
@@ -2,6 +2,27 @@
 """Shared pytest fixtures for jodie tests."""
 import pytest
 
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    """An empty contact storage backend, once per built-in kind."""
+    from jodie.contact.memory import MemoryBackend
+    from jodie.contact.sqlite import SQLiteBackend
+
+    opened = MemoryBackend() if request.param == "memory" else SQLiteBackend(tmp_path / "contacts.sqlite3")
+    yield opened
+    opened.close()
+
+
+@pytest.fixture(autouse=True)
+def default_storage():
+    """Restore the default storage config after each test."""
+    yield
+    from jodie.contact.backend import configure_storage
+
+    configure_storage(None)
+
+
 @pytest.fixture
 def sample_signatures():
     """Sample email signatures for testing."""
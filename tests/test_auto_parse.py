@@ -2,7 +2,7 @@
 """Regression tests for CLI auto parsing."""
 
 from jodie.cli.__main__ import parse_auto
-from jodie.parsers import ParserPipeline
+from jodie.parsers import ParserPipeline, extract_contact_fields
 
 
 def test_single_quoted_contact_extracts_all_fields():
@@ -86,3 +86,40 @@ def test_parser_pipeline_uses_auto_extractor():
     assert fields["job_title"] == "Founder"
     assert fields["company"] == "Example AI"
     assert fields["phone"] == "4155555555"
+
+
+def test_extraction_reports_field_spans():
+    extraction = extract_contact_fields([
+        "Jane Smith <jane@startup.io>",
+        "CEO, Startup Inc",
+        "415-555-1234",
+    ])
+
+    assert extraction.fields["email"] == "jane@startup.io"
+    assert extraction.consumed_text("first_name") == "Jane Smith"
+    assert extraction.consumed_text("email") == "<jane@startup.io>"
+    assert extraction.consumed_text("job_title") == "CEO"
+    assert extraction.consumed_text("company") == "Startup Inc"
+    assert extraction.consumed_text("phone") == "415-555-1234"
+
+
+def test_title_connector_stays_on_its_line():
+    fields = parse_auto([
+        "Li Wei",
+        "VP of Sales",
+        "Startup Inc",
+        "li@startup.io",
+    ])
+
+    assert fields["first_name"] == "Li"
+    assert fields["last_name"] == "Wei"
+    assert fields["job_title"] == "VP of Sales"
+    assert fields["company"] == "Startup Inc"
+
+
+def test_parser_pipeline_marks_inferred_fields():
+    results = ParserPipeline.parse(["Jane Smith jane@acme.com"])
+
+    assert results["email"].consumed_text == "jane@acme.com"
+    assert results["company"].value == "Acme"
+    assert results["company"].source == "inferred"
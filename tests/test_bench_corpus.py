@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Tests for the synthetic signature corpus generator."""
+import io
+import json
+
+from jodie.bench.corpus import LAYOUTS, generate, main, write_jsonl
+
+
+def test_same_seed_same_records():
+    assert list(generate(50, seed=7)) == list(generate(50, seed=7))
+    assert list(generate(50, seed=7)) != list(generate(50, seed=8))
+
+
+def test_longer_run_extends_shorter_one():
+    assert list(generate(200, seed=3))[:20] == list(generate(20, seed=3))
+
+
+def test_expected_values_appear_in_text():
+    for record in generate(300, seed=1):
+        text, expected = record["text"], record["expected"]
+        assert record["layout"] in LAYOUTS
+        for name in ("first_name", "last_name", "email", "job_title", "company"):
+            assert expected[name] is None or expected[name] in text
+        assert all(url in text for url in expected["websites"])
+
+
+def test_phone_truth_is_normalized():
+    phones = [record["expected"]["phone"] for record in generate(300, seed=2)]
+    assert all(phone is None or phone.isdigit() and len(phone) == 10 or phone.startswith("+")
+               for phone in phones)
+    assert any(phone and phone.startswith("+") for phone in phones)
+
+
+def test_writes_jsonl(tmp_path):
+    buffer = io.StringIO()
+    assert write_jsonl(generate(5), buffer) == 5
+    assert [json.loads(line)["id"] for line in buffer.getvalue().splitlines()] == [0, 1, 2, 3, 4]
+
+    output = tmp_path / "corpus.jsonl"
+    assert main(["12", "--seed=5", f"--output={output}"]) == 0
+    assert len(output.read_text(encoding="utf-8").splitlines()) == 12
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Tests for the benchmark runner."""
+import json
+
+from benchmarks.run import benchmarks, compare, main, measure, run
+
+
+def result(records_per_sec):
+    return {"results": {"parse_contact_fields/short": {
+        "records": 1, "records_per_sec": records_per_sec, "p50_us": 1.0, "p99_us": 1.0}}}
+
+
+def test_every_target_runs_on_every_corpus():
+    names = benchmarks()
+    assert "SignaturePreprocessor.preprocess/pathological" in names
+    assert "TitleParser.parse/typical" in names
+    assert len(names) == 8 * 3
+
+
+def test_measure_reports_throughput_and_latency():
+    stats = measure(len, ["a", "bb"], min_time=0)
+    assert stats["records"] == 2
+    assert stats["records_per_sec"] > 0
+    assert stats["p50_us"] <= stats["p99_us"]
+
+
+def test_run_filters_by_prefix():
+    results = run(["EmailParser.parse/short"], min_time=0)
+    assert list(results["results"]) == ["EmailParser.parse/short"]
+    assert results["schema"] == 1
+
+
+def test_compare_flags_only_regressions_beyond_threshold():
+    assert compare(result(95), result(100), 0.1) == []
+    assert compare(result(120), result(100), 0.1) == []
+    assert compare(result(80), result(100), 0.1) == [
+        "parse_contact_fields/short: 100 -> 80 records/sec (-20.0%)"]
+
+
+def test_main_fails_against_faster_baseline(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    assert main(["--only", "EmailParser.parse/short", "--min-time", "0", "--output", str(baseline)]) == 0
+    saved = json.loads(baseline.read_text())
+    saved["results"]["EmailParser.parse/short"]["records_per_sec"] *= 100
+    baseline.write_text(json.dumps(saved))
+
+    assert main(["--only", "EmailParser.parse/short", "--min-time", "0", "--compare", str(baseline)]) == 1
+    assert "Throughput regressed" in capsys.readouterr().out
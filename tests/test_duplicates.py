@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Tests for duplicate keys, the duplicate index and skip/merge saves."""
+import pytest
+
+from jodie.cli.__main__ import run
+from jodie.cli.importer import save_batch
+from jodie.cli.serve import parse_args
+from jodie.contact.backend import MERGE, SKIP, configure_storage, duplicate_policy
+from jodie.contact.duplicates import DuplicateIndex, contact_keys, phone_key, profile_key
+from jodie.contact.memory import MemoryBackend
+
+JANE = {'first_name': 'Jane', 'last_name': 'Smith', 'email': 'jane@acme.io',
+        'websites': ['https://www.linkedin.com/in/janesmith/']}
+
+
+def test_profile_and_phone_keys():
+    assert profile_key("https://www.LinkedIn.com/in/JaneSmith/?trk=x") == ("linkedin", "in/janesmith")
+    assert profile_key("uk.linkedin.com/in/janesmith") == ("linkedin", "in/janesmith")
+    assert profile_key("http://github.com/jsmith/dotfiles") == ("github", "jsmith")
+    assert profile_key("https://github.com/orgs/acme") is None
+    assert profile_key("https://acme.io/team") is None
+    assert phone_key("(415) 555-1234 ext. 22") == ("phone", "+14155551234")
+    assert phone_key("+1 415 555 1234") == phone_key("4155551234") == ("phone", "+14155551234")
+    assert phone_key("020 7946 0958") == ("phone", "02079460958")
+    assert phone_key("+44 20 7946 0958") == ("phone", "+442079460958")
+    assert phone_key("555-12") is None
+    keys = contact_keys({'email': 'Jane@Acme.io', 'phone': '415.555.1234',
+                         'websites': [{'url': 'https://github.com/jsmith'}]})
+    assert keys == [("email", "jane@acme.io"), ("github", "jsmith"), ("phone", "+14155551234")]
+
+
+def test_index_find_and_discard():
+    index = DuplicateIndex.build([{'id': 'A', 'email': 'jane@acme.io'},
+                                  {'id': 'B', 'phones': [{'number': '415-555-1234'}]}])
+    assert index.find({'email': 'JANE@acme.io'}) == 'A'
+    assert index.find_many([{'phone': '+1'}, {'phone': '(415) 555 1234'}]) == [None, 'B']
+    index.discard('A')
+    assert index.find({'email': 'jane@acme.io'}) is None and len(index) == 1
+
+
+def test_national_number_matches_stored_e164(backend):
+    # The Contacts backend stores numbers in E.164 form
+    stored = backend.save({'first_name': 'Jane', 'last_name': 'Smith',
+                           'phones': [{'number': '+14155551234', 'label': 'mobile', 'extension': None}]})
+    national = {'first_name': 'Jane', 'last_name': 'Smith', 'phone': '415-555-1234'}
+    assert backend.save_many([national], duplicates="skip").duplicates == {0: stored}
+    report = backend.save_many([{**national, 'email': 'jane@acme.io'}], duplicates="merge")
+    assert report.duplicates == {0: stored}
+    merged = backend.fetch(stored)
+    assert merged['email'] == 'jane@acme.io' and len(merged['phones']) == 1
+
+
+def test_skip_matches_stored_and_earlier_contacts(backend):
+    stored = backend.save(JANE)
+    report = backend.save_many([
+        {'first_name': 'J', 'last_name': 'Smith', 'email': 'JANE@ACME.IO'},
+        {'first_name': 'Jane', 'last_name': 'S', 'email': 'js@home.net',
+         'websites': ['linkedin.com/in/janesmith']},
+        {'first_name': 'Bob', 'last_name': 'Lee', 'phone': '415-555-0000'},
+        {'first_name': 'Robert', 'last_name': 'Lee', 'phone': '(415) 555-0000'},
+    ], duplicates=SKIP)
+    assert report.duplicates == {0: stored, 1: stored, 3: report.saved[2]}
+    assert list(report.saved) == [2] and report.ok
+    assert len(list(backend.contacts())) == 2
+    assert backend.save(JANE, duplicates=SKIP) == stored
+
+
+def test_merge_adds_missing_details(backend):
+    stored = backend.save({**JANE, 'job_title': 'CEO'})
+    report = backend.save_many([{'first_name': 'Jane', 'last_name': 'Smith', 'email': 'jane@acme.io',
+                                 'job_title': 'Chief Executive', 'company': 'Acme',
+                                 'phone': '415-555-1234', 'websites': ['https://github.com/jsmith']}],
+                               duplicates=MERGE)
+    assert report.duplicates == {0: stored}
+    merged = backend.fetch(stored)
+    assert merged['job_title'] == 'CEO' and merged['company'] == 'Acme'
+    assert merged['phone'] == '4155551234'
+    assert [site['url'] for site in merged['websites']] == ['https://www.linkedin.com/in/janesmith/',
+                                                            'https://github.com/jsmith']
+    # The index learned the merged keys
+    assert backend.duplicate_index().find({'phone': '4155551234'}) == stored
+    assert not backend.merge(stored, JANE)
+
+
+def test_delete_removes_contact_from_index(backend):
+    stored = backend.save(JANE)
+    assert backend.duplicate_index().find(JANE) == stored
+    backend.delete(stored)
+    assert backend.save_many([JANE], duplicates=SKIP).saved
+
+
+def test_policy_from_config_and_flag():
+    assert duplicate_policy() == "keep"
+    configure_storage({"storage": {"duplicates": "merge"}})
+    assert duplicate_policy() == "merge"
+    assert duplicate_policy("Skip") == "skip"
+    with pytest.raises(ValueError, match="Unknown duplicate policy"):
+        duplicate_policy("replace")
+
+
+def test_cli_reports_duplicates(capsys):
+    backend = MemoryBackend()
+    stored = backend.save(JANE)
+    with pytest.raises(SystemExit) as exit_info:
+        run(parse_args(['new', 'Jane Smith', 'jane@acme.io', '--duplicates=skip']), backend=backend)
+    assert exit_info.value.code == 0
+    assert f"Duplicate: skipped, already saved as {stored}" in capsys.readouterr().out
+
+    assert save_batch([(1, JANE), (2, {**JANE, 'email': 'other@acme.io'})], backend,
+                      duplicates=SKIP) == (0, 2, 0)
+    assert "Row 1: duplicate, skipped, already saved as" in capsys.readouterr().err
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Tests for harvesting contacts from mailboxes."""
+from jodie.cli.harvest import harvest_contacts, run_harvest
+from jodie.input.mailbox import SeenMessages, iter_mailbox, signature_region
+
+
+MBOX_TEXT = b"""From jane@startup.io Mon Jan  1 00:00:00 2024
+From: Jane Smith <jane@startup.io>
+Message-ID: <1@startup.io>
+Subject: Hello
+
+Thanks for the intro.
+
+--
+Jane Smith
+CEO, Startup Inc
+jane@startup.io | 415-555-1234
+
+From li@example.com Tue Jan  2 00:00:00 2024
+From: Li Wei <li@example.com>
+Message-ID: <2@example.com>
+Content-Type: text/plain; charset=utf-8
+Content-Transfer-Encoding: quoted-printable
+
+Sounds good.
+
+Li Wei
+Product Manager
+4155550000
+
+On Mon, Jan 1, 2024 at 9:00 AM Jane Smith <jane@startup.io> wrote:
+> Thanks for the intro.
+> Bob Quoted 212-555-0000
+
+From jane@startup.io Wed Jan  3 00:00:00 2024
+From: Jane Smith <jane@startup.io>
+Message-ID: <3@startup.io>
+Content-Type: multipart/alternative; boundary="XYZ"
+
+--XYZ
+Content-Type: text/plain; charset=utf-8
+
+See you then.
+--
+Jane Smith
+VP of Sales, Startup Inc
+jane@startup.io
+
+--XYZ
+Content-Type: text/html
+
+<p>See you then.</p>
+--XYZ--
+"""
+
+
+def _mbox(tmp_path):
+    path = tmp_path / "inbox.mbox"
+    path.write_bytes(MBOX_TEXT)
+    return path
+
+
+class TestMailbox:
+    def test_mbox_messages(self, tmp_path):
+        messages = list(iter_mailbox(_mbox(tmp_path)))
+        assert [m.key for m in messages] == ["<1@startup.io>", "<2@example.com>", "<3@startup.io>"]
+        assert messages[0].signature.strip().startswith("Jane Smith")
+        assert "Thanks for the intro" not in messages[0].signature
+
+    def test_quoted_history_is_dropped(self, tmp_path):
+        signature = list(iter_mailbox(_mbox(tmp_path)))[1].signature
+        assert "Li Wei" in signature
+        assert "Bob Quoted" not in signature
+
+    def test_multipart_uses_plain_text(self, tmp_path):
+        signature = list(iter_mailbox(_mbox(tmp_path)))[2].signature
+        assert "VP of Sales" in signature
+        assert "<p>" not in signature
+
+    def test_maildir(self, tmp_path):
+        (tmp_path / "cur").mkdir()
+        (tmp_path / "new").mkdir()
+        (tmp_path / "new" / "1.eml").write_bytes(MBOX_TEXT.split(b"\n", 1)[1].split(b"\nFrom li@")[0])
+        messages = list(iter_mailbox(tmp_path))
+        assert [m.key for m in messages] == ["<1@startup.io>"]
+
+    def test_encoded_sender(self, tmp_path):
+        path = tmp_path / "one.mbox"
+        path.write_bytes(b"From x\nFrom: =?utf-8?q?Jos=C3=A9_Garc=C3=ADa?= <jose@example.com>\n\nHi\n")
+        assert next(iter_mailbox(path)).sender == "Jos\u00e9 Garc\u00eda <jose@example.com>"
+
+    def test_long_body_keeps_only_the_tail(self):
+        body = b"\n" + b"x" * 10000 + b"\nJane Smith\n"
+        start, end = signature_region(body, 1, len(body))
+        assert body[start:end] == b"Jane Smith\n"
+
+    def test_seen_messages_persist(self, tmp_path):
+        seen = SeenMessages(tmp_path / "state" / "seen")
+        seen.add(["<1@a>", "<2@a>"])
+        assert "<1@a>" in SeenMessages(tmp_path / "state" / "seen")
+        assert len(SeenMessages(tmp_path / "state" / "seen")) == 2
+
+
+class TestHarvest:
+    def test_latest_signature_per_sender(self, tmp_path):
+        [batch] = harvest_contacts(iter_mailbox(_mbox(tmp_path)))
+        contacts = {fields['email']: fields for _, fields, _ in batch}
+        assert [(key, replaced) for key, _, replaced in batch] == [("<2@example.com>", []),
+                                                                  ("<3@startup.io>", ["<1@startup.io>"])]
+        assert sorted(contacts) == ["jane@startup.io", "li@example.com"]
+        assert contacts["jane@startup.io"]['job_title'] == "VP of Sales"
+        li = contacts["li@example.com"]
+        assert (li['first_name'], li['last_name'], li['phone']) == ("Li", "Wei", "4155550000")
+
+    def test_seen_messages_are_skipped(self, tmp_path):
+        seen = SeenMessages(tmp_path / "seen")
+        seen.add(["<1@startup.io>", "<3@startup.io>"])
+        batches = list(harvest_contacts(iter_mailbox(_mbox(tmp_path)), seen))
+        assert [[key for key, _, _ in batch] for batch in batches] == [["<2@example.com>"]]
+
+    def test_dry_run(self, tmp_path, capsys):
+        args = {'PATH': str(_mbox(tmp_path)), '--seen': str(tmp_path / "seen"),
+                '--batch-size': '100', '--dry-run': True}
+        assert run_harvest(args) == 0
+        out = capsys.readouterr().out
+        assert "Jane Smith" in out and "Li Wei" in out
+        assert "3 new messages, 2 senders" in out
+        # A dry run records nothing.
+        assert not (tmp_path / "seen").exists()
+
+    def test_batches_are_yielded_as_the_mailbox_is_read(self, tmp_path):
+        read = []
+
+        def messages():
+            for message in iter_mailbox(_mbox(tmp_path)):
+                read.append(message.key)
+                yield message
+
+        batches = harvest_contacts(messages(), batch_size=1)
+        assert next(batches)[0][0] == "<1@startup.io>"
+        assert read == ["<1@startup.io>"]
+        # Jane was harvested in the first batch, so her later message is only recorded.
+        assert [[(key, fields and fields['email']) for key, fields, _ in batch] for batch in batches] == [
+            [("<2@example.com>", "li@example.com")], [("<3@startup.io>", None)]]
+
+    def test_failed_saves_are_retried(self, tmp_path, monkeypatch, capsys):
+        from jodie.contact import backend as backend_module
+        from jodie.contact.backend import StorageError
+        from jodie.contact.memory import MemoryBackend
+
+        class LiOffline(MemoryBackend):
+            def _write(self, records):
+                if any(record['email'] == 'li@example.com' for record in records):
+                    raise StorageError("store unavailable")
+                return super()._write(records)
+
+        store = LiOffline()
+        monkeypatch.setattr(backend_module, "open_backend", lambda *args, **kwargs: store)
+        args = {'PATH': str(_mbox(tmp_path)), '--seen': str(tmp_path / "seen"), '--batch-size': '1'}
+        assert run_harvest(args) == 1
+        assert "1 failed" in capsys.readouterr().out
+        seen = SeenMessages(tmp_path / "seen")
+        assert "<1@startup.io>" in seen and "<3@startup.io>" in seen
+        assert "<2@example.com>" not in seen
+        assert [record['email'] for record in store.contacts()] == ["jane@startup.io"]
+
+    def test_replaced_messages_wait_for_the_latest_save(self, tmp_path, monkeypatch, capsys):
+        from jodie.contact import backend as backend_module
+        from jodie.contact.backend import StorageError
+        from jodie.contact.memory import MemoryBackend
+
+        class JaneOffline(MemoryBackend):
+            def _write(self, records):
+                if any(record['email'] == 'jane@startup.io' for record in records):
+                    raise StorageError("store unavailable")
+                return super()._write(records)
+
+        monkeypatch.setattr(backend_module, "open_backend", lambda *args, **kwargs: JaneOffline())
+        args = {'PATH': str(_mbox(tmp_path)), '--seen': str(tmp_path / "seen"), '--batch-size': '100'}
+        assert run_harvest(args) == 1
+        capsys.readouterr()
+        seen = SeenMessages(tmp_path / "seen")
+        # Jane's latest message failed to save, so the earlier one it replaced isn't recorded either.
+        assert "<1@startup.io>" not in seen and "<3@startup.io>" not in seen
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Tests for streaming bulk import."""
+import io
+import pytest
+from jodie.cli.importer import iter_contacts, parse_column_map, plan_import, run_import
+from jodie.input.records import detect_format, iter_records
+
+
+CSV_TEXT = """First Name,Last Name,Email,Company
+Jane,Smith,jane@startup.io,Startup Inc
+John,Doe,,Acme
+"""
+
+JSONL_TEXT = """{"name": "Li Wei", "email": "li@example.com"}
+"Jane Smith jane@startup.io CEO"
+["John Smith", "john@example.ai", "4155555555"]
+"""
+
+
+def _args(path, **extra):
+    args = {'FILE': str(path), '--format': None, '--columns': None,
+            '--batch-size': '2', '--workers': '1', '--dry-run': True}
+    args.update(extra)
+    return args
+
+
+class TestRecords:
+    def test_detect_format(self):
+        assert detect_format("people.csv") == "csv"
+        assert detect_format("people.jsonl") == "jsonl"
+        assert detect_format("people.tsv") == "tsv"
+        assert detect_format("people.txt", "JSONL") == "jsonl"
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError):
+            detect_format("people.csv", "xml")
+
+    def test_csv_rows_drop_empty_cells(self):
+        rows = list(iter_records(io.StringIO(CSV_TEXT), "csv"))
+        assert rows[1] == {"First Name": "John", "Last Name": "Doe", "Company": "Acme"}
+
+    def test_jsonl_shapes(self):
+        rows = list(iter_records(io.StringIO(JSONL_TEXT), "jsonl"))
+        assert rows[0] == {"name": "Li Wei", "email": "li@example.com"}
+        assert rows[1] == {"text": "Jane Smith jane@startup.io CEO"}
+        assert rows[2] == {"text": ["John Smith", "john@example.ai", "4155555555"]}
+
+
+class TestColumnMapping:
+    def test_parse_column_map(self):
+        assert parse_column_map("Mail=email, Who=Full Name") == {"Mail": "email", "Who": "full_name"}
+
+    def test_parse_column_map_rejects_unknown_field(self):
+        with pytest.raises(ValueError):
+            parse_column_map("Mail=shoe_size")
+
+
+
+class TestIterContacts:
+    def test_mixed_rows_keep_order(self):
+        mapping, rows = plan_import(iter_records(io.StringIO(JSONL_TEXT), "jsonl"), {})
+        contacts = list(iter_contacts(rows, mapping))
+        assert [number for number, _ in contacts] == [1, 2, 3]
+        assert contacts[0][1]["first_name"] == "Li"
+        assert contacts[0][1]["last_name"] == "Wei"
+        assert contacts[1][1]["job_title"] == "CEO"
+        assert contacts[2][1]["phone"] == "4155555555"
+
+    def test_mixed_rows_keep_order_with_workers(self):
+        mapping, rows = plan_import(iter_records(io.StringIO(JSONL_TEXT), "jsonl"), {})
+        expected = list(iter_contacts(rows, mapping))
+        mapping, rows = plan_import(iter_records(io.StringIO(JSONL_TEXT), "jsonl"), {})
+        assert list(iter_contacts(rows, mapping, workers=2, chunksize=1)) == expected
+
+
+class TestRunImport:
+    def test_dry_run(self, tmp_path, capsys):
+        path = tmp_path / "people.csv"
+        path.write_text(CSV_TEXT)
+        assert run_import(_args(path)) == 0
+        out = capsys.readouterr().out
+        assert "ok    Jane Smith | jane@startup.io | Startup Inc" in out
+        assert "skip  John Doe | Acme" in out
+        assert "2 rows, 1 ready to save, 1 skipped." in out
+
+    def test_dry_run_shows_mapping_overrides(self, tmp_path, capsys):
+        path = tmp_path / "export.csv"
+        path.write_text("Who,Mail,Org\n" + "".join(
+            f"{name} Smith,{name.lower()}@acme.com,Acme Inc\n" for name in ("Ann", "Bo", "Cy")))
+        assert run_import(_args(path, **{'--columns': 'Org=note'})) == 0
+        out = capsys.readouterr().out
+        assert "Who   ->  full_name   inferred" in out
+        assert "Mail  ->  email       inferred" in out
+        assert "Org   ->  note        explicit, inferred company" in out
+
+    def test_bad_batch_size(self, tmp_path, capsys):
+        assert run_import(_args(tmp_path / "x.csv", **{'--batch-size': '0'})) == 1
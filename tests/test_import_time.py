@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Import-time budget: parsing and the CLI's cheap paths stay light."""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Generous: a warm import takes a fraction of this. Loading PyObjC or the
+# process pool eagerly again shows up in the module checks below first.
+IMPORT_BUDGET_MS = 250
+
+CONTACTS_BRIDGE = ("objc", "Contacts", "Foundation")
+
+
+def run_fresh(code):
+    """Run code in a new interpreter; returns what it prints as JSON."""
+    script = ("import json, sys, time\n"
+              "start = time.perf_counter()\n"
+              f"{code}\n"
+              "print(json.dumps({'ms': (time.perf_counter() - start) * 1000, 'modules': sorted(sys.modules)}))\n")
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True,
+                            timeout=60)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def cli(*argv):
+    return ("from jodie.cli.__main__ import main\n"
+            "try:\n"
+            f"    main({list(argv)!r})\n"
+            "except SystemExit:\n"
+            "    pass")
+
+
+def test_parsing_import_is_light():
+    loaded = run_fresh("from jodie.parsers import parse_contact_fields")
+    assert loaded["ms"] < IMPORT_BUDGET_MS
+    modules = set(loaded["modules"])
+    assert not modules & set(CONTACTS_BRIDGE)
+    assert not modules & {"nameparser", "docopt", "multiprocessing", "jodie.parsers.batch"}
+
+
+def test_package_import_defers_submodules():
+    modules = set(run_fresh("import jodie")["modules"])
+    assert not modules & {"jodie.contact", "jodie.parsers", *CONTACTS_BRIDGE}
+
+
+def test_help_and_version_load_no_parsers():
+    for argv in (["--version"], ["new", "--help"]):
+        modules = set(run_fresh(cli(*argv))["modules"])
+        assert not modules & {"jodie.parsers", "nameparser", *CONTACTS_BRIDGE}, argv
+
+
+def test_dry_run_never_loads_contacts():
+    modules = set(run_fresh(cli("new", "Jane Smith", "jane@acme.io", "--dry-run"))["modules"])
+    assert "jodie.parsers.extractor" in modules
+    assert not modules & set(CONTACTS_BRIDGE)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Tests for the OpenMetrics counters and histograms."""
+import io
+import threading
+
+import pytest
+
+from jodie import metrics
+from jodie.input.records import iter_records
+from jodie.parsers import parse_contact_fields, parse_contact_fields_many
+from jodie.parsers.cache import configure_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics():
+    configure_cache({"cache": {"enabled": False}})
+    metrics.reset()
+    yield
+    metrics.enable(False)
+    metrics.configure_metrics()
+    metrics.reset()
+    configure_cache()
+
+
+def test_off_by_default_records_nothing():
+    parse_contact_fields(["Jane Smith", "jane@acme.io"])
+    assert metrics.RECORDS_PARSED.value() == 0
+    assert metrics.STAGE_SECONDS.count("parse.email") == 0
+
+
+def test_parse_counts_records_fields_and_stages():
+    metrics.enable()
+    parse_contact_fields(["jane@acme.io", "Jane Smith", "CEO"])
+    parse_contact_fields(["bob@gmail.com"])
+    assert metrics.RECORDS_PARSED.value() == 2
+    assert metrics.FIELD_HITS.value("email") == 2
+    assert metrics.FIELD_HITS.value("job_title") == 1
+    assert metrics.FIELD_HITS.value("phone") == 0
+    assert metrics.STAGE_SECONDS.count("parse.email") == 2
+    assert metrics.STAGE_SECONDS.count("parse_contact_fields") == 2
+
+
+def test_process_pool_results_counted_in_parent():
+    metrics.enable()
+    results = list(parse_contact_fields_many([["jane@acme.io"]] * 5, workers=2, chunksize=2))
+    assert len(results) == 5
+    assert metrics.RECORDS_PARSED.value() == 5
+
+
+def test_readers_count_records():
+    metrics.enable()
+    rows = list(iter_records(io.StringIO("Name,Email\nJane,jane@acme.io\nBob,bob@acme.io\n"), "csv"))
+    assert len(rows) == 2
+    assert metrics.RECORDS_READ.value("csv") == 2
+
+
+def test_counter_is_thread_safe():
+    metrics.enable()
+    threads = [threading.Thread(target=lambda: [metrics.SAVES.inc("saved") for _ in range(1000)])
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert metrics.SAVES.value("saved") == 8000
+
+
+def test_render_openmetrics():
+    metrics.enable()
+    metrics.SAVES.inc("failed")
+    metrics.STORE_SECONDS.observe(0.003, "save")
+    metrics.STORE_SECONDS.observe(20.0, "save")
+    metrics.RECORDS_READ.inc('we"ird\nsource')
+    text = metrics.render()
+
+    assert text.endswith("# EOF\n")
+    assert "# TYPE jodie_saves counter" in text
+    assert 'jodie_saves_total{result="failed"} 1' in text
+    assert "jodie_records_parsed_total 0" in text
+    assert 'jodie_store_duration_seconds_bucket{operation="save",le="0.0025"} 0' in text
+    assert 'jodie_store_duration_seconds_bucket{operation="save",le="0.005"} 1' in text
+    assert 'jodie_store_duration_seconds_bucket{operation="save",le="+Inf"} 2' in text
+    assert 'jodie_store_duration_seconds_count{operation="save"} 2' in text
+    assert 'jodie_records_read_total{source="we\\"ird\\nsource"} 1' in text
+
+
+def test_configured_path_is_written(tmp_path):
+    path = tmp_path / "jodie.prom"
+    metrics.configure_metrics({"metrics": {"path": str(path)}})
+    assert metrics.enabled
+    parse_contact_fields(["jane@acme.io"])
+    metrics.flush()
+    assert "jodie_records_parsed_total 1" in path.read_text()
+    assert [entry.name for entry in tmp_path.iterdir()] == ["jodie.prom"]
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Tests for batch parsing."""
+import pytest
+from jodie.parsers import parse_contact_fields, parse_contact_fields_many
+
+RECORDS = [
+    "Jane Smith jane@startup.io CEO",
+    ["John Smith", "john@example.ai", "4155555555"],
+    "Li Wei li@example.com",
+] * 5
+
+
+class Unprintable:
+    def __str__(self):
+        raise ValueError("boom")
+
+
+class TestParseContactFieldsMany:
+    def test_in_process_matches_single_calls(self):
+        results = list(parse_contact_fields_many(RECORDS, chunksize=4))
+        assert [result.index for result in results] == list(range(len(RECORDS)))
+        assert [result.fields for result in results] == [parse_contact_fields(r) for r in RECORDS]
+
+    def test_thread_pool_keeps_input_order(self):
+        results = list(parse_contact_fields_many(RECORDS, workers=3, chunksize=2, threads=True))
+        assert [result.index for result in results] == list(range(len(RECORDS)))
+        assert results[1].fields["email"] == "john@example.ai"
+
+    def test_process_pool_keeps_input_order(self):
+        results = list(parse_contact_fields_many(iter(RECORDS), workers=2, chunksize=3))
+        assert [result.fields for result in results] == [parse_contact_fields(r) for r in RECORDS]
+
+    def test_record_error_is_returned(self):
+        results = list(parse_contact_fields_many(["Jane Smith", [Unprintable()], "Li Wei"]))
+        assert [result.ok for result in results] == [True, False, True]
+        assert results[1].fields is None
+        assert results[1].error == "ValueError: boom"
+
+    def test_none_records_skip_the_pool(self, monkeypatch):
+        from jodie.parsers import batch
+
+        sent = []
+        parse_chunk = batch._parse_chunk
+        monkeypatch.setattr(batch, "_parse_chunk", lambda chunk: sent.append(chunk) or parse_chunk(chunk))
+        records = [None, None, "Jane Smith jane@startup.io", None, None, None, "Li Wei li@example.com"]
+        results = list(parse_contact_fields_many(records, workers=2, chunksize=2, threads=True))
+        assert [result.index for result in results] == list(range(len(records)))
+        assert [result.fields is None for result in results] == [record is None for record in records]
+        assert all(result.ok for result in results)
+        assert [[index for index, _ in chunk] for chunk in sent] == [[2], [6]]
+
+    def test_invalid_chunksize(self):
+        with pytest.raises(ValueError):
+            list(parse_contact_fields_many(RECORDS, chunksize=0))
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Tests for the parse result cache."""
+import pytest
+
+from jodie.config import DEFAULT_CONFIG
+from jodie.parsers import ParserPipeline, parse_contact_fields
+from jodie.parsers.cache import ParseCache, active_cache, configure_cache, parser_version
+
+
+@pytest.fixture(autouse=True)
+def default_cache():
+    configure_cache()
+    yield
+    configure_cache()
+
+
+class TestParseCache:
+    def test_key_depends_on_namespace_and_version(self):
+        cache = ParseCache(version="a")
+        assert cache.key("fields", ["x"]) != cache.key("pipeline", ["x"])
+        assert cache.key("fields", ["x"]) != ParseCache(version="b").key("fields", ["x"])
+        assert cache.key("fields", ["a b"]) != cache.key("fields", ["a", "b"])
+
+    def test_memory_tier_is_bounded(self):
+        cache = ParseCache(memory_entries=2)
+        for key in "abc":
+            cache.put(key, key)
+        assert cache.get("a") is None
+        assert cache.get("c") == "c"
+
+    def test_persistent_tier_survives_reopen(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        cache = ParseCache(path=path, version="v1")
+        cache.put(cache.key("fields", ["Jane"]), {"first_name": "Jane"})
+        cache.close()
+
+        reopened = ParseCache(path=path, version="v1")
+        assert reopened.get(reopened.key("fields", ["Jane"])) == {"first_name": "Jane"}
+        upgraded = ParseCache(path=path, version="v2")
+        assert upgraded.get(upgraded.key("fields", ["Jane"])) is None
+
+    def test_persistent_tier_evicts_by_size(self, tmp_path):
+        import sqlite3
+
+        path = tmp_path / "cache.sqlite3"
+        cache = ParseCache(memory_entries=1, path=path, max_bytes=2000)
+        for number in range(100):
+            cache.put(str(number), "x" * 50)
+        cache.close()
+        with sqlite3.connect(str(path)) as db:
+            total, newest = db.execute("SELECT SUM(size), MAX(CAST(key AS INTEGER)) FROM entries").fetchone()
+        assert total <= 2000
+        assert newest == 99
+
+    def test_version_follows_parsing_config(self):
+        changed = {**DEFAULT_CONFIG, "parsers": {**DEFAULT_CONFIG["parsers"], "title": False}}
+        unrelated = {**DEFAULT_CONFIG, "defaults": {"company": "Acme"}}
+        assert parser_version(changed) != parser_version(DEFAULT_CONFIG)
+        assert parser_version(unrelated) == parser_version(DEFAULT_CONFIG)
+
+
+class TestCachedParsing:
+    def test_equivalent_inputs_share_an_entry(self):
+        cache = active_cache()
+        first = parse_contact_fields("Jane  Smith jane@startup.io")
+        second = parse_contact_fields(["Jane Smith jane@startup.io"])
+        assert first == second
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_results_are_copies(self):
+        fields = parse_contact_fields("Jane Smith jane@startup.io https://startup.io")
+        fields["email"] = None
+        fields["websites"].append("https://other.io")
+        again = parse_contact_fields("Jane Smith jane@startup.io https://startup.io")
+        assert again["email"] == "jane@startup.io"
+        assert again["websites"] == ["https://startup.io"]
+
+    def test_nested_results_are_copies(self):
+        text = "Jane Smith jane@startup.io M: 415-555-1234"
+        fields = parse_contact_fields(text)
+        fields["phones"][0]["label"] = "fax"
+        fields["phones"].append({"number": "+14155550000"})
+        phones = parse_contact_fields(text)["phones"]
+        assert [phone["label"] for phone in phones] == ["mobile"]
+        pipeline = ParserPipeline.parse([text])
+        pipeline["phones"].value[0]["number"] = "0"
+        assert ParserPipeline.parse([text])["phones"].value[0]["number"] == "+14155551234"
+
+    def test_reconfigured_inference_is_not_served_from_cache(self):
+        from jodie.parsers.inference import configure_inference
+
+        text = "Jane Smith\njane@acme.io\nCEO"
+        assert parse_contact_fields(text)["company"] == "Acme"
+        try:
+            configure_inference({"behavior": {"auto_infer_company": False}})
+            assert parse_contact_fields(text)["company"] is None
+        finally:
+            configure_inference(DEFAULT_CONFIG)
+        assert parse_contact_fields(text)["company"] == "Acme"
+
+    def test_reconfigured_stages_are_not_served_from_cache(self):
+        from jodie.parsers.registry import configure_stages
+
+        text = "Jane Smith\njane@acme.io\nCEO"
+        assert parse_contact_fields(text)["email"] == "jane@acme.io"
+        try:
+            configure_stages({"parsers": {"email": False}})
+            assert parse_contact_fields(text)["email"] is None
+        finally:
+            configure_stages(DEFAULT_CONFIG)
+
+    def test_pipeline_results_are_cached(self):
+        lines = ["Jane Smith", "jane@startup.io"]
+        first = ParserPipeline.parse(lines)
+        second = ParserPipeline.parse(lines)
+        assert ParserPipeline.to_dict(first) == ParserPipeline.to_dict(second)
+        assert first["email"] is not second["email"]
+        assert active_cache().hits == 1
+
+    def test_disabled_cache(self):
+        assert configure_cache({"cache": {"enabled": False}}) is None
+        assert active_cache() is None
+        assert parse_contact_fields("Jane Smith jane@startup.io")["email"] == "jane@startup.io"
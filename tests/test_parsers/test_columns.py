@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Tests for column-type inference on tabular input."""
+import pytest
+from jodie.parsers.columns import (EXPLICIT, HEADER, INFERRED, apply_column_mapping,
+                                   infer_column_mapping, split_full_name)
+
+ROWS = [
+    {"A": "Jane Smith", "B": "jane@startup.io", "C": "415-555-1234", "D": "CEO"},
+    {"A": "John Doe", "B": "john@acme.com", "C": "(212) 555-0142", "D": "Founder"},
+    {"A": "Li Wei", "B": "li@example.com", "D": "Product Manager"},
+]
+
+
+class TestInferColumnMapping:
+    def test_infers_fields_from_values(self):
+        mapping = infer_column_mapping(ROWS)
+        assert mapping.fields == {"A": "full_name", "B": "email", "C": "phone", "D": "job_title"}
+        assert set(mapping.sources.values()) == {INFERRED}
+        assert mapping.sampled == 3
+
+    def test_split_name_columns(self):
+        rows = [{"F": "Jane", "L": "Smith", "E": "jane@startup.io"},
+                {"F": "John", "L": "Doe", "E": "john@acme.com"}]
+        assert infer_column_mapping(rows).fields == {"F": "first_name", "L": "last_name", "E": "email"}
+
+    def test_header_names_win(self):
+        rows = [{"Email Address": "jane@startup.io", "Name": "Jane Smith"}]
+        mapping = infer_column_mapping(rows)
+        assert mapping.fields == {"Email Address": "email", "Name": "full_name"}
+        assert mapping.sources["Email Address"] == HEADER
+
+    def test_explicit_override_is_recorded(self):
+        mapping = infer_column_mapping(ROWS, explicit={"D": "note"})
+        assert mapping.fields["D"] == "note"
+        assert mapping.sources["D"] == EXPLICIT
+        assert mapping.inferred["D"] == "job_title"
+
+    def test_override_claims_field_from_inferred_column(self):
+        mapping = infer_column_mapping(ROWS, explicit={"D": "email"})
+        assert "B" not in mapping.fields
+
+    def test_empty_sample(self):
+        assert not infer_column_mapping([])
+
+
+class TestApplyColumnMapping:
+    def test_cells_are_validated(self):
+        mapping = infer_column_mapping(ROWS)
+        row = {"A": "Ann Lee", "B": "not an email", "C": "555-010-9999", "D": "CTO"}
+        assert apply_column_mapping(row, mapping) == {
+            "full_name": "Ann Lee", "phone": "5550109999", "job_title": "CTO"}
+
+    def test_split_full_name(self):
+        assert split_full_name({"full_name": "Ann Lee"}) == {
+            "full_name": "Ann Lee", "first_name": "Ann", "last_name": "Lee"}
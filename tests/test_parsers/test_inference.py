@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Tests for cross-field inference and confidence-based stage skipping."""
+import pytest
+
+from jodie.parsers import ParserPipeline, extract_contact_fields
+from jodie.parsers import stages
+from jodie.parsers.cache import configure_cache
+from jodie.parsers.inference import (InferenceRule, company_from_website, configure_inference,
+                                     infer_missing, name_from_email)
+
+
+@pytest.fixture(autouse=True)
+def default_settings():
+    configure_cache({"cache": {"enabled": False}})
+    configure_inference()
+    yield
+    configure_inference()
+    configure_cache()
+
+
+class TestRules:
+    def test_name_from_email(self):
+        assert name_from_email("jane.smith@acme.io") == ("Jane", "Smith")
+        assert name_from_email("jane.q.smith@acme.io") == ("Jane", "Smith")
+        assert name_from_email("info@acme.io") is None
+        assert name_from_email("jsmith@acme.io") is None
+
+    def test_company_from_website_skips_profiles(self):
+        websites = ["https://linkedin.com/in/jane", "https://www.acme.co.uk/team"]
+        assert company_from_website(websites) == ("Acme",)
+        assert company_from_website(["https://github.com/jane"]) is None
+
+    def test_rules_only_run_for_missing_targets(self):
+        calls = []
+        rule = InferenceRule("probe", ("company",), ("email",),
+                             lambda email: calls.append(email) or ("Probe",), 0.5)
+        fields = {"email": "jane@acme.io", "company": "Acme"}
+        assert infer_missing(fields, {}, [rule]) == {}
+        assert calls == []
+
+    def test_required_fields_are_inferred_first(self):
+        rules = [
+            InferenceRule("title_from_company", ("job_title",), ("company",), lambda c: (f"{c} staff",), 0.3),
+            InferenceRule("company_from_email", ("company",), ("email",), lambda e: ("Acme",), 0.6),
+        ]
+        fields = {"email": "jane@acme.io", "company": None, "job_title": None}
+        confidence = {}
+        assert infer_missing(fields, confidence, rules) == {
+            "company": "company_from_email", "job_title": "title_from_company"}
+        assert fields["job_title"] == "Acme staff"
+        assert confidence == {"company": 0.6, "job_title": 0.3}
+
+
+class TestExtraction:
+    def test_company_falls_back_to_website(self):
+        fields = extract_contact_fields(["Jane Smith", "jane@gmail.com", "https://acme.io"]).fields
+        assert fields["company"] == "Acme"
+
+    def test_name_inferred_from_email(self):
+        extraction = extract_contact_fields(["jane.smith@acme.io"])
+        assert (extraction.fields["first_name"], extraction.fields["last_name"]) == ("Jane", "Smith")
+        assert extraction.inferred["first_name"] == "name_from_email"
+
+    def test_behavior_settings_disable_rules(self):
+        configure_inference({"behavior": {"auto_infer_company": False, "auto_infer_name": False}})
+        fields = extract_contact_fields(["jane.smith@acme.io"]).fields
+        assert (fields["first_name"], fields["company"]) == (None, None)
+
+    def test_text_stages_skipped_when_nothing_is_left(self, monkeypatch):
+        def fail(text):
+            raise AssertionError("title stage should not run")
+        monkeypatch.setattr(stages, "_find_title_match", fail)
+        fields = extract_contact_fields(["jane@acme.io", "415-555-1234"]).fields
+        assert fields["phone"] == "4155551234"
+
+    def test_settled_fields_skip_later_stages(self, monkeypatch):
+        lines = ["Jane Smith <jane@acme.io>", "Acme Corp"]
+        calls = []
+        monkeypatch.setattr(stages, "_pick_name_segment", lambda segments, memo=None: calls.append(segments))
+        extract_contact_fields(lines)
+        assert calls == []
+
+    def test_weak_fields_are_refined_below_threshold(self):
+        lines = ["Jane <jane@acme.io>", "Jane Smith"]
+        assert extract_contact_fields(lines).fields["last_name"] == "Smith"
+        configure_inference({"behavior": {"confidence_threshold": 0.5}})
+        assert extract_contact_fields(lines).fields["last_name"] == ""
+
+def test_pipeline_reports_real_confidence():
+    results = ParserPipeline.parse(["Jane Smith <jane@acme.io>"])
+    assert results["email"].confidence > results["first_name"].confidence > results["company"].confidence
+    assert (results["company"].source, results["email"].source) == ("inferred", "parsed")
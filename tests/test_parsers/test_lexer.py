@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Tests for the single-pass contact lexer."""
+import pytest
+from jodie.parsers.lexer import EMAIL, PHONE, SEPARATOR, URL, WORD, TokenBuffer, tokenize
+
+
+class TestTokenize:
+    def test_typed_tokens(self):
+        kinds = [token.kind for token in tokenize("Jane, jane@acme.com https://acme.com 415-555-1234")]
+        assert kinds == [WORD, SEPARATOR, EMAIL, URL, PHONE]
+
+    def test_bracketed_email_is_one_token(self):
+        tokens = tokenize("<jane@acme.com>")
+        assert [(token.kind, token.text) for token in tokens] == [(EMAIL, "<jane@acme.com>")]
+
+    def test_phone_does_not_include_leading_space(self):
+        token = tokenize("call 415 555 1234")[1]
+        assert token.kind == PHONE
+        assert token.text == "415 555 1234"
+
+    def test_offsets_point_into_text(self):
+        text = "CEO at Acme"
+        assert all(text[token.start:token.end] == token.text for token in tokenize(text))
+
+
+class TestTokenBuffer:
+    def test_segments_are_joined_with_offsets(self):
+        buffer = TokenBuffer(["Jane  Doe", "CEO"])
+        assert buffer.text == "Jane Doe CEO"
+        assert buffer.segments == [(0, 8), (9, 12)]
+
+    def test_consumed_spans_collapse_to_space(self):
+        buffer = TokenBuffer(["R&J Services"])
+        buffer.consume(1, 2)
+        assert buffer.remaining()[0] == "R J Services"
+
+    def test_segment_boundaries_render_as_newlines(self):
+        buffer = TokenBuffer(["CEO", "jane@acme.com", "Acme Inc"])
+        buffer.consume(4, 17)
+        assert buffer.remaining()[0] == "CEO\nAcme Inc"
+
+    def test_remaining_offsets_map_back(self):
+        buffer = TokenBuffer(["Jane jane@acme.com Acme"])
+        buffer.consume(5, 18)
+        text, offsets = buffer.remaining()
+        assert text == "Jane Acme"
+        assert buffer.text[offsets[5]:offsets[8] + 1] == "Acme"
+
+    def test_segment_residuals(self):
+        buffer = TokenBuffer(["CEO, Startup Inc", "Jane Smith"])
+        buffer.consume(0, 3)
+        assert buffer.segment_residuals() == [(", Startup Inc", 3, 16), ("Jane Smith", 17, 27)]
@@ -27,3 +27,20 @@ class TestNameParser:
         first, last = NameParser.parse("")
         assert first == ""
         assert last == ""
+
+    def test_fast_path_matches_nameparser(self):
+        from nameparser import HumanName
+        for text in ["Jane Smith", "John M. Smith", "Mary-Jane O'Neil", "JOHN SMITH",
+                     "Dr Jane Smith", "John Smith Jr", "Ludwig van Beethoven", "John E Smith"]:
+            name = HumanName(text)
+            assert NameParser.split(text) == (name.first, name.middle, name.last)
+
+    def test_split_is_memoized(self):
+        NameParser.split.cache_clear()
+        NameParser.parse("Jane Smith")
+        NameParser.parse("Jane Smith <jane@startup.io>")
+        assert NameParser.split.cache_info().hits == 1
+
+    def test_first_last_drops_middle_name(self):
+        assert NameParser.first_last("John Michael Doe") == ("John", "Doe")
+        assert NameParser.first_last("") == ("", "")
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Tests for PhoneParser."""
 import pytest
+from jodie.parsers import parse_contact_fields
 from jodie.parsers.parsers import PhoneParser
+from jodie.parsers.phones import normalize_phone, primary_phone, scan_phones
 
 class TestPhoneParser:
     def test_ten_digit(self):
@@ -29,3 +31,56 @@ class TestPhoneParser:
 
     def test_empty_string(self):
         assert PhoneParser.parse("") is None
+
+    def test_international_is_e164(self):
+        assert PhoneParser.parse("+44 (0)20 7946 0958") == "+442079460958"
+
+
+class TestNormalizePhone:
+    def test_north_american(self):
+        number = normalize_phone("(516) 776-3192")
+        assert number.e164 == "+15167763192"
+        assert number.value == "5167763192"
+
+    def test_international_prefixes(self):
+        assert normalize_phone("0033 1 23 45 67 89").e164 == "+33123456789"
+        assert normalize_phone("011 44 20 7946 0958").e164 == "+442079460958"
+
+    def test_extension(self):
+        number = normalize_phone("415-555-1234 ext. 42")
+        assert (number.e164, number.extension) == ("+14155551234", "42")
+
+    def test_country_length_is_checked(self):
+        assert normalize_phone("+44 20 79") is None
+        assert normalize_phone("+1 415 555 12345") is None
+
+    def test_unknown_country_national(self):
+        number = normalize_phone("07700 900123")
+        assert number.e164 is None
+        assert number.value == "07700900123"
+
+
+class TestScanPhones:
+    def test_labels_and_spans(self):
+        text = "M: (415) 555-1234 | Fax 415.555.9999"
+        numbers = scan_phones(text)
+        assert [(n.label, n.value) for n in numbers] == [("mobile", "4155551234"), ("fax", "4155559999")]
+        assert text[numbers[1].start:numbers[1].end] == "415.555.9999"
+
+    def test_bare_initial_is_not_a_label(self):
+        assert scan_phones("Ann M 4155551234")[0].label is None
+
+    def test_fax_is_not_primary(self):
+        numbers = scan_phones("F: 415 555 9999 T: +49 30 1234567")
+        assert primary_phone(numbers).value == "+49301234567"
+
+
+class TestExtractedPhones:
+    def test_all_numbers_are_kept(self):
+        fields = parse_contact_fields(["Jane Smith", "F: 415.555.9999", "Mobile: +44 7700 900123"])
+        assert fields["phone"] == "+447700900123"
+        assert fields["phones"] == [
+            {"number": "+14155559999", "label": "fax", "extension": None},
+            {"number": "+447700900123", "label": "mobile", "extension": None},
+        ]
+        assert fields["company"] is None
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Tests for the stage registry and the [parsers] toggles."""
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from jodie.parsers import NameParser, extract_contact_fields, registry
+from jodie.parsers.base import BaseParser, ParseResult
+from jodie.parsers.cache import configure_cache
+from jodie.parsers.registry import active_stages, configure_stages
+
+
+class PronounParser(BaseParser):
+    name = "pronouns"
+    priority = 70  # before title, name and company
+    field_name = "note"
+
+    @classmethod
+    def parse(cls, text):
+        match = re.search(r'\((?:she|he|they)/\w+\)', text)
+        return match and ParseResult(match.group(0).strip("()"), 0.9, match.group(0))
+
+
+def fake_entry_points(**plugins):
+    return lambda: [SimpleNamespace(name=name, value=f"tests:{name}", load=lambda parser=parser: parser)
+                    for name, parser in plugins.items()]
+
+
+@pytest.fixture(autouse=True)
+def default_settings():
+    configure_cache({"cache": {"enabled": False}})
+    configure_stages()
+    yield
+    configure_stages()
+    configure_cache()
+
+
+class TestToggles:
+    def test_builtin_stages_run_by_priority(self):
+        assert [stage.name for stage in active_stages()] == [
+            "email", "website", "phone", "title", "name", "company"]
+
+    def test_default_config_never_scans_entry_points(self, monkeypatch):
+        def fail():
+            raise AssertionError("entry points should not be scanned")
+        monkeypatch.setattr(registry, "_entry_points", fail)
+        configure_stages({"parsers": {"email": True, "title": False}})
+        assert "title" not in [stage.name for stage in active_stages()]
+
+    def test_disabled_phone_stays_out_of_other_fields(self):
+        configure_stages({"parsers": {"phone": False}})
+        fields = extract_contact_fields(["Jane Smith", "415-555-1234", "Acme Corp"]).fields
+        assert (fields["phone"], fields["phones"]) == (None, [])
+        assert fields["company"] == "Acme Corp"
+
+    def test_disabled_company_is_not_inferred(self):
+        configure_stages({"parsers": {"company": False}})
+        fields = extract_contact_fields(["Jane Smith <jane@acme.io>", "Acme Corp"]).fields
+        assert fields["company"] is None
+        assert fields["first_name"] == "Jane"
+
+    def test_disabled_name_stage_skips_name_parsing(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(NameParser, "parse", lambda text: calls.append(text))
+        configure_stages({"parsers": {"name": False}})
+        fields = extract_contact_fields(["Jane Smith <jane.smith@acme.io>"]).fields
+        assert calls == []
+        assert fields["first_name"] is None
+
+
+class TestPlugins:
+    def test_enabled_plugin_claims_its_text(self, monkeypatch):
+        monkeypatch.setattr(registry, "_entry_points", fake_entry_points(pronouns=PronounParser))
+        configure_stages({"parsers": {"pronouns": True}})
+        fields = extract_contact_fields(["Jane Smith", "(she/her)", "Acme Corp"]).fields
+        assert fields["note"] == "she/her"
+        assert (fields["last_name"], fields["company"]) == ("Smith", "Acme Corp")
+
+    def test_installed_plugin_is_off_until_enabled(self, monkeypatch):
+        monkeypatch.setattr(registry, "_entry_points", fake_entry_points(pronouns=PronounParser))
+        configure_stages({"parsers": {"pronouns": False}})
+        assert "pronouns" not in [stage.name for stage in active_stages()]
+
+    def test_missing_plugin_warns(self, monkeypatch, capsys):
+        monkeypatch.setattr(registry, "_entry_points", fake_entry_points())
+        configure_stages({"parsers": {"pronouns": True}})
+        assert len(active_stages()) == 6
+        assert "'pronouns' is enabled but not installed" in capsys.readouterr().err
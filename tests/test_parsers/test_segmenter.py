@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Tests for splitting text into per-person blocks."""
+from jodie.parsers.segmenter import parse_contacts, split_contacts
+
+TEAM_PAGE = """Meet the team
+
+Jane Smith
+CEO, Acme Corp
+jane@acme.com
+415-555-1234
+Bob Lee
+CTO
+bob@acme.com
+
+Carol King
+carol@acme.com
+"""
+
+
+class TestSplitContacts:
+    def test_stacked_records_follow_first_layout(self):
+        assert split_contacts(TEAM_PAGE) == [
+            "Jane Smith\nCEO, Acme Corp\njane@acme.com\n415-555-1234",
+            "Bob Lee\nCTO\nbob@acme.com",
+            "Carol King\ncarol@acme.com",
+        ]
+
+    def test_one_person_per_line(self):
+        text = "Jane Smith <jane@acme.com>, CEO\nBob Lee <bob@globex.com>\n"
+        assert split_contacts(text) == ["Jane Smith <jane@acme.com>, CEO", "Bob Lee <bob@globex.com>"]
+
+    def test_consecutive_phones_stay_together(self):
+        text = "Jane Smith\nM: 415-555-1234\nO: 212-555-9999\nBob Lee\nM: 415-555-7777"
+        assert split_contacts(text) == ["Jane Smith\nM: 415-555-1234\nO: 212-555-9999",
+                                        "Bob Lee\nM: 415-555-7777"]
+
+    def test_lead_paragraph_joins_next_block(self):
+        assert split_contacts("Jane Smith\nCEO\n\njane@acme.com") == ["Jane Smith\nCEO\njane@acme.com"]
+
+    def test_text_without_contacts(self):
+        assert split_contacts("Thanks for the intro!\n\nTalk soon.") == []
+
+
+class TestParseContacts:
+    def test_parses_each_person(self):
+        contacts = parse_contacts(TEAM_PAGE)
+        assert [(c["first_name"], c["email"]) for c in contacts] == [
+            ("Jane", "jane@acme.com"), ("Bob", "bob@acme.com"), ("Carol", "carol@acme.com")]
+        assert contacts[0]["phone"] == "4155551234"
+
+    def test_repeated_people_are_dropped(self):
+        text = "Jane Smith <jane@acme.com>\nBob Lee <bob@acme.com>\nJane Smith <JANE@acme.com>"
+        assert [c["email"] for c in parse_contacts(text)] == ["jane@acme.com", "bob@acme.com"]
+
+    def test_parallel_matches_serial(self):
+        text = "\n".join(f"Person{n} Test <p{n}@acme.com>" for n in range(50))
+        assert parse_contacts(text, workers=4, threads=True) == parse_contacts(text)
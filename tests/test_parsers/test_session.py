@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Tests for incremental parse sessions."""
+import pytest
+
+from jodie.parsers import ParseSession, ParserPipeline, extract_contact_fields
+from jodie.parsers import session as session_module
+
+SIGNATURE = ["Jane Smith", "CEO", "Acme Corp", "jane@acme.io", "M: 415-555-1234"]
+
+
+def test_edits_match_a_full_parse():
+    session = ParseSession(SIGNATURE)
+    session.set(1, "VP of Sales")
+    session.insert(0, "Best regards,")
+    session.remove(-1)
+    lines = ["Best regards,", "Jane Smith", "VP of Sales", "Acme Corp", "jane@acme.io"]
+    assert session.segments == lines
+    assert session.fields == extract_contact_fields(lines).fields
+    assert session.fields["job_title"] == "VP of Sales"
+
+
+def test_results_match_pipeline():
+    session = ParseSession(SIGNATURE)
+    assert ParserPipeline.to_dict(session.results) == ParserPipeline.to_dict(ParserPipeline.parse(SIGNATURE))
+    assert session.results["email"].consumed_text == "jane@acme.io"
+
+
+def test_only_changed_segments_are_tokenized(monkeypatch):
+    session = ParseSession(SIGNATURE)
+    session.fields
+    tokenized = []
+    original = session_module.tokenize
+    monkeypatch.setattr(session_module, "tokenize", lambda text: tokenized.append(text) or original(text))
+    session.set(1, "CTO")
+    session.set(2, "Acme Inc")
+    assert session.fields["company"] == "Acme Inc"
+    assert tokenized == ["CTO", "Acme Inc"]
+
+
+def test_unchanged_edit_keeps_extraction():
+    session = ParseSession(SIGNATURE)
+    extraction = session.extraction
+    session.set(0, "  Jane   Smith ")
+    session.update(SIGNATURE)
+    assert session.extraction is extraction
+
+
+def test_multiline_and_blank_edits():
+    session = ParseSession(SIGNATURE)
+    session.set(2, "Acme Corp\nhttps://acme.io")
+    session.set(1, "")
+    assert session.segments == ["Jane Smith", "Acme Corp", "https://acme.io", "jane@acme.io", "M: 415-555-1234"]
+    with pytest.raises(IndexError):
+        session.remove(9)
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Tests for the trie-based TitleMatcher."""
+import pytest
+from jodie.parsers.titles import TitleMatcher, title_matcher
+
+
+def _match(text):
+    span = title_matcher().find(text)
+    return text[span[0]:span[1]] if span else None
+
+
+class TestTitleMatcher:
+    def test_single_title(self):
+        assert _match("Jane Doe CEO Acme") == "CEO"
+
+    def test_longest_title_wins(self):
+        assert _match("Acme Senior Software Engineer") == "Senior Software Engineer"
+
+    def test_compound_title(self):
+        assert _match("Jane Doe, Co-founder & CEO") == "Co-founder & CEO"
+
+    def test_compound_title_with_and(self):
+        assert _match("designer and producer at Acme") == "designer and producer"
+
+    def test_hyphen_is_part_of_key(self):
+        assert _match("co founder") == "founder"
+
+    def test_whitespace_runs_match(self):
+        assert _match("vice   president") == "vice   president"
+
+    def test_no_partial_words(self):
+        assert _match("engineers wanted") is None
+
+    def test_no_title(self):
+        assert _match("Random Text") is None
+
+    def test_empty_string(self):
+        assert title_matcher().find("") is None
+
+    def test_matcher_is_built_once(self):
+        assert title_matcher() is title_matcher()
+
+    def test_custom_lexicon(self):
+        matcher = TitleMatcher(["chief of staff"])
+        assert matcher.find("Jo, Chief of Staff") == (4, 18)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Tests for opt-in per-stage timing."""
+import pytest
+
+from jodie import profiling
+from jodie.input.signature import SignaturePreprocessor
+from jodie.parsers import parse_contact_fields
+from jodie.parsers.cache import configure_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_stats():
+    configure_cache({"cache": {"enabled": False}})
+    profiling.reset()
+    yield
+    profiling.enable(False)
+    profiling.reset()
+    configure_cache()
+
+
+def test_off_by_default_collects_nothing():
+    parse_contact_fields(["Jane Smith", "jane@acme.io"])
+    assert profiling.collect_stats() == {"stages": {}, "fields": {}}
+
+
+def test_stages_and_field_sources():
+    profiling.enable()
+    parse_contact_fields(["jane@acme.io", "Jane Smith", "CEO", "415-555-1234"])
+    parse_contact_fields(["Bob Lee <bob@globex.com>"])
+    stats = profiling.collect_stats()
+
+    stages = stats["stages"]
+    assert stages["parse_contact_fields"]["calls"] == 2
+    assert stages["parse.email"]["calls"] == 2
+    assert stages["parse.title"]["calls"] == 1  # nothing left to read in the second record
+    assert {"parse.tokenize", "parse.phone", "parse.name.pick", "parse.inference"} <= set(stages)
+    assert stats["fields"]["first_name"] == {"name": 1, "email": 1}
+    assert stats["fields"]["job_title"] == {"title": 1}
+    assert stats["fields"]["company"] == {"inference.company_from_email": 2}
+
+
+def test_preprocess_is_timed():
+    profiling.enable()
+    SignaturePreprocessor.preprocess("Thanks!\n\n--\nJane Smith\njane@acme.io")
+    assert {"preprocess", "preprocess.locate"} <= set(profiling.collect_stats()["stages"])
+
+
+def test_collect_and_reset():
+    profiling.enable()
+    parse_contact_fields(["jane@acme.io"])
+    report = profiling.format_stats()
+    assert "parse.email" in report and "inference.company_from_email" in report
+    assert profiling.collect_stats(reset_after=True)["stages"]
+    assert profiling.collect_stats()["stages"] == {}
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Tests for the jodie serve daemon and its forwarding client."""
+import asyncio
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+from jodie.cli.client import forward, should_forward
+from jodie.cli.serve import Daemon, warm_up
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    path = str(tmp_path / "serve.sock")
+    server = Daemon(backend=warm_up())
+    thread = threading.Thread(target=asyncio.run, args=(server.serve(path),), daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not (tmp_path / "serve.sock").exists():
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.01)
+    yield path
+    server.stop()
+    thread.join(timeout=5)
+
+
+def test_only_new_is_forwarded():
+    assert should_forward(['new', 'Jane Smith', 'jane@acme.io'])
+    assert should_forward(['new', '--paste', '--dry-run'])
+    assert not should_forward(['import', 'contacts.csv'])
+    assert not should_forward(['serve'])
+    assert not should_forward([])
+    assert not should_forward(['new', 'jane@acme.io', '--profile'])
+    assert not should_forward(['new', 'jane@acme.io', '--metrics=out.prom'])
+
+
+def test_no_daemon_runs_locally(tmp_path):
+    assert forward(['new', 'jane@acme.io'], str(tmp_path / "missing.sock")) is None
+
+    stale = tmp_path / "stale.sock"
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(stale))
+    listener.close()  # file left behind with nobody listening
+    assert forward(['new', 'jane@acme.io'], str(stale)) is None
+
+
+def test_execute_matches_local_dry_run():
+    response = Daemon(backend=warm_up()).execute({"argv": ['new', 'Jane Smith', 'jane@acme.io', '--dry-run']})
+    assert response["status"] == 0
+    assert "Contact Preview" in response["stdout"]
+    assert "jane@acme.io" in response["stdout"]
+
+
+def test_execute_reads_forwarded_stdin():
+    response = Daemon().execute({"argv": ['new', '--stdin', '--dry-run'],
+                                 "stdin": "Li Wei\nli@example.com\n"})
+    assert response["status"] == 0
+    assert "Wei" in response["stdout"]
+
+
+def test_execute_many_saves_to_the_daemon_backend(monkeypatch):
+    from jodie.contact import backend as backend_module
+    from jodie.contact.memory import MemoryBackend
+
+    store = MemoryBackend()
+    daemon = Daemon(backend=store)
+
+    def no_reopen(*args, **kwargs):
+        raise AssertionError("forwarded command opened its own backend")
+
+    monkeypatch.setattr(backend_module, "open_backend", no_reopen)
+    response = daemon.execute({"argv": ['new', '--many', '--stdin'],
+                               "stdin": "Jane Smith\njane@acme.io\n\nLi Wei\nli@example.com\n"})
+    assert response["status"] == 0, response["stderr"]
+    assert "Saved 2 of 2 contacts" in response["stdout"]
+    assert sorted(record['email'] for record in store.contacts()) == ['jane@acme.io', 'li@example.com']
+
+
+def test_execute_rejects_other_commands_and_bad_usage():
+    assert Daemon().execute({"argv": ['import', 'contacts.csv']})["status"] == 2
+    response = Daemon().execute({"argv": ['new', '--no-such-flag']})
+    assert response["status"] == 1
+    assert "Usage:" in response["stderr"]
+
+
+def test_forward_round_trip(daemon, capsys):
+    assert forward(['new', 'Jane Smith', 'jane@acme.io', '--dry-run'], daemon) == 0
+    out = capsys.readouterr().out
+    assert "Contact Preview" in out and "Smith" in out
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(daemon)
+        connection.sendall(b"not json\n")
+        assert b'"status": 2' in connection.makefile("rb").readline()
+
+
+class GatedDaemon(Daemon):
+    """Holds `new slow` until a `new fast` command has run."""
+
+    def __init__(self):
+        super().__init__()
+        self.fast_done = threading.Event()
+
+    def execute(self, request):
+        if request["argv"][1] == "slow":
+            assert self.fast_done.wait(5), "fast command was blocked by the slow one"
+        else:
+            self.fast_done.set()
+        return {"status": 0, "stdout": request["argv"][1], "stderr": ""}
+
+
+def _request(path, argv):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(path)
+        connection.sendall(json.dumps({"argv": argv}).encode() + b"\n")
+        return json.loads(connection.makefile("rb").readline())
+
+
+def test_slow_command_does_not_block_other_clients(tmp_path):
+    path = str(tmp_path / "serve.sock")
+    server = GatedDaemon()
+    thread = threading.Thread(target=asyncio.run, args=(server.serve(path),), daemon=True)
+    thread.start()
+    while not (tmp_path / "serve.sock").exists():
+        time.sleep(0.01)
+    try:
+        responses = {}
+        slow = threading.Thread(target=lambda: responses.update(slow=_request(path, ['new', 'slow'])))
+        slow.start()
+        time.sleep(0.05)
+        assert _request(path, ['new', 'fast'])["stdout"] == "fast"
+        slow.join(timeout=5)
+        assert responses["slow"]["stdout"] == "slow"
+    finally:
+        server.stop()
+        thread.join(timeout=5)
+
+
+def test_concurrent_commands_capture_their_own_output():
+    daemon = Daemon(backend=warm_up())
+    names = ["Jane Smith", "Li Wei", "Bob Lee", "Ana Ruiz"]
+    responses = {}
+
+    def preview(name):
+        responses[name] = daemon.execute({"argv": ['new', name, 'x@acme.io', '--dry-run']})
+
+    threads = [threading.Thread(target=preview, args=(name,)) for name in names * 3]
+    for worker in threads:
+        worker.start()
+    for worker in threads:
+        worker.join()
+    for name in names:
+        out = responses[name]["stdout"]
+        assert name.split()[1] in out
+        assert not any(other.split()[1] in out for other in names if other != name)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Tests for signature location and preprocessing."""
+import re
+
+import pytest
+
+from jodie.config import DEFAULT_CONFIG
+from jodie.input.rules import RuleSet, user_rules
+from jodie.input.signature import SignatureLocator, SignaturePreprocessor
+from jodie.parsers import parse_contact_fields
+
+
+THREAD = """Sounds good, see you Tuesday.
+
+Best,
+Li Wei
+Product Manager | Acme Inc.
+li@acme.com
+
+On Mon, Jan 1, 2024 at 9:00 AM Jane Smith <jane@startup.io> wrote:
+> Can we meet next week?
+>
+> Jane Smith
+> CEO, Startup Inc
+"""
+
+
+class TestSignatureLocator:
+    def test_sign_off_bounds_the_block(self):
+        assert SignatureLocator.locate(THREAD) == "Li Wei\nProduct Manager | Acme Inc.\nli@acme.com"
+
+    def test_delimiter_bounds_the_block(self):
+        text = "Let me know.\n-- \nJane Smith\njane@startup.io\n"
+        assert SignatureLocator.locate(text) == "Jane Smith\njane@startup.io"
+
+    def test_stops_at_prose_without_a_boundary(self):
+        text = "Sounds good.\n\nLi Wei\nProduct Manager\n4155550000\nSent from my iPhone\n"
+        assert SignatureLocator.locate(text) == "Li Wei\nProduct Manager\n4155550000"
+
+    def test_long_title_line_is_not_prose(self):
+        title = "Senior Vice President of Global Business Development and Strategic Alliances, EMEA and APAC"
+        text = f"Looking forward to it.\n\nJane Smith\n{title}\njane@startup.io\n"
+        assert SignatureLocator.locate(text) == f"Jane Smith\n{title}\njane@startup.io"
+        assert SignatureLocator.is_prose("Thanks again for making the time to talk through the plan with us")
+        assert SignatureLocator.is_prose("Great Call Today With The Team And Everyone Involved. See You Next Week")
+
+    def test_bare_signature_is_kept_whole(self, sample_signatures):
+        for sample in sample_signatures:
+            assert SignatureLocator.locate(sample["input"]) == sample["input"]
+
+    def test_leading_headers_are_not_history(self):
+        text = "From: Jane Smith <jane@startup.io>\nSubject: Hi\n\nThanks!\nJane Smith\njane@startup.io"
+        assert SignatureLocator.locate(text) == "Jane Smith\njane@startup.io"
+
+    def test_examined_lines_are_capped(self):
+        text = "\n".join(f"line {i}" for i in range(1000))
+        assert len(SignatureLocator.locate(text).split("\n")) == SignatureLocator.MAX_LINES
+
+
+class TestSignaturePreprocessor:
+    def test_thread_parses_newest_signature(self):
+        fields = parse_contact_fields(SignaturePreprocessor.preprocess(THREAD))
+        assert (fields["first_name"], fields["last_name"]) == ("Li", "Wei")
+        assert fields["email"] == "li@acme.com"
+        assert fields["job_title"] == "Product Manager"
+
+    def test_locate_can_be_disabled(self):
+        lines = SignaturePreprocessor.preprocess("Thanks for the intro.\nJane Smith", locate=False)
+        assert lines == ["Thanks for the intro.", "Jane Smith"]
+
+    def test_locating_keeps_bare_signatures(self, sample_signatures):
+        for sample in sample_signatures:
+            text = sample["input"]
+            assert SignaturePreprocessor.preprocess(text) == SignaturePreprocessor.preprocess(text, locate=False)
+
+
+class TestRuleSet:
+    def test_reports_first_matching_rule(self):
+        rules = RuleSet({'quote': r'>', 'header': r'From:', 'any': r'.'})
+        assert rules.match("From: Jane") == 'header'
+        assert rules.match("> hi") == 'quote'
+        assert rules.match("") is None
+        assert rules.hits == {'header': 1, 'quote': 1}
+
+    def test_split_counts_each_rule(self):
+        rules = RuleSet({'pipe': r'\|', 'colons': r'::'})
+        assert rules.split("a | b :: c | d") == ["a ", " b ", " c ", " d"]
+        assert rules.hits == {'pipe': 2, 'colons': 1}
+
+    def test_rules_that_cannot_share_the_alternation(self):
+        rules = RuleSet({'quote': r'>', 'conf': r'(?i)^confidential.*', 'repeat': r'^(\w)\1.*',
+                         'phone': r'(?P<tag>tel):', 'fax': r'(?P<tag>fax):', 'any': r'.'}, re.IGNORECASE)
+        assert rules.match("CONFIDENTIAL: do not share") == 'conf'
+        assert rules.match("aab") == 'repeat'
+        assert rules.match("abc") == 'any'
+        assert rules.match("fax: 555") == 'fax'
+        assert rules.match("> hi") == 'quote'
+        assert rules.hits == {'conf': 1, 'repeat': 1, 'any': 1, 'fax': 1, 'quote': 1}
+
+    def test_split_across_standalone_rules(self):
+        rules = RuleSet({'pipe': r'\|', 'spaced': r'(?x) : :'})
+        assert rules.split("a | b :: c | d") == ["a ", " b ", " c ", " d"]
+        assert rules.hits == {'pipe': 2, 'spaced': 1}
+
+    def test_bad_pattern_names_the_rule(self):
+        with pytest.raises(re.error, match="broken"):
+            RuleSet({'broken': r'(unclosed'})
+
+    def test_user_rules_skip_invalid_patterns(self, capsys):
+        config = {'preprocess': {'noise': {'ok': r'^Confidential', 'bad': r'['}}}
+        assert user_rules(config, 'noise') == {'ok': r'^Confidential'}
+        assert "bad" in capsys.readouterr().err
+
+
+class TestConfiguredRules:
+    @pytest.fixture(autouse=True)
+    def rules(self):
+        config = {**DEFAULT_CONFIG, 'preprocess': {
+            'noise': {'disclaimer': r'^This e-?mail is confidential'},
+            'separators': {'double_colon': r'::'},
+        }}
+        SignaturePreprocessor.configure(config)
+        yield
+        SignaturePreprocessor.configure(DEFAULT_CONFIG)
+
+    def test_user_rules_apply(self):
+        text = "Jane Smith (she/her) :: CEO\nThis email is confidential and privileged."
+        assert SignaturePreprocessor.preprocess(text, locate=False) == ["Jane Smith", "CEO"]
+
+    def test_inline_flag_rules_apply(self):
+        config = {**DEFAULT_CONFIG, 'preprocess': {'noise': {'conf': r'(?i)^confidential.*'}}}
+        SignaturePreprocessor.configure(config)
+        assert SignaturePreprocessor.preprocess("Jane Smith\nCONFIDENTIAL", locate=False) == ["Jane Smith"]
+        assert SignaturePreprocessor.rule_hits()["noise.conf"] == 1
+
+    def test_rule_hits(self):
+        SignaturePreprocessor.preprocess("> quoted\nJane Smith (she/her) | CEO :: Acme", locate=False)
+        hits = SignaturePreprocessor.rule_hits()
+        assert hits["noise.quoted_reply"] == 1
+        assert hits["noise.disclaimer"] == 0
+        assert hits["separators.bullets"] == 1
+        assert hits["separators.double_colon"] == 1
+        assert hits["pronouns"] == 1
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Tests for contact records and the storage backends."""
+import pytest
+
+from jodie.cli.__main__ import run
+from jodie.cli.serve import parse_args
+from jodie.contact.backend import StorageError, configure_storage, open_backend
+from jodie.contact.memory import MemoryBackend
+from jodie.contact.record import HOMEPAGE, format_record, normalize_record
+from jodie.contact.sqlite import SQLiteBackend
+
+JANE = {'first_name': ' Jane ', 'last_name': 'Smith', 'email': 'Jane@Acme.io', 'phone': '(415) 555-1234',
+        'job_title': 'CEO', 'company': 'Acme', 'websites': ['https://acme.io', 'https://linkedin.com/in/jane']}
+
+
+def test_normalize_record_matches_contact_setters():
+    record = normalize_record(JANE)
+    assert record['first_name'] == 'Jane'
+    assert record['email'] == 'jane@acme.io'
+    assert record['phone'] == '4155551234'
+    assert record['websites'] == [{'url': 'https://acme.io', 'label': 'Work'},
+                                  {'url': 'https://linkedin.com/in/jane', 'label': 'LinkedIn'}]
+    assert normalize_record({'websites': 'https://example.org'})['websites'][0]['label'] == HOMEPAGE
+    assert format_record(record).startswith("Contact: Jane Smith, Email: jane@acme.io, Phone: 4155551234")
+
+
+def test_save_fetch_enumerate_delete(backend):
+    identifier = backend.save(JANE)
+    fetched = backend.fetch(identifier)
+    assert fetched == {'id': identifier, **normalize_record(JANE)}
+
+    report = backend.save_many([{'first_name': 'Bob', 'last_name': 'Lee', 'email': 'bob@globex.com'},
+                                {'first_name': 'Li', 'last_name': 'Wei', 'phone': '+44 20 7946 0958'}])
+    assert report.ok
+    others = [report.saved[0], report.saved[1]]
+    assert len(set(others)) == 2
+    assert [record['id'] for record in backend.contacts()] == [identifier, *others]
+
+    assert backend.delete(identifier)
+    assert not backend.delete(identifier)
+    assert backend.fetch(identifier) is None
+    assert len(list(backend.contacts())) == 2
+
+
+def test_invalid_contacts_are_reported_and_skipped(backend):
+    report = backend.save_many([{'first_name': 'Jane', 'email': 'jane@acme.io'}, JANE])
+    assert list(report.invalid) == [0] and "Missing required fields" in report.invalid[0]
+    assert list(report.saved) == [1] and not report.failed
+    assert [record['id'] for record in backend.contacts()] == [report.saved[1]]
+    with pytest.raises(ValueError, match="Missing required fields"):
+        backend.save({'first_name': 'Jane', 'email': 'jane@acme.io'})
+
+
+class FlakyBackend(MemoryBackend):
+    """Rejects any chunk containing a @flaky.example address."""
+
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+
+    def _write(self, records):
+        self.chunks.append(len(records))
+        if any((record['email'] or '').endswith('@flaky.example') for record in records):
+            raise StorageError("store unavailable")
+        return super()._write(records)
+
+
+def person(number, domain="acme.io"):
+    return {'first_name': 'Person', 'last_name': str(number), 'email': f"p{number}@{domain}"}
+
+
+def test_save_many_writes_in_chunks_and_reports_chunk_failures():
+    backend = FlakyBackend()
+    contacts = [person(n) for n in range(7)]
+    contacts[4] = person(4, domain="flaky.example")
+    contacts[5] = {'first_name': 'No', 'last_name': 'Contact'}
+
+    report = backend.save_many(contacts, chunk_size=3)
+    # Validation runs first, so chunks hold only valid contacts.
+    assert backend.chunks == [3, 3]
+    assert list(report.invalid) == [5]
+    assert [(failure.indices, failure.error) for failure in report.failed] == [([3, 4, 6], "store unavailable")]
+    assert sorted(report.saved) == [0, 1, 2]
+    assert not report.ok
+    with pytest.raises(StorageError, match="store unavailable"):
+        backend.save(person(9, domain="flaky.example"))
+    with pytest.raises(ValueError):
+        backend.save_many(contacts, chunk_size=0)
+
+
+def test_save_batch_reports_rows(capsys):
+    from jodie.cli.importer import save_batch
+
+    backend = FlakyBackend()
+    assert save_batch([(1, person(1)), (2, person(2))], backend) == (2, 0, 0)
+    assert save_batch([(3, person(3)), (4, person(4, domain="flaky.example"))], backend) == (0, 0, 2)
+    assert save_batch([(5, {'first_name': 'No', 'last_name': 'Contact'})], backend, label="Contact") == (0, 0, 1)
+    assert backend.chunks == [2, 2]
+    err = capsys.readouterr().err
+    assert "Rows 3-4: not saved, store unavailable" in err
+    assert "Contact 5: Missing required fields" in err
+
+
+def test_sqlite_persists_across_opens(tmp_path):
+    path = tmp_path / "nested" / "contacts.sqlite3"
+    with SQLiteBackend(path) as first:
+        identifier = first.save(JANE)
+    with SQLiteBackend(path) as second:
+        assert second.fetch(identifier)['email'] == 'jane@acme.io'
+
+
+def test_open_backend_from_config(tmp_path):
+    path = tmp_path / "contacts.sqlite3"
+    configure_storage({"storage": {"backend": "sqlite", "path": str(path)}})
+    backend = open_backend()
+    assert isinstance(backend, SQLiteBackend) and backend.path == str(path)
+    backend.close()
+
+    assert isinstance(open_backend("memory"), MemoryBackend)
+    with pytest.raises(StorageError, match="Unknown storage backend"):
+        open_backend("carrier-pigeon")
+
+
+def test_cli_saves_to_backend(capsys):
+    backend = MemoryBackend()
+    with pytest.raises(SystemExit) as exit_info:
+        run(parse_args(['new', 'Jane Smith', 'jane@acme.io', 'CEO']), backend=backend)
+    assert exit_info.value.code == 0
+    assert "Saving...\nContact: Jane Smith" in capsys.readouterr().out
+    assert [record['email'] for record in backend.contacts()] == ['jane@acme.io']
+
+    with pytest.raises(SystemExit) as exit_info:
+        run(parse_args(['new', 'jane@acme.io']), backend=backend)
+    assert exit_info.value.code == 1
+    assert "Missing required fields" in capsys.readouterr().err
+
+
+def test_contact_store_session_caches_setup():
+    pytest.importorskip("Contacts")
+    from jodie.contact.session import ContactStoreSession
+
+    with ContactStoreSession() as session:
+        store, authorization = session.store, session.authorization
+        assert session.fetch_keys and session.store is store
+        assert session.authorization == authorization
+    with pytest.raises(StorageError, match="closed"):
+        session.fetch("missing")